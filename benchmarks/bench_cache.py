@@ -0,0 +1,68 @@
+"""Compare on-disk formats for the remote cache: file size, write and load time.
+
+Formats: the pretty-printed JSON that save_json_list writes (what
+remote_conferences.json used to be), the one-row-per-line JSON array shards
+were written as before record files, and record files with each codec. Load
+is a full read of every row; "tail" reads only the last 1,000 rows, which
+record files reach by skipping whole blocks.
+
+Usage: python benchmarks/bench_cache.py [ROWS ...]   (default: 500000)
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from confradar import storage  # noqa: E402
+from synthetic import generate_rows  # noqa: E402
+
+TAIL = 1_000
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _write_json_lines(path: Path, rows) -> None:
+    path.write_text("[\n" + ",\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n]", encoding="utf-8")
+
+
+def main(sizes) -> None:
+    for n in sizes:
+        rows = list(generate_rows(n))
+        with tempfile.TemporaryDirectory() as work:
+            work = Path(work)
+            formats = {
+                "json (indent=2)": (work / "pretty.json", lambda p: storage.save_json_list(p, rows), storage.load_json_list, None),
+                "json (row per line)": (work / "lines.json", lambda p: _write_json_lines(p, rows), storage.load_json_list, None),
+            }
+            for codec in storage.COMPRESSIONS:
+                formats[f"records ({codec})"] = (
+                    work / f"{codec}.rec",
+                    lambda p, codec=codec: storage.write_records(p, rows, codec),
+                    lambda p: list(storage.iter_records(p)),
+                    lambda p: list(storage.iter_records(p, start=n - TAIL)),
+                )
+            print(f"rows={n:,}")
+            for label, (path, write, load, tail) in formats.items():
+                written = _best_of(lambda: write(path), repeat=1)
+                loaded = _best_of(lambda: load(path))
+                assert len(load(path)) == n
+                tailed = f"tail {_best_of(lambda: tail(path)) * 1000:8.1f} ms" if tail else ""
+                size = path.stat().st_size / 2**20
+                print(f"  {label:20} {size:8.1f} MB  write {written:6.2f} s  load {loaded:6.2f} s  {tailed}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [500_000])
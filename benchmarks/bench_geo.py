@@ -0,0 +1,62 @@
+"""Time --near radius queries: the ConferenceIndex geo grid against a linear scan.
+
+Rows are synthetic, but each gets a (city, country) pair drawn from the bundled
+city table so every row geocodes, as a catalog of real events mostly does.
+The index is built once (as load_index does at startup, outside the timing);
+the linear scan is filter_conferences over the plain list, which computes the
+distance of every row.
+
+Usage: python benchmarks/bench_geo.py [ROWS ...]   (default: 100000 1000000)
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from confradar import core, geo  # noqa: E402
+from synthetic import generate_rows  # noqa: E402
+
+QUERIES = [("Berlin", 50), ("Berlin", 300), ("San Francisco", 100), ("Portland, USA", 1000), ("Nairobi", 200), ("48.86,2.35", 2000)]
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _places():
+    text = (Path(geo.__file__).parent / "data" / "cities.tsv").read_text(encoding="utf-8")
+    return [tuple(line.split("\t")[:2]) for line in text.splitlines()[1:]]
+
+
+def main(sizes) -> None:
+    places = _places()
+    for n in sizes:
+        rng = random.Random(n)
+        rows = []
+        for row in generate_rows(n):
+            row["city"], row["country"] = rng.choice(places)
+            rows.append(row)
+        confs = [core.Conference(**row) for row in rows]
+        t0 = time.perf_counter()
+        index = core.ConferenceIndex(confs)
+        built = time.perf_counter() - t0
+        print(f"rows={n:,}  index build {built:.2f} s  ({len(index.conferences._places.values)} distinct places)")
+        for place, radius in QUERIES:
+            hits = len(index.query(near=place, radius_km=radius))
+            fast = _best_of(lambda: index.query(near=place, radius_km=radius))
+            slow = _best_of(lambda: core.filter_conferences(confs, near=place, radius_km=radius), repeat=1)
+            print(f"  near={place!r:18} radius={radius:>5} km  hits={hits:>8,}  index {fast * 1000:8.2f} ms  linear {slow * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,52 @@
+"""Compare linear filter_conferences scans with ConferenceIndex queries (topic, country, date windows).
+
+Usage: python benchmarks/bench_index.py [ROWS ...]   (default: 10000 100000 1000000)
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from confradar.core import ConferenceIndex, filter_conferences  # noqa: E402
+from synthetic import generate_conferences  # noqa: E402
+
+QUERIES = [
+    {"topic": "haskell"},
+    {"topic": "rustfest"},
+    {"country": "kenya"},
+    {"topic": "elixir", "country": "germany"},
+    {"topic": "python", "country": "jamaica"},
+    {"after": "2026-03-01", "before": "2026-03-31"},
+    {"topic": "python", "after": "2026-03-01", "before": "2026-03-31"},
+]
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(sizes) -> None:
+    for n in sizes:
+        confs = generate_conferences(n)
+        t0 = time.perf_counter()
+        index = ConferenceIndex(confs)
+        build = time.perf_counter() - t0
+        print(f"rows={n:>9,}  index build {build:7.2f} s")
+        for q in QUERIES:
+            linear = _best_of(lambda: filter_conferences(confs, **q))
+            indexed = _best_of(lambda: index.query(**q))
+            hits = len(index.query(**q))
+            print(f"  {str(q):62} hits={hits:>7,}  linear {linear * 1000:9.2f} ms  index {indexed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,57 @@
+"""Compare the memory held by a list of Conference objects with a ConferenceTable.
+
+Rows go through a JSON round trip first so every string is its own object,
+as it is when the catalog is read from disk. Each layout is measured with
+tracemalloc and reported in MB per 1M rows: the list of dataclass-style
+Conference objects the catalog used to be, the bare ConferenceTable columns,
+and the table once every row has been viewed (a ConferenceRow per row, the
+worst case after `list` or the TUI walked the whole catalog).
+
+Usage: python benchmarks/bench_memory.py [ROWS ...]   (default: 100000 1000000)
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from confradar.core import Conference, ConferenceTable  # noqa: E402
+from synthetic import generate_rows  # noqa: E402
+
+
+def _held() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main(sizes) -> None:
+    for n in sizes:
+        payload = json.dumps(list(generate_rows(n)))
+        tracemalloc.start()
+        base = _held()
+        rows = json.loads(payload)
+        confs = [Conference(**row) for row in rows]
+        del rows
+        as_list = _held() - base
+        table = ConferenceTable(confs)
+        del confs
+        as_table = _held() - base
+        views = list(table)
+        with_views = _held() - base
+        del views, table
+        tracemalloc.stop()
+        per_m = 1_000_000 / n / 2**20
+        print(
+            f"rows={n:>9,}  list[Conference] {as_list * per_m:8.1f} MB/1M  "
+            f"ConferenceTable {as_table * per_m:7.1f} MB/1M ({as_table / as_list:4.0%})  "
+            f"+ all row views {with_views * per_m:7.1f} MB/1M ({with_views / as_list:4.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
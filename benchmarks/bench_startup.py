@@ -0,0 +1,84 @@
+"""Measure CLI startup with `python -X importtime` and fail on regressions.
+
+Each command runs in a fresh interpreter against an empty data dir. The
+script reports the import time spent after interpreter startup (everything
+but `site`) and the wall time, and exits non-zero if a command imports one
+of the modules it should never need or its import time exceeds its budget.
+
+Usage: python benchmarks/bench_startup.py [--scale FACTOR] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set, Tuple
+
+# The HTTP and TUI stacks are only for `refresh` and `interactive`
+HEAVY = {"httpx", "httpcore", "readchar", "rich.live", "confradar.sources", "confradar.tui", "sqlite3"}
+
+# label: (arguments, modules it must not import, import-time budget in ms).
+# --help renders through Typer's Rich help formatter (rich.markdown,
+# pygments), which dominates its budget.
+COMMANDS: Dict[str, Tuple[List[str], Set[str], float]] = {
+    "--help": (["--help"], HEAVY, 400.0),
+    "list": (["list", "--topic", "python"], HEAVY, 200.0),
+    "show": (["show", "py"], HEAVY, 200.0),
+    "star": (["star", "Benchmark Conf"], HEAVY | {"confradar.core"}, 200.0),
+}
+
+
+def _run(args: List[str], env: dict) -> Tuple[float, float, Set[str]]:
+    """(import ms excluding site, wall ms, imported module names) for one invocation."""
+    cmd = [sys.executable, "-X", "importtime", "-m", "confradar.cli", *args]
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    wall = (time.perf_counter() - t0) * 1000
+    if proc.returncode != 0:
+        raise SystemExit(f"{' '.join(args)} failed:\n{proc.stdout}{proc.stderr}")
+    total_us = 0
+    modules: Set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        # Top-level entries (no indent) add up to the whole import tree
+        if not name.startswith("  ") and name.strip() != "site":
+            total_us += int(cumulative)
+    return total_us / 1000, wall, modules
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every import-time budget, for slow machines")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command; the best is reported")
+    opts = parser.parse_args(argv)
+
+    failed = False
+    with tempfile.TemporaryDirectory() as data_home:
+        # platformdirs resolves the data dir from XDG_DATA_HOME on Linux
+        env = {**os.environ, "XDG_DATA_HOME": data_home}
+        _run(["list"], env)  # compile the catalog snapshot once
+        for label, (args, forbidden, budget) in COMMANDS.items():
+            budget *= opts.scale
+            runs = [_run(args, env) for _ in range(opts.repeat)]
+            imports = min(r[0] for r in runs)
+            wall = min(r[1] for r in runs)
+            leaked = sorted(forbidden & runs[0][2])
+            status = "ok"
+            if leaked:
+                status = "imports " + ", ".join(leaked)
+            elif imports > budget:
+                status = f"over {budget:.0f} ms budget"
+            failed = failed or status != "ok"
+            print(f"{label:8}  imports {imports:7.1f} ms  wall {wall:7.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
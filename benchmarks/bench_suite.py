@@ -0,0 +1,185 @@
+"""End-to-end benchmarks over synthetic catalogs, written out as JSON.
+
+Covers core.load_conferences (snapshot rebuild and snapshot hit),
+core.dedupe_conferences, core.filter_conferences for every combination of
+topic/country/after/before (linear scan and ConferenceIndex),
+ConferenceIndex.search, cli.render_list, tui.render and
+sources.refresh_sources against a local HTTP server serving the catalog as
+large JSON payloads. Each size runs in its own throwaway data dir.
+
+Usage: python benchmarks/bench_suite.py [ROWS ...] [--output results.json] [--repeat N]
+       (default rows: 1000 100000 1000000)
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import itertools
+import json
+import platform
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from rich.console import Console  # noqa: E402
+
+import confradar  # noqa: E402
+from confradar import cli, core, sources, storage, tui  # noqa: E402
+from synthetic import generate_rows  # noqa: E402
+
+FILTER_VALUES = {"topic": "python", "country": "germany", "after": "2026-01-01", "before": "2026-06-30"}
+REFRESH_SOURCES = 4
+
+
+def _time(fn: Callable[[], object], repeat: int, setup: Callable[[], object] = lambda: None) -> dict:
+    times = []
+    for _ in range(repeat):
+        setup()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {"best_s": min(times), "mean_s": sum(times) / len(times), "repeat": repeat}
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+
+def _serve(directory: Path) -> ThreadingHTTPServer:
+    """Serve ``directory`` on a free localhost port; SimpleHTTPRequestHandler answers If-Modified-Since."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(directory)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_size(n: int, repeat: int, work: Path) -> List[dict]:
+    results: List[dict] = []
+
+    def record(name: str, timing: dict, **params) -> None:
+        results.append({"benchmark": name, "rows": n, "params": params, **timing})
+        label = " ".join(f"{k}={v}" for k, v in params.items())
+        print(f"rows={n:>9,}  {name:24} {label:44} best {timing['best_s'] * 1000:10.2f} ms")
+
+    data_dir = work / "data"
+    data_dir.mkdir()
+    storage.get_data_dir = lambda: data_dir
+    rows = list(generate_rows(n))
+
+    # -- core.load_conferences: the catalog lives in the remote cache
+    storage.save_remote_manifest([{"id": "synthetic"}])
+    storage.save_remote_shard("synthetic", rows)
+    snapshot = data_dir / "catalog.snapshot"
+    record("load_conferences", _time(core.load_conferences, repeat, setup=lambda: snapshot.unlink(missing_ok=True)), snapshot="cold")
+    core.load_conferences()
+    record("load_conferences", _time(core.load_conferences, repeat), snapshot="warm")
+
+    # -- core.dedupe_conferences: the catalog plus a second source relisting
+    # every tenth event under a variant name
+    relisted = [
+        core.Conference(**{**row, "name": row["name"].upper().replace(" #", " CONFERENCE #"), "url": ""})
+        for row in rows[::10]
+    ]
+    merged = core.load_conferences() + relisted
+    record("dedupe_conferences", _time(lambda: core.dedupe_conferences(merged), repeat), relisted=len(relisted))
+
+    # -- core.filter_conferences over every filter combination
+    confs = core.load_conferences()
+    index = core.load_index()
+    for k in range(len(FILTER_VALUES) + 1):
+        for keys in itertools.combinations(FILTER_VALUES, k):
+            query = {key: FILTER_VALUES[key] for key in keys}
+            hits = len(core.filter_conferences(index, **query))
+            record("filter_conferences", _time(lambda: core.filter_conferences(confs, **query), repeat), engine="linear", hits=hits, **query)
+            record("filter_conferences", _time(lambda: core.filter_conferences(index, **query), repeat), engine="index", hits=hits, **query)
+
+    # -- ConferenceIndex.search, as typed into the TUI's "/" mode
+    index.search("warm up the sorted names")
+    for query in ("py", "pycon", "kubcon", "pycn europ", "devopsdys"):
+        hits = len(index.search(query, limit=tui.SEARCH_LIMIT))
+        record("index.search", _time(lambda: index.search(query, limit=tui.SEARCH_LIMIT), repeat), query=query, hits=hits)
+
+    # -- Rendering, into an in-memory console of a typical terminal size
+    def console() -> Console:
+        return Console(file=io.StringIO(), width=160, height=50, force_terminal=True, color_system="truecolor")
+
+    matched = core.filter_conferences(index, **FILTER_VALUES)
+
+    def render_list() -> None:
+        cli.console = console()
+        cli.render_list(matched)
+
+    record("cli.render_list", _time(render_list, repeat), rows_rendered=len(matched))
+
+    def render_tui(state: tui.TuiState) -> None:
+        out = console()
+        out.print(tui.render(state, out))
+
+    state = tui.TuiState(conferences=index.conferences, index=index, starred=set())
+    record("tui.render", _time(lambda: render_tui(state), repeat), frame="first")
+    for _ in range(10):
+        state.cursor += 1
+        render_tui(state)
+    record("tui.render", _time(lambda: render_tui(state), repeat), frame="scrolled")
+    state.topic_filter = "python"
+    record("tui.render", _time(lambda: render_tui(state), repeat), frame="filtered")
+
+    # -- sources.refresh_sources against local HTTP sources
+    www = work / "www"
+    www.mkdir()
+    chunk = -(-n // REFRESH_SOURCES)
+    payload_bytes = 0
+    for i in range(REFRESH_SOURCES):
+        path = www / f"catalog-{i}.json"
+        path.write_text(json.dumps(rows[i * chunk:(i + 1) * chunk]), encoding="utf-8")
+        payload_bytes += path.stat().st_size
+    server = _serve(www)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        storage.save_sources([{"type": "json", "url": f"{base}/catalog-{i}.json"} for i in range(REFRESH_SOURCES)])
+
+        def clear_cache() -> None:
+            storage.save_remote_manifest([])
+
+        record("refresh_sources", _time(sources.refresh_sources, repeat, setup=clear_cache), cache="cold", payload_bytes=payload_bytes)
+        sources.refresh_sources()
+        record("refresh_sources", _time(sources.refresh_sources, repeat), cache="warm", payload_bytes=payload_bytes)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rows", nargs="*", type=int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark")
+    opts = parser.parse_args(argv)
+
+    results: List[dict] = []
+    for n in opts.rows:
+        with tempfile.TemporaryDirectory() as work:
+            results.extend(bench_size(n, opts.repeat, Path(work)))
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "confradar": confradar.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    opts.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"wrote {len(results)} results to {opts.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,52 @@
+"""Synthetic conference catalogs for benchmarks.
+
+Topic and country frequencies are skewed the way real catalogs are: a few
+topics (javascript, python, devops) and countries (USA, Germany, United
+Kingdom) dominate, with a long tail of rarer ones.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from typing import Iterator, List
+
+from confradar.core import Conference
+
+TOPICS = [
+    ("javascript", 20), ("python", 18), ("devops", 14), ("ai", 12), ("machine learning", 10),
+    ("data science", 8), ("cloud", 8), ("kubernetes", 6), ("security", 6), ("rust", 3),
+    ("golang", 3), ("ux", 2), ("android", 2), ("ios", 2), ("elixir", 1), ("haskell", 1),
+]
+COUNTRIES = [
+    ("USA", 30), ("Germany", 10), ("United Kingdom", 9), ("India", 7), ("France", 5), ("Online", 8),
+    ("Netherlands", 4), ("Spain", 4), ("Canada", 4), ("Brazil", 3), ("Japan", 3), ("Poland", 3),
+    ("Australia", 2), ("Sweden", 2), ("Jamaica", 1), ("Kenya", 1), ("Portugal", 2), ("Italy", 2),
+]
+CITIES = ["Berlin", "London", "San Francisco", "New York", "Bengaluru", "Paris", "Amsterdam", "Madrid", "Toronto", "Tokyo"]
+PREFIXES = ["PyCon", "JSConf", "KubeCon", "DevOpsDays", "AI Summit", "DataCon", "CloudNative", "RustFest", "SecCon", "UXLive"]
+SUFFIXES = ["Europe", "North America", "Asia", "Summit", "Days", "Meetup", "Forum", "Camp"]
+
+
+def generate_rows(n: int, *, seed: int = 0, start: date = date(2025, 1, 1)) -> Iterator[dict]:
+    """Yield ``n`` rows in the normalized storage schema."""
+    rng = random.Random(seed)
+    topic_names, topic_weights = zip(*TOPICS)
+    country_names, country_weights = zip(*COUNTRIES)
+    for i in range(n):
+        begin = start + timedelta(days=rng.randint(0, 3 * 365))
+        end = begin + timedelta(days=rng.choice((0, 1, 1, 2, 2, 3, 4)))
+        topics = sorted(set(rng.choices(topic_names, weights=topic_weights, k=rng.randint(1, 3))))
+        yield {
+            "name": f"{rng.choice(PREFIXES)} {rng.choice(SUFFIXES)} {begin.year} #{i}",
+            "start_date": begin.isoformat(),
+            "end_date": end.isoformat(),
+            "city": rng.choice(CITIES),
+            "country": rng.choices(country_names, weights=country_weights)[0],
+            "url": f"https://conf{i}.example.com/",
+            "topics": topics,
+        }
+
+
+def generate_conferences(n: int, *, seed: int = 0) -> List[Conference]:
+    return [Conference(**row) for row in generate_rows(n, seed=seed)]
@@ -1,61 +1,47 @@
 from __future__ import annotations
 
 import json
-from typing import List, Optional
+import os
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 import sys
 from importlib import resources
+from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich import box
 from .storage import (
-    load_user_conferences,
-    save_user_conferences,
-    load_stars,
-    save_stars,
+    BACKENDS,
+    add_star,
+    add_user_conference,
+    backend,
+    migrate_backend,
+    remove_star,
 )
-from .tui import run_tui
-from .core import Conference, load_conferences, filter_conferences
-from .sources import refresh_sources
 from .storage import load_sources, save_sources
+from .geo import DEFAULT_RADIUS_KM
+from . import timing
 
-app = typer.Typer(add_completion=False, help="Confradar - your radar for upcoming conferences")
-console = Console()
-
+if TYPE_CHECKING:
+    from .core import Conference
 
+# Commands import the heavy parts (core, sources/httpx, tui/readchar, rich
+# tables) themselves, so e.g. `confradar star` never loads the HTTP or TUI
+# stacks. benchmarks/bench_startup.py guards this.
 
-# --------------------------- Data model and IO ---------------------------
+app = typer.Typer(add_completion=False, help="Confradar - your radar for upcoming conferences")
+console = Console()
 
+LIST_FORMATS = ("table", "json", "jsonl", "csv", "tsv")
+_COLUMNS = ("name", "start_date", "end_date", "city", "country", "url", "topics")
 
-def filter_conferences(
-    items: Iterable[Conference],
-    *,
-    topic: Optional[str] = None,
-    country: Optional[str] = None,
-    after: Optional[str] = None,
-    before: Optional[str] = None,
-) -> List[Conference]:
-    result = list(items)
-    if topic:
-        t = topic.lower()
-        result = [c for c in result if any(t in s.lower() for s in c.topics) or t in c.name.lower()]
-    if country:
-        ctry = country.lower()
-        result = [c for c in result if ctry in c.country.lower()]
-    if after:
-        after_dt = datetime.fromisoformat(after)
-        result = [c for c in result if c.end_dt() >= after_dt]
-    if before:
-        before_dt = datetime.fromisoformat(before)
-        result = [c for c in result if c.start_dt() <= before_dt]
-    return sorted(result, key=lambda c: c.start_dt())
 
 
 # ------------------------------- Rendering -------------------------------
 def render_list(confs: List[Conference]) -> None:
+    from rich import box
+    from rich.table import Table
+
     table = Table(title="Upcoming Conferences", box=box.SIMPLE_HEAVY)
     table.add_column("Dates", style="cyan", no_wrap=True)
     table.add_column("Name", style="bold")
@@ -63,16 +49,89 @@ def render_list(confs: List[Conference]) -> None:
     table.add_column("Topics", style="green")
     table.add_column("URL", style="blue", overflow="fold")
 
+    with timing.span("cli.render_list", rows=len(confs)):
+        for c in confs:
+            date_str = f"{c.start_dt():%Y-%m-%d} → {c.end_dt():%Y-%m-%d}"
+            loc = f"{c.city}, {c.country}"
+            topics_str = ", ".join(c.topics)
+            table.add_row(date_str, c.name, loc, topics_str, c.url)
+
+        console.print(table)
+
+
+def iter_lines(confs: Iterable[Conference], fmt: str) -> Iterator[str]:
+    """Yield ``confs`` as lines of JSON, JSON Lines, CSV or TSV, one conference at a time.
+
+    JSON is an indented array for people to read and edit. CSV and TSV start
+    with a header row and join topics with ";".
+    """
+    if fmt == "json":
+        import textwrap
+
+        sep = "[\n"
+        for c in confs:
+            yield sep + textwrap.indent(json.dumps(c.to_dict(), indent=2, ensure_ascii=False), "  ")
+            sep = ",\n"
+        yield "[]\n" if sep == "[\n" else "\n]\n"
+        return
+    if fmt == "jsonl":
+        for c in confs:
+            yield json.dumps(c.to_dict(), ensure_ascii=False) + "\n"
+        return
+    import csv
+    import io
+
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n")
+    writer.writerow(_COLUMNS)
     for c in confs:
-        date_str = f"{c.start_dt():%Y-%m-%d} → {c.end_dt():%Y-%m-%d}"
-        loc = f"{c.city}, {c.country}"
-        topics_str = ", ".join(c.topics)
-        table.add_row(date_str, c.name, loc, topics_str, c.url)
+        writer.writerow([c.name, c.start_date, c.end_date, c.city, c.country, c.url, ";".join(c.topics)])
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    # Header only, when there are no rows
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def write_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout as they are produced, stopping quietly if the reader goes away."""
+    out = sys.stdout
+    try:
+        for line in lines:
+            out.write(line)
+        out.flush()
+    except BrokenPipeError:
+        # e.g. `confradar list --format jsonl | head`: point stdout at devnull
+        # so the interpreter's final flush does not raise again
+        try:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+        except (AttributeError, OSError, ValueError):
+            pass
+        raise typer.Exit(code=0)
+
 
-    console.print(table)
+def render_profile(spans: List[dict]) -> None:
+    """Print recorded timing spans as an indented breakdown on stderr."""
+    from rich.table import Table
+
+    table = Table(title="Profile", box=None, show_edge=False)
+    table.add_column("Stage", no_wrap=True)
+    table.add_column("ms", justify="right", style="cyan")
+    table.add_column("Details", style="dim", overflow="fold")
+    for s in spans:
+        details = ", ".join(
+            f"{k[:-2]}={v * 1000:.1f}ms" if k.endswith("_s") else f"{k}={v}"
+            for k, v in s.items()
+            if k not in ("name", "start", "seconds", "depth")
+        )
+        table.add_row("  " * s["depth"] + s["name"], f"{s['seconds'] * 1000:.1f}", details)
+    Console(stderr=True).print(table)
 
 
 def render_hero() -> None:
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "[bold white]Confradar[/] — your radar for upcoming [cyan]tech conferences[/]",
@@ -83,25 +142,109 @@ def render_hero() -> None:
 
 
 # --------------------------------- CLI ----------------------------------
+_SERVER_HELP = "Query a running `confradar serve` daemon at this URL instead of loading the catalog"
+
+
+def _from_server(call):
+    """Run ``call`` with the server module, turning daemon errors into a CLI error."""
+    from . import server
+
+    try:
+        return call(server)
+    except server.ServerError as exc:
+        console.print(f"[red]Server error:[/] {exc}")
+        raise typer.Exit(code=2)
+
+
+@app.callback()
+def cli_options(
+    ctx: typer.Context,
+    profile: bool = typer.Option(False, "--profile", help="Print a timing breakdown of the pipeline to stderr"),
+    profile_json: Optional[Path] = typer.Option(None, "--profile-json", help="Write the timing breakdown as JSON to this file"),
+    cprofile: Optional[Path] = typer.Option(None, "--cprofile", help="Run under cProfile and dump pstats data to this file"),
+) -> None:
+    if profile or profile_json:
+        timing.enable()
+
+        def report() -> None:
+            spans = timing.spans()
+            timing.disable()
+            if profile:
+                render_profile(spans)
+            if profile_json:
+                profile_json.write_text(json.dumps(spans, indent=2), encoding="utf-8")
+
+        ctx.call_on_close(report)
+    if cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump() -> None:
+            profiler.disable()
+            profiler.dump_stats(str(cprofile))
+
+        ctx.call_on_close(dump)
+
+
 @app.command("list")
 def cmd_list(
     topic: Optional[str] = typer.Option(None, "--topic", "-t", help="Filter by topic keyword"),
     country: Optional[str] = typer.Option(None, "--country", "-c", help="Filter by country"),
     after: Optional[str] = typer.Option(None, help="Include conferences ending on/after this ISO date (YYYY-MM-DD)"),
     before: Optional[str] = typer.Option(None, help="Include conferences starting on/before this ISO date (YYYY-MM-DD)"),
+    near: Optional[str] = typer.Option(None, help='Only conferences near this city ("Berlin", "Portland, USA") or "lat,lon"'),
+    radius_km: float = typer.Option(DEFAULT_RADIUS_KM, "--radius-km", min=0, help="Distance from --near, in km"),
+    fmt: str = typer.Option("table", "--format", "-f", help=f"Output format: {'|'.join(LIST_FORMATS)}"),
+    limit: Optional[int] = typer.Option(None, min=0, help="Show at most this many conferences"),
+    offset: int = typer.Option(0, min=0, help="Skip this many matching conferences first"),
+    server: Optional[str] = typer.Option(None, envvar="CONFRADAR_SERVER", help=_SERVER_HELP),
 ) -> None:
     """List upcoming conferences with optional filters."""
-    confs = filter_conferences(load_conferences(), topic=topic, country=country, after=after, before=before)
-    if not confs:
+    fmt = fmt.lower()
+    if fmt not in LIST_FORMATS:
+        console.print(f"[red]Unknown format.[/] Use {'|'.join(LIST_FORMATS)}.")
+        raise typer.Exit(2)
+    filters = {"topic": topic, "country": country, "after": after, "before": before}
+    if near:
+        filters.update(near=near, radius_km=radius_km)
+    if server:
+        # The daemon filters and pages; only the page crosses the socket
+        page = iter(_from_server(lambda s: s.query_server(server, limit=limit, offset=offset, **filters)))
+    else:
+        from .core import filter_conferences, open_catalog
+
+        try:
+            confs = filter_conferences(open_catalog(), **filters)
+        except ValueError as exc:
+            console.print(f"[red]{exc}[/]")
+            raise typer.Exit(2)
+        page = islice(confs, offset, None if limit is None else offset + limit)
+    if fmt != "table":
+        # Streamed row by row: no Rich layout pass, and nothing held back
+        write_lines(iter_lines(page, fmt))
+        return
+    page = list(page)
+    if not page:
         console.print("[yellow]No conferences matched your filters.[/]")
         raise typer.Exit(code=0)
-    render_list(confs)
+    render_list(page)
 
 
 @app.command("show")
-def cmd_show(name: str = typer.Argument(..., help="Exact or partial conference name")) -> None:
-    confs = load_conferences()
-    matches = [c for c in confs if name.lower() in c.name.lower()]
+def cmd_show(
+    name: str = typer.Argument(..., help="Conference name, or part of it; small typos are fine"),
+    limit: int = typer.Option(10, min=1, help="Show at most this many of the best matches"),
+    server: Optional[str] = typer.Option(None, envvar="CONFRADAR_SERVER", help=_SERVER_HELP),
+) -> None:
+    """Show details for the conferences best matching a name."""
+    if server:
+        matches = _from_server(lambda s: s.show_server(server, name, limit=limit))
+    else:
+        from .core import load_index
+
+        matches = [c for c, _ in load_index().search(name, limit=limit)]
     if not matches:
         console.print(f"[red]No conference found matching[/] '{name}'.")
         raise typer.Exit(code=1)
@@ -113,9 +256,27 @@ def cmd_show(name: str = typer.Argument(..., help="Exact or partial conference n
         console.print(f"[blue]URL:[/] {c.url}\n")
 
 
+@app.command("duplicates")
+def cmd_duplicates() -> None:
+    """List records merged as the same event across sources."""
+    from .core import merge_report
+
+    merges = merge_report()
+    if not merges:
+        console.print("[yellow]No duplicates merged.[/]")
+        return
+    for kept, absorbed in merges:
+        console.print(f"[bold]{kept.name}[/] [cyan]{kept.start_date} → {kept.end_date}[/] {kept.country}")
+        for c in absorbed:
+            console.print(f"  ← {c.name} [cyan]{c.start_date} → {c.end_date}[/] {c.country} [blue]{c.url}[/]")
+    console.print(f"{sum(len(a) for _, a in merges)} records merged into {len(merges)}.")
+
+
 @app.command("interactive")
 def cmd_interactive() -> None:
     """Launch an interactive TUI with keyboard navigation and stars."""
+    from .tui import run_tui
+
     run_tui(console)
 
 
@@ -130,47 +291,108 @@ def cmd_add(
     topics: str = typer.Option("", help="Comma-separated topics"),
 ) -> None:
     """Add a custom conference to your local library (persisted)."""
+    from .core import Conference
+
     topics_list = [t.strip() for t in topics.split(",") if t.strip()] or []
-    existing = load_user_conferences()
-    existing.append(
-        {
-            "name": name,
-            "start_date": start_date,
-            "end_date": end_date,
-            "city": city,
-            "country": country,
-            "url": url,
-            "topics": topics_list,
-        }
-    )
-    save_user_conferences(existing)
+    try:
+        conf = Conference(name, start_date, end_date, city, country, url, topics_list)
+    except ValueError as exc:
+        console.print(f"[red]Invalid dates:[/] {exc}")
+        raise typer.Exit(code=2)
+    # The snapshot fingerprints the journal, so the next read rebuilds it
+    add_user_conference(conf.to_dict())
     console.print("[green]Added.[/]")
 
 
 @app.command("star")
 def cmd_star(name: str = typer.Argument(..., help="Conference name to star")) -> None:
-    stars = load_stars()
-    stars.add(name)
-    save_stars(stars)
+    add_star(name)
     console.print(f"Starred [bold]{name}[/]")
 
 
 @app.command("unstar")
 def cmd_unstar(name: str = typer.Argument(..., help="Conference name to unstar")) -> None:
-    stars = load_stars()
-    if name in stars:
-        stars.remove(name)
-        save_stars(stars)
+    if remove_star(name):
         console.print(f"Unstarred [bold]{name}[/]")
     else:
         console.print(f"[yellow]{name} was not starred[/]")
 
 
 @app.command("refresh")
-def cmd_refresh() -> None:
+def cmd_refresh(
+    concurrency: Optional[int] = typer.Option(None, help="Maximum sources fetched at once [default: 8]"),
+    per_host: Optional[int] = typer.Option(None, help="Maximum concurrent requests to a single host [default: 4]"),
+    timeout: float = typer.Option(10.0, help="Per-source timeout in seconds"),
+    workers: int = typer.Option(1, help="Processes used to parse and normalize sources (1 = in-process)"),
+) -> None:
     """Refresh remote sources and update the local cache."""
-    count = refresh_sources()
-    console.print(f"[green]Fetched {count} conferences from sources.[/]")
+    from .core import rebuild_snapshot
+    from .sources import DEFAULT_CONCURRENCY, DEFAULT_PER_HOST, refresh_sources
+
+    summary = refresh_sources(
+        timeout,
+        concurrency=DEFAULT_CONCURRENCY if concurrency is None else concurrency,
+        per_host=DEFAULT_PER_HOST if per_host is None else per_host,
+        workers=workers,
+    )
+    rebuild_snapshot()
+    console.print(f"[green]Fetched {summary.count} conferences from sources.[/]")
+    console.print(
+        f"[dim]Cache: {summary.hits} hit(s), {summary.misses} miss(es), "
+        f"{summary.failed} failed, {summary.bytes_saved / 1024:.1f} KiB saved[/]"
+    )
+
+
+@app.command("serve")
+def cmd_serve(
+    host: str = typer.Option("127.0.0.1", help="Interface to listen on"),
+    port: int = typer.Option(8765, help="Port to listen on"),
+    poll: float = typer.Option(1.0, help="Seconds between checks for changed catalog inputs"),
+) -> None:
+    """Serve catalog queries over local HTTP, keeping the catalog in memory."""
+    import asyncio
+
+    from .server import CatalogServer
+
+    daemon = CatalogServer(host, port, poll_s=poll)
+
+    async def run() -> None:
+        await daemon.start()
+        console.print(
+            f"[green]Serving {len(daemon.index.conferences)} conferences on http://{daemon.host}:{daemon.port}[/] "
+            "[dim](Ctrl+C to stop)[/]"
+        )
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await daemon.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command("migrate")
+def cmd_migrate(
+    to: str = typer.Option("sqlite", "--to", help=f"Storage backend to switch to: {'|'.join(BACKENDS)}"),
+) -> None:
+    """Copy your conferences, stars, sources and remote cache into another storage backend."""
+    to = to.lower()
+    if to not in BACKENDS:
+        console.print(f"[red]Unknown backend.[/] Use {'|'.join(BACKENDS)}.")
+        raise typer.Exit(2)
+    if to == backend():
+        console.print(f"[yellow]Already using the {to} backend.[/]")
+        return
+    from .core import rebuild_snapshot
+
+    counts = migrate_backend(to)
+    rebuild_snapshot()
+    console.print(
+        f"[green]Migrated to {to}:[/] {counts['conferences']} conference(s), {counts['stars']} star(s), "
+        f"{counts['sources']} source(s), {counts['shards']} cached shard(s)."
+    )
 
 
 @app.command("sources")
@@ -1,48 +1,1033 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
-from dataclasses import dataclass
+import marshal
+import re
+import threading
+from abc import ABCMeta
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import chain
 from datetime import datetime
+from math import ceil
 from importlib import resources
-from typing import Iterable, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from .storage import load_user_conferences, load_remote_conferences
+from . import geo, timing
+from .geo import country_key
+from .storage import (
+    catalog_input_files,
+    load_catalog_snapshot,
+    load_remote_conferences,
+    load_user_conferences,
+    save_catalog_snapshot,
+    sqlite_store,
+)
 
+# Bump whenever the snapshot layout or the merge rules change.
+SNAPSHOT_VERSION = 9
+_FIELDS = ("name", "start_date", "end_date", "city", "country", "url", "topics")
 
-@dataclass
-class Conference:
-    name: str
-    start_date: str  # ISO date string
-    end_date: str  # ISO date string
-    city: str
-    country: str
-    url: str
-    topics: List[str]
+
+# Shared int objects for ordinals: a catalog spans a few thousand distinct
+# days, so rows reuse these instead of each holding its own pair of ints.
+_ORDINALS: Dict[int, int] = {}
+
+
+def _to_ordinal(value: str) -> int:
+    """Parse an ISO date (or datetime) string into a proleptic Gregorian ordinal."""
+    if not isinstance(value, str):
+        raise ValueError(f"expected an ISO date string, got {value!r}")
+    ordinal = datetime.fromisoformat(value).toordinal()
+    return _ORDINALS.setdefault(ordinal, ordinal)
+
+
+class Conference(metaclass=ABCMeta):
+    """A conference record whose dates are parsed once, at construction.
+
+    ``start_date``/``end_date`` keep the original ISO strings so records
+    round-trip through JSON unchanged; ``start_ord``/``end_ord`` hold the
+    parsed dates as ordinals for comparisons and sorting. ``lat``/``lon`` are
+    coordinates when a source supplied them or normalization geocoded the
+    city, else None; they are derived data, left out of equality and
+    ``to_dict``. Treat instances as immutable. Malformed dates, or an end
+    before the start, raise ValueError.
+
+    ConferenceRow, the catalog's row view, is registered as a virtual
+    subclass, so ``isinstance(row, Conference)`` holds for it too.
+    """
+
+    __slots__ = (
+        "name", "start_date", "end_date", "city", "country", "url", "topics", "start_ord", "end_ord", "lat", "lon"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        start_date: str,
+        end_date: str,
+        city: str,
+        country: str,
+        url: str,
+        topics: List[str],
+        *,
+        start_ord: Optional[int] = None,
+        end_ord: Optional[int] = None,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.start_date = start_date  # ISO date string
+        self.end_date = end_date  # ISO date string
+        self.city = city
+        self.country = country
+        self.url = url
+        self.topics = topics
+        self.start_ord = _to_ordinal(start_date) if start_ord is None else start_ord
+        self.end_ord = _to_ordinal(end_date) if end_ord is None else end_ord
+        self.lat = lat
+        self.lon = lon
+        if self.end_ord < self.start_ord:
+            raise ValueError(f"end_date {end_date!r} is before start_date {start_date!r}")
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, field) for field in _FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None  # mutable fields, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in _FIELDS)
+        return f"Conference({fields})"
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in _FIELDS}
 
     def start_dt(self) -> datetime:
-        return datetime.fromisoformat(self.start_date)
+        return datetime.fromordinal(self.start_ord)
 
     def end_dt(self) -> datetime:
-        return datetime.fromisoformat(self.end_date)
+        return datetime.fromordinal(self.end_ord)
+
+
+class _Strings:
+    """Interns strings (or other hashable values) to dense int ids."""
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.values: List[str] = list(values)
+        self.ids: Dict[str, int] = {v: i for i, v in enumerate(self.values)}
+
+    def id(self, value: str) -> int:
+        i = self.ids.get(value)
+        if i is None:
+            i = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+
+class ConferenceRow:
+    """A read-only view of one row of a ConferenceTable.
+
+    Behaves like the Conference it stands for (same attributes, ``to_dict``,
+    ``start_dt``/``end_dt`` and equality) but holds only its table and row
+    number; fields are read from the table's columns on access. ``topics``
+    returns a fresh list each time. It is registered as a virtual subclass
+    of Conference rather than inheriting from it, so a view carries no unused
+    field slots; unlike a Conference it cannot be modified.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "ConferenceTable", row: int) -> None:
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._table._names[self._row]
+
+    @property
+    def start_date(self) -> str:
+        t = self._table
+        return t._dates.values[t._start_dates[self._row]]
+
+    @property
+    def end_date(self) -> str:
+        t = self._table
+        return t._dates.values[t._end_dates[self._row]]
+
+    @property
+    def city(self) -> str:
+        t = self._table
+        return t._cities.values[t._city_ids[self._row]]
+
+    @property
+    def country(self) -> str:
+        t = self._table
+        return t._countries.values[t._country_ids[self._row]]
+
+    @property
+    def url(self) -> str:
+        return self._table._urls[self._row]
+
+    @property
+    def topics(self) -> List[str]:
+        t = self._table
+        values = t._topics.values
+        return [values[v] for v in t._topic_ids[t._topic_offsets[self._row] : t._topic_offsets[self._row + 1]]]
+
+    @property
+    def start_ord(self) -> int:
+        return self._table._start_ords[self._row]
+
+    @property
+    def end_ord(self) -> int:
+        return self._table._end_ords[self._row]
+
+    @property
+    def lat(self) -> Optional[float]:
+        t = self._table
+        place = t._place_ids[self._row]
+        return None if place < 0 else t._places.values[place][0]
+
+    @property
+    def lon(self) -> Optional[float]:
+        t = self._table
+        place = t._place_ids[self._row]
+        return None if place < 0 else t._places.values[place][1]
+
+    _values = Conference._values
+    to_dict = Conference.to_dict
+    start_dt = Conference.start_dt
+    end_dt = Conference.end_dt
+    __repr__ = Conference.__repr__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Conference):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+
+Conference.register(ConferenceRow)
+
+
+class ConferenceTable:
+    """The catalog as columns: a compact, read-only sequence of conferences.
+
+    Names and URLs, which are nearly all distinct, are kept as lists of
+    strings. Dates, cities, countries and topics are interned: each distinct
+    string is stored once and rows hold its int id in an ``array`` column,
+    next to the start/end ordinals. A row's topics are the ids in
+    ``_topic_ids[_topic_offsets[row]:_topic_offsets[row + 1]]``. Coordinates
+    are interned the same way as (lat, lon) places; rows without them have
+    place id -1. Rows that carry no coordinates are geocoded from their city
+    and country here.
+
+    Indexing yields ConferenceRow views. A row's view is created on first
+    access and then reused, so the same row is always the same object (the
+    TUI keys caches on identity).
+    """
+
+    def __init__(self, conferences: Iterable[Conference] = ()) -> None:
+        self._names: List[str] = []
+        self._urls: List[str] = []
+        self._dates, self._cities, self._countries, self._topics = _Strings(), _Strings(), _Strings(), _Strings()
+        self._start_dates, self._end_dates, self._city_ids, self._country_ids = (array("I") for _ in range(4))
+        self._start_ords, self._end_ords = array("i"), array("i")
+        self._topic_offsets, self._topic_ids = array("I", [0]), array("I")
+        self._places, self._place_ids = _Strings(), array("i")
+        located: Dict[Tuple[str, str], int] = {}
+        for c in conferences:
+            self._names.append(c.name)
+            self._urls.append(c.url)
+            self._start_dates.append(self._dates.id(c.start_date))
+            self._end_dates.append(self._dates.id(c.end_date))
+            self._city_ids.append(self._cities.id(c.city))
+            self._country_ids.append(self._countries.id(c.country))
+            self._start_ords.append(c.start_ord)
+            self._end_ords.append(c.end_ord)
+            self._topic_ids.extend(self._topics.id(t) for t in c.topics)
+            self._topic_offsets.append(len(self._topic_ids))
+            point = geo.parse_point(c.lat, c.lon) if c.lat is not None else None
+            if point is not None:
+                self._place_ids.append(self._places.id(point))
+                continue
+            place = located.get((c.city, c.country))
+            if place is None:
+                point = geo.geocode(c.city, c.country)
+                place = located[c.city, c.country] = -1 if point is None else self._places.id(point)
+            self._place_ids.append(place)
+        self._views: List[Optional[ConferenceRow]] = [None] * len(self._names)
+        self._lock = threading.Lock()
+
+    _STRINGS = ("dates", "cities", "countries", "topics", "places")
+    # Column name -> array typecode
+    _ARRAYS = {
+        "start_dates": "I", "end_dates": "I", "city_ids": "I", "country_ids": "I",
+        "start_ords": "i", "end_ords": "i", "topic_offsets": "I", "topic_ids": "I", "place_ids": "i",
+    }
+
+    def to_state(self) -> dict:
+        """Columns as lists and raw bytes, for storing in the catalog snapshot."""
+        state = {"names": self._names, "urls": self._urls}
+        state.update({part: getattr(self, f"_{part}").values for part in self._STRINGS})
+        state.update({part: bytes(getattr(self, f"_{part}")) for part in self._ARRAYS})
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ConferenceTable":
+        """A table over snapshot columns; the int columns are used in place through memoryviews."""
+        table = cls.__new__(cls)
+        table._names, table._urls = state["names"], state["urls"]
+        for part in cls._STRINGS:
+            setattr(table, f"_{part}", _Strings(state[part]))
+        for part, typecode in cls._ARRAYS.items():
+            setattr(table, f"_{part}", memoryview(state[part]).cast(typecode))
+        table._views = [None] * len(table._names)
+        table._lock = threading.Lock()
+        return table
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._names)))]
+        view = self._views[index]
+        if view is None:
+            with self._lock:
+                view = self._views[index]
+                if view is None:
+                    view = self._views[index] = ConferenceRow(self, index % len(self._names))
+        return view
+
+    def __iter__(self) -> Iterator[ConferenceRow]:
+        for i in range(len(self._names)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (ConferenceTable, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<ConferenceTable of {len(self)} conferences>"
+
+
+def _bundled_path() -> Path:
+    return Path(str(resources.files("confradar.data").joinpath("conferences.json")))
+
+
+def _file_hash(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _fingerprint_inputs() -> List[list]:
+    """(path, mtime_ns, size) for every catalog input that currently exists."""
+    out: List[list] = []
+    for path in [_bundled_path(), *catalog_input_files()]:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        out.append([str(path), st.st_mtime_ns, st.st_size])
+    return out
+
+
+def catalog_fingerprint() -> List[list]:
+    """Cheap (path, mtime, size) stamp of every catalog input; changes when one is written."""
+    return _fingerprint_inputs()
+
+
+def _snapshot_is_fresh(snap: dict) -> bool:
+    if snap.get("version") != SNAPSHOT_VERSION or snap.get("marshal") != marshal.version:
+        return False
+    recorded = snap.get("inputs") or []
+    current = _fingerprint_inputs()
+    if [r[0] for r in recorded] != [c[0] for c in current]:
+        return False
+    for (path, mtime, size, digest), (_, cur_mtime, cur_size) in zip(recorded, current):
+        if size != cur_size:
+            return False
+        # A touched but otherwise identical file keeps the snapshot valid
+        if mtime != cur_mtime and _file_hash(Path(path)) != digest:
+            return False
+    return True
+
+
+# ------------------------- Cross-source deduplication -------------------------
+
+# Two records describe the same event when their dates overlap, their
+# countries agree (see geo.country_key) and their names are near-equal: the
+# Jaccard similarity of their words is at least NAME_SIMILARITY and they share
+# at least MIN_SHARED_WORDS words (fewer only if a name has fewer). Adding a
+# word to a name of up to three words ("AI Summit" / "Cloud AI Summit") stays
+# below it. The same event URL lowers the bar to URL_NAME_SIMILARITY; a
+# shared host alone does not, since aggregators host many different events.
+NAME_SIMILARITY = 0.8
+URL_NAME_SIMILARITY = 0.5
+MIN_SHARED_WORDS = 2
+# Blocks up to this size are compared pairwise rather than by date bucket
+SMALL_BLOCK = 8
+
+_WORD = re.compile(r"[^\W_]+")
+# Filler words say nothing about which event a name refers to
+_SKIP_WORDS = frozenset({"the", "and", "of", "on", "for", "in", "conf", "conference", "annual", "international"})
+
+
+def _name_tokens(name: str, year: str = "") -> Tuple[str, ...]:
+    """Distinct words of a name, minus filler words and the event's own ``year``.
+
+    Other numbers stay: "PyCon 2030" held in 2031 is not a year label.
+    """
+    words = _WORD.findall(name.lower())
+    if year in words or not _SKIP_WORDS.isdisjoint(words):
+        words = [w for w in words if w not in _SKIP_WORDS and w != year]
+    return tuple(dict.fromkeys(words))
+
+
+def _url_key(url: str) -> str:
+    """``url`` without scheme, port, fragment, "www." or a trailing slash; "" if not absolute."""
+    parts = url.partition("#")[0].split("/", 3)
+    if len(parts) < 3 or not parts[0].endswith(":") or parts[1]:
+        return ""
+    netloc, sep, query = parts[2].partition("?")
+    host = netloc.rpartition("@")[2].partition(":")[0].lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts[3] if len(parts) > 3 else sep + query
+    return f"{host}/{path}".rstrip("/").lower()
+
+
+def _duplicate_groups(confs: List[Conference]) -> List[List[int]]:
+    """Index groups of records that describe the same event, lowest index first.
+
+    List order is merge priority. Records with the same lowercased name and
+    dates always group together, as the exact-key dedupe before this did.
+    Beyond that, only records in the same country whose dates overlap and
+    that share a blocking key are compared. Blocking keys are event URLs, and
+    name tokens from the rarest few tokens of a name (prefix filtering: a
+    pair over NAME_SIMILARITY always shares one). Records are bucketed by
+    (token, country, week) for every week they span, so overlapping records
+    always meet in some bucket, and tokens used by a single record never
+    form a block. Most records of a large catalog are never compared at all.
+    """
+    n = len(confs)
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            # The root is always the highest-priority record of its group
+            parent[max(ri, rj)] = min(ri, rj)
+
+    exact: Dict[tuple, int] = {}
+    firsts: List[int] = []
+    tokens: List[Tuple[str, ...]] = [()] * n
+    urls: List[str] = [""] * n
+    for i, c in enumerate(confs):
+        j = exact.setdefault((c.name.lower(), c.start_date, c.end_date), i)
+        if j != i:
+            union(j, i)
+            continue
+        firsts.append(i)
+        tokens[i] = _name_tokens(c.name, str(datetime.fromordinal(c.start_ord).year))
+        if c.url:
+            urls[i] = _url_key(c.url)
+    key_ids: Dict[str, int] = {}
+    country_ids = {country: key_ids.setdefault(country_key(country), len(key_ids)) for country in {c.country for c in confs}}
+    # A record's date buckets: (country, week) for every week it spans, packed
+    # into one int. Records whose dates overlap share at least one.
+    countries = [0] * n
+    buckets = [()] * n
+    for i in firsts:
+        c = confs[i]
+        countries[i] = country_ids[c.country]
+        base = countries[i] << 20
+        buckets[i] = range(base | c.start_ord // 7, (base | c.end_ord // 7) + 1)
+
+    def similar(i: int, j: int, threshold: float) -> bool:
+        a, b = tokens[i], tokens[j]
+        if not a or not b:
+            return False
+        shared = len(set(a).intersection(b))
+        return shared >= min(MIN_SHARED_WORDS, len(a), len(b)) and shared >= threshold * (len(a) + len(b) - shared) - 1e-9
+
+    def candidates(probes: Dict[str, List[int]], keys: Callable[[int], Iterable[str]]) -> Iterator[Tuple[int, int]]:
+        """(i, j) for each record i probing key k and each j holding k in one of i's date buckets."""
+        wanted = {k: {b for i in ids for b in buckets[i]} for k, ids in probes.items()}
+        blocks: Dict[tuple, List[int]] = {}
+        for j in firsts:
+            held = [k for k in keys(j) if k in wanted]
+            for k in held:
+                for b in wanted[k].intersection(buckets[j]):
+                    blocks.setdefault((k, b), []).append(j)
+        for k, ids in probes.items():
+            for i in ids:
+                for b in buckets[i]:
+                    for j in blocks[(k, b)]:
+                        if j != i:
+                            yield i, j
+
+    def matches(pairs: Iterable[Tuple[int, int]], threshold: float) -> None:
+        for i, j in pairs:
+            a, b = confs[i], confs[j]
+            if (
+                a.start_ord <= b.end_ord
+                and b.start_ord <= a.end_ord
+                and countries[i] == countries[j]
+                and find(i) != find(j)
+                and similar(i, j, threshold)
+            ):
+                union(i, j)
+
+    # Every record must rank shared tokens the same way: rarest first, then by text
+    frequency = Counter(chain.from_iterable(tokens))
+    shared = sorted((t for t, k in frequency.items() if k > 1), key=lambda t: (frequency[t], t))
+    rank = {t: r for r, t in enumerate(shared)}
+    # A pair over NAME_SIMILARITY shares at least that fraction of either
+    # name, so the prefixes of both names (their rarest len - shared + 1
+    # tokens) intersect: records need only probe and hold their prefix
+    prefix: List[Tuple[str, ...]] = [()] * n
+    prefixes: Dict[str, List[int]] = {}
+    for i in firsts:
+        toks = tokens[i]
+        common = [t for t in toks if t in rank]
+        # Tokens of this record alone rank first and fill part of the prefix
+        keep = len(common) - ceil(NAME_SIMILARITY * len(toks) - 1e-9) + 1
+        if keep > 0:
+            prefix[i] = tuple(sorted(common, key=rank.__getitem__)[:keep])
+            for t in prefix[i]:
+                prefixes.setdefault(t, []).append(i)
+    # A few records sharing a prefix token (typically the listings of one
+    # event) need no buckets: compare them directly
+    small = {t: ids for t, ids in prefixes.items() if len(ids) <= SMALL_BLOCK}
+    matches(((i, j) for ids in small.values() for k, i in enumerate(ids) for j in ids[:k]), NAME_SIMILARITY)
+    large = {t: ids for t, ids in prefixes.items() if t not in small}
+    if large:
+        matches(candidates(large, prefix.__getitem__), NAME_SIMILARITY)
+
+    by_url: Dict[str, List[int]] = {url: [] for url, count in Counter(urls).items() if count > 1 and url}
+    if by_url:
+        for i in firsts:
+            if urls[i] in by_url:
+                by_url[urls[i]].append(i)
+        matches(candidates(by_url, lambda i: (urls[i],)), URL_NAME_SIMILARITY)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(n):
+        root = find(i)
+        if root != i:
+            groups.setdefault(root, [root]).append(i)
+    return [groups[root] for root in sorted(groups)]
+
+
+def _merge_group(records: List[Conference]) -> Conference:
+    """The first record, with every record's topics and any city, URL or coordinates it lacks."""
+    kept = records[0]
+    topics: Dict[str, str] = {}
+    for c in records:
+        for t in c.topics:
+            topics.setdefault(t.lower(), t)
+    city = next((c.city for c in records if c.city), kept.city)
+    url = next((c.url for c in records if c.url), kept.url)
+    located = next((c for c in records if c.lat is not None), kept)
+    return Conference(
+        kept.name, kept.start_date, kept.end_date, city, kept.country, url, list(topics.values()),
+        start_ord=kept.start_ord, end_ord=kept.end_ord, lat=located.lat, lon=located.lon,
+    )
+
+
+def dedupe_conferences(confs: List[Conference]) -> Tuple[List[Conference], List[Tuple[Conference, List[Conference]]]]:
+    """Merge records that describe the same event; list order is merge priority.
+
+    Returns the surviving records, in input order, and one
+    ``(merged record, absorbed records)`` pair per merge.
+    """
+    merges: List[Tuple[Conference, List[Conference]]] = []
+    dropped: Set[int] = set()
+    replaced: Dict[int, Conference] = {}
+    for group in _duplicate_groups(confs):
+        merged = _merge_group([confs[i] for i in group])
+        replaced[group[0]] = merged
+        dropped.update(group[1:])
+        merges.append((merged, [confs[i] for i in group[1:]]))
+    unique = [replaced.get(i, c) for i, c in enumerate(confs) if i not in dropped]
+    return unique, merges
+
+
+def _merge_sources() -> Tuple[List[Conference], List[Tuple[Conference, List[Conference]]]]:
+    """Merge bundled, user and remote rows, dedupe them and sort by start date.
+
+    Rows with missing fields or malformed dates are rejected here rather than
+    failing later in a filter or sort. Returns the catalog and its merges (see
+    dedupe_conferences).
+    """
+    with timing.span("core.read_inputs") as span:
+        with _bundled_path().open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        data.extend(load_user_conferences())
+        data.extend(load_remote_conferences())
+        span.set(rows=len(data))
+    with timing.span("core.dedupe") as span:
+        valid: List[Conference] = []
+        for row in data:
+            try:
+                valid.append(Conference(**row))
+            except (TypeError, ValueError):
+                continue
+        unique, merges = dedupe_conferences(valid)
+        unique.sort(key=lambda c: c.start_ord)
+        span.set(rows=len(unique), merged=sum(len(absorbed) for _, absorbed in merges))
+    return unique, merges
+
+
+def rebuild_snapshot() -> List[Conference]:
+    """Merge all inputs from scratch and persist them as a compiled snapshot.
+
+    The snapshot is marshal-encoded: the columns of the deduped catalog's
+    ConferenceTable, sorted by start date, the posting lists of its
+    ConferenceIndex and the merge report (see dedupe_conferences). Input
+    files are fingerprinted by path, mtime, size and hash before they are
+    read, so a concurrent write simply invalidates it.
+    """
+    return list(_rebuild()[0])
+
+
+def _rebuild() -> Tuple[ConferenceTable, ConferenceIndex, list]:
+    with timing.span("core.rebuild_snapshot"):
+        inputs = [[*fp, _file_hash(Path(fp[0]))] for fp in _fingerprint_inputs()]
+        merged, merges = _merge_sources()
+        report = [[kept.to_dict(), [c.to_dict() for c in absorbed]] for kept, absorbed in merges]
+        with timing.span("core.index_build", rows=len(merged)):
+            index = ConferenceIndex(merged)
+        del merged
+        with timing.span("core.save_snapshot"):
+            try:
+                save_catalog_snapshot(
+                    {
+                        "version": SNAPSHOT_VERSION,
+                        "marshal": marshal.version,
+                        "inputs": inputs,
+                        "table": index.conferences.to_state(),
+                        "index": index.to_state(),
+                        "merges": report,
+                    }
+                )
+            except OSError:
+                pass
+    return index.conferences, index, report
+
+
+def _load_catalog() -> Tuple[ConferenceTable, ConferenceIndex]:
+    with timing.span("core.load_catalog") as span:
+        with timing.span("core.load_snapshot"):
+            snap = load_catalog_snapshot()
+            fresh = snap is not None and _snapshot_is_fresh(snap)
+        span.set(snapshot="hit" if fresh else "miss")
+        if not fresh:
+            return _rebuild()[:2]
+        table = ConferenceTable.from_state(snap["table"])
+        span.set(rows=len(table))
+        return table, ConferenceIndex(table, state=snap["index"])
 
 
 def load_conferences() -> List[Conference]:
-    """Load bundled sample conferences and merge with user-added items."""
-    with resources.files("confradar.data").joinpath("conferences.json").open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    data.extend(load_user_conferences())
-    data.extend(load_remote_conferences())
-    confs = [Conference(**row) for row in data]
-    # Deduplicate by (name, start_date, end_date)
-    seen = set()
-    unique: List[Conference] = []
+    """Load bundled sample conferences merged with user-added and remote items.
+
+    Served from the compiled snapshot when its inputs are unchanged, otherwise
+    rebuilt. Results are deduped and ordered by start date. The items are
+    ConferenceRow views over the catalog's ConferenceTable.
+    """
+    return list(_load_catalog()[0])
+
+
+def load_index() -> ConferenceIndex:
+    """Load the catalog together with its prebuilt query index."""
+    return _load_catalog()[1]
+
+
+def merge_report() -> List[Tuple[Conference, List[Conference]]]:
+    """The catalog's cross-source merges: (merged record, records it absorbed)."""
+    snap = load_catalog_snapshot()
+    report = snap["merges"] if snap is not None and _snapshot_is_fresh(snap) else _rebuild()[2]
+    return [(Conference(**kept), [Conference(**c) for c in absorbed]) for kept, absorbed in report]
+
+
+def open_catalog():
+    """A queryable catalog for filter_conferences.
+
+    On the SQLite backend this is a SqlCatalog, which answers queries in the
+    database without loading the catalog; otherwise the ConferenceIndex.
+    """
+    store = sqlite_store()
+    if store is None:
+        return load_index()
+    path = _bundled_path()
+    with path.open("r", encoding="utf-8") as f:
+        bundled = json.load(f)
+    store.sync_bundled(bundled, _file_hash(path))
+    # Stored merges are also stale once the merge rules change
+    stamp = json.dumps([SNAPSHOT_VERSION, _fingerprint_inputs()])
+    if store.merges_stamp() != stamp:
+        # The fuzzy dedupe cannot run in SQL; compute it once per catalog
+        # change and let queries join against the stored result
+        ids, rows = store.catalog_rows()
+        confs = [Conference(**json.loads(data), start_ord=start, end_ord=end) for data, start, end in rows]
+        groups = _duplicate_groups(confs)
+        store.save_merges(
+            stamp,
+            [(ids[g[0]], _merge_group([confs[i] for i in g]).to_dict()) for g in groups],
+            [ids[i] for g in groups for i in g[1:]],
+        )
+    return SqlCatalog(store)
+
+
+# --------------------------------- Index ---------------------------------
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _postings(groups: Dict[Any, List[int]]) -> Dict[Any, array]:
+    return {key: array("I", ids) for key, ids in groups.items()}
+
+
+class ConferenceIndex:
+    """Inverted index answering filter_conferences queries without full scans.
+
+    Conferences are held in start-date order and referred to by position.
+    Distinct lowercased topic strings and countries map to posting lists of
+    positions; a substring query scans only those (small) vocabularies and
+    unions the matching postings. Names are indexed by trigram: a query of
+    three or more characters checks only the rows in its rarest trigram's
+    posting list. Every candidate is verified with the same substring test
+    filter_conferences uses, so results are identical.
+
+    Date windows use three ordinal arrays aligned with that order: start
+    dates (sorted, so ``before`` is a bisect), end dates, and the running
+    maximum of end dates. Rows before the first position whose running
+    maximum reaches ``after`` cannot match, and since no conference ends
+    before it starts, rows starting on or after ``after`` always match; only
+    the rows in between need their end date checked. A window therefore costs
+    O(log n + k) and results come back in start order without sorting.
+
+    ``near`` queries look up the distinct places (coordinates interned by the
+    table) within the radius in a geo.GeoGrid, built at load time over those
+    few places, and union the places' posting lists.
+    """
+
+    def __init__(self, conferences: Iterable[Conference], *, state: Optional[dict] = None) -> None:
+        if state is None:
+            self.conferences = ConferenceTable(sorted(conferences, key=lambda c: c.start_ord))
+        elif isinstance(conferences, ConferenceTable):
+            self.conferences = conferences
+        else:
+            self.conferences = ConferenceTable(conferences)
+        table = self.conferences
+        # Lowercased vocabularies, by the table's interned ids
+        self._topic_keys = [t.lower() for t in table._topics.values]
+        self._country_keys = [c.lower() for c in table._countries.values]
+        self._names = [name.lower() for name in table._names]
+        self._starts, self._ends = table._start_ords, table._end_ords
+        if state is None:
+            self._build()
+        else:
+            # Snapshot postings are used in place through memoryviews
+            self._topics, self._countries, self._grams, self._place_rows = (
+                {key: memoryview(raw).cast("I") for key, raw in state[part].items()}
+                for part in ("topics", "countries", "grams", "places")
+            )
+            self._max_end = memoryview(state["max_end"]).cast("i")
+        self._grid = geo.GeoGrid(table._places.values)
+        self._by_name: Optional[Tuple[List[int], List[str]]] = None  # built by the first search
+
+    def __len__(self) -> int:
+        return len(self.conferences)
+
+    def _build(self) -> None:
+        topics: Dict[str, List[int]] = {}
+        countries: Dict[str, List[int]] = {}
+        grams: Dict[str, List[int]] = {}
+        places: Dict[int, List[int]] = {}
+        table = self.conferences
+        offsets, topic_ids, topic_keys = table._topic_offsets, table._topic_ids, self._topic_keys
+        for i, (name, country, place) in enumerate(zip(self._names, table._country_ids, table._place_ids)):
+            for t in {topic_keys[v] for v in topic_ids[offsets[i] : offsets[i + 1]]}:
+                topics.setdefault(t, []).append(i)
+            countries.setdefault(self._country_keys[country], []).append(i)
+            for g in _trigrams(name):
+                grams.setdefault(g, []).append(i)
+            if place >= 0:
+                places.setdefault(place, []).append(i)
+        self._topics = _postings(topics)
+        self._countries = _postings(countries)
+        self._grams = _postings(grams)
+        self._place_rows = _postings(places)
+        self._max_end = array("i")
+        running = 0
+        for end in self._ends:
+            running = max(running, end)
+            self._max_end.append(running)
+
+    def to_state(self) -> dict:
+        """Posting lists and the running end-date maximum as raw bytes, for the catalog snapshot.
+
+        Start and end dates come from the table, which the snapshot stores too.
+        """
+        state = {
+            part: {key: bytes(ids) for key, ids in postings.items()}
+            for part, postings in (
+                ("topics", self._topics), ("countries", self._countries), ("grams", self._grams), ("places", self._place_rows)
+            )
+        }
+        state.update(max_end=bytes(self._max_end))
+        return state
+
+    def _date_window(self, after_ord: Optional[int], before_ord: Optional[int]) -> Tuple[int, int, int]:
+        """(lo, split, hi): rows in [lo, split) need an end-date check, rows in [split, hi) match."""
+        hi = len(self.conferences) if before_ord is None else bisect_right(self._starts, before_ord)
+        if after_ord is None:
+            return 0, 0, hi
+        lo = min(bisect_left(self._max_end, after_ord), hi)
+        split = min(max(lo, bisect_left(self._starts, after_ord)), hi)
+        return lo, split, hi
+
+    def _name_ids(self, needle: str) -> List[int]:
+        names = self._names
+        if len(needle) < 3:
+            return [i for i, name in enumerate(names) if needle in name]
+        postings = [self._grams.get(g) for g in _trigrams(needle)]
+        if any(p is None for p in postings):
+            return []
+        rarest = min(postings, key=len)
+        return [i for i in rarest if needle in names[i]]
+
+    def search(self, text: str, limit: int = 20, min_score: float = 0.5) -> List[Tuple[Conference, float]]:
+        """Conferences whose name best matches ``text``, with their scores, best first.
+
+        A name's score is the fraction of the query's trigrams it contains,
+        so a typo still matches ("kubcon" finds KubeCon) and any substring
+        scores 1.0. Ties go to names starting with the query, then to names
+        closer to the query's length. Names are tried by prefix first (a
+        bisect over the sorted names), which answers most as-you-type
+        queries without touching the trigram postings. Queries under three
+        characters match by prefix and substring only. If names leave room
+        under ``limit``, conferences with a matching topic fill it.
+        """
+        q = " ".join(text.lower().split())
+        if not q or limit <= 0:
+            return []
+        names = self._names
+        # id -> (score, is_prefix, closeness); higher is better
+        scored: Dict[int, Tuple[float, int, float]] = {}
+        for i in self._prefix_ids(q, limit):
+            scored[i] = (1.0, 1, len(q) / len(names[i]))
+        if len(scored) < limit:
+            if len(q) < 3:
+                for i, name in enumerate(names):
+                    if q in name and i not in scored:
+                        scored[i] = (1.0, 0, len(q) / len(name))
+            else:
+                grams = sorted(_trigrams(q), key=lambda g: len(self._grams.get(g, ())))
+                need = max(1, ceil(min_score * len(grams) - 1e-9))
+                # A name sharing ``need`` of the query's trigrams has at least
+                # one of its len - need + 1 rarest, so only those postings are
+                # counted; the few common trigrams are checked in the name itself
+                cut = len(grams) - need + 1
+                counts: Counter = Counter()
+                for g in grams[:cut]:
+                    counts.update(self._grams.get(g, ()))
+                common = grams[cut:]
+                for i, shared in counts.items():
+                    if i in scored:
+                        continue
+                    name = names[i]
+                    for g in common:
+                        if g in name:
+                            shared += 1
+                    if shared >= need:
+                        # Dice coefficient, with the name's trigram count approximated by its length
+                        scored[i] = (shared / len(grams), 0, 2 * shared / (len(grams) + max(len(name) - 2, 1)))
+        ranked = heapq.nsmallest(limit, scored.items(), key=lambda item: (-item[1][0], -item[1][1], -item[1][2], item[0]))
+        results = [(self.conferences[i], score) for i, (score, _, _) in ranked]
+        if len(results) < limit:
+            results.extend(self._topic_hits(q, limit - len(results), min_score, scored))
+        return results
+
+    def _prefix_ids(self, q: str, limit: int) -> List[int]:
+        """Up to ``limit`` rows whose name starts with ``q``, in name order."""
+        if self._by_name is None:
+            order = sorted(range(len(self._names)), key=self._names.__getitem__)
+            self._by_name = (order, [self._names[i] for i in order])
+        order, sorted_names = self._by_name
+        ids = []
+        pos = bisect_left(sorted_names, q)
+        while pos < len(order) and len(ids) < limit and sorted_names[pos].startswith(q):
+            ids.append(order[pos])
+            pos += 1
+        return ids
+
+    def _topic_hits(self, q: str, limit: int, min_score: float, seen: Dict[int, tuple]) -> List[Tuple[Conference, float]]:
+        grams = _trigrams(q)
+        topics = []
+        for topic, ids in self._topics.items():
+            if q in topic:
+                score = 1.0
+            elif grams:
+                score = len(grams & _trigrams(topic)) / len(grams)
+            else:
+                continue
+            if score >= min_score:
+                topics.append((score, topic, ids))
+        topics.sort(key=lambda t: (-t[0], t[1]))
+        hits: List[Tuple[Conference, float]] = []
+        taken = set(seen)
+        for score, _, ids in topics:
+            for i in ids:
+                if i not in taken:
+                    taken.add(i)
+                    hits.append((self.conferences[i], score))
+                    if len(hits) == limit:
+                        return hits
+        return hits
+
+    def _topic_postings(self, needle: str) -> List[Iterable[int]]:
+        lists: List[Iterable[int]] = [ids for topic, ids in self._topics.items() if needle in topic]
+        lists.append(self._name_ids(needle))
+        return lists
+
+    def _country_postings(self, needle: str) -> List[Iterable[int]]:
+        return [ids for country, ids in self._countries.items() if needle in country]
+
+    def _topic_matches(self, needle: str, i: int) -> bool:
+        if needle in self._names[i]:
+            return True
+        table, keys = self.conferences, self._topic_keys
+        return any(needle in keys[v] for v in table._topic_ids[table._topic_offsets[i] : table._topic_offsets[i + 1]])
+
+    def _country_matches(self, needle: str, i: int) -> bool:
+        return needle in self._country_keys[self.conferences._country_ids[i]]
+
+    def _place_matches(self, places: Set[int], i: int) -> bool:
+        return self.conferences._place_ids[i] in places
+
+    def query(
+        self,
+        *,
+        topic: Optional[str] = None,
+        country: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        near: Optional[str] = None,
+        radius_km: float = geo.DEFAULT_RADIUS_KM,
+    ) -> List[Conference]:
+        """Same semantics and ordering as filter_conferences over this catalog."""
+        criteria = []
+        if topic:
+            t = topic.lower()
+            criteria.append((self._topic_postings(t), self._topic_matches, t))
+        if country:
+            ctry = country.lower()
+            criteria.append((self._country_postings(ctry), self._country_matches, ctry))
+        if near:
+            places = set(self._grid.within(geo.resolve(near), radius_km))
+            criteria.append(([self._place_rows[p] for p in places], self._place_matches, places))
+        after_ord = _to_ordinal(after) if after else None
+        before_ord = _to_ordinal(before) if before else None
+        lo, split, hi = self._date_window(after_ord, before_ord)
+        ends = self._ends
+
+        criteria.sort(key=lambda crit: sum(len(p) for p in crit[0]))
+        if criteria and sum(len(p) for p in criteria[0][0]) < hi - lo:
+            # Materialize the most selective criterion, clip it to the window
+            (postings, _, _), criteria = criteria[0], criteria[1:]
+            ids = sorted(set().union(*postings))
+            ids = ids[bisect_left(ids, lo) : bisect_left(ids, hi)]
+            if lo < split:
+                ids = [i for i in ids if i >= split or ends[i] >= after_ord]
+        else:
+            # The date window is the narrowest input
+            ids = [i for i in range(lo, split) if ends[i] >= after_ord]
+            ids.extend(range(split, hi))
+        for _, matches, needle in criteria:
+            ids = [i for i in ids if matches(needle, i)]
+        confs = self.conferences
+        return [confs[i] for i in ids]
+
+
+class SqlCatalog:
+    """The merged catalog as stored by the SQLite backend.
+
+    Filters, dedupe and ordering all run in SQL (see SqliteStore.query), so
+    only matching rows are decoded. Cross-source merges are computed by
+    open_catalog whenever the catalog changes and stored in the database.
+    A ``near`` filter is applied to the decoded rows afterwards.
+    """
+
+    def __init__(self, store) -> None:
+        self.store = store
+
+    def query(
+        self,
+        *,
+        topic: Optional[str] = None,
+        country: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        near: Optional[str] = None,
+        radius_km: float = geo.DEFAULT_RADIUS_KM,
+    ) -> List[Conference]:
+        """Same semantics and ordering as filter_conferences over the merged catalog."""
+        center = geo.resolve(near) if near else None
+        rows = self.store.query(
+            topic=topic,
+            country=country,
+            after_ord=_to_ordinal(after) if after else None,
+            before_ord=_to_ordinal(before) if before else None,
+        )
+        confs = [Conference(**json.loads(data), start_ord=start, end_ord=end) for data, start, end in rows]
+        return confs if center is None else _near(confs, center, radius_km)
+
+
+def _near(confs: Iterable[Conference], center: geo.Point, radius_km: float) -> List[Conference]:
+    """The conferences within ``radius_km`` of ``center``, geocoding those without coordinates."""
+    located: Dict[Tuple[str, str], bool] = {}
+    out = []
     for c in confs:
-        key = (c.name.lower(), c.start_date, c.end_date)
-        if key in seen:
+        point = geo.parse_point(c.lat, c.lon) if c.lat is not None else None
+        if point is not None:
+            if geo.distance_km(center, point) <= radius_km:
+                out.append(c)
             continue
-        seen.add(key)
-        unique.append(c)
-    return unique
+        hit = located.get((c.city, c.country))
+        if hit is None:
+            point = geo.geocode(c.city, c.country)
+            hit = located[c.city, c.country] = point is not None and geo.distance_km(center, point) <= radius_km
+        if hit:
+            out.append(c)
+    return out
 
 
 def filter_conferences(
@@ -52,7 +1037,34 @@ def filter_conferences(
     country: Optional[str] = None,
     after: Optional[str] = None,
     before: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: float = geo.DEFAULT_RADIUS_KM,
+) -> List[Conference]:
+    """Conferences matching every given filter, by start date.
+
+    ``after``/``before`` compare whole days: a conference matches when it
+    ends on or after the day of ``after`` and starts on or before the day of
+    ``before``, including any time of day in either value. ``near`` is a place for geo.resolve ("Berlin", "Portland, USA" or
+    "lat,lon"); it keeps conferences within ``radius_km`` of it and raises
+    ValueError for unknown places.
+    """
+    with timing.span("core.filter_conferences", engine=type(items).__name__) as span:
+        result = _filter(items, topic, country, after, before, near, radius_km)
+        span.set(rows=len(result))
+    return result
+
+
+def _filter(
+    items: Iterable[Conference],
+    topic: Optional[str],
+    country: Optional[str],
+    after: Optional[str],
+    before: Optional[str],
+    near: Optional[str],
+    radius_km: float,
 ) -> List[Conference]:
+    if isinstance(items, (ConferenceIndex, SqlCatalog)):
+        return items.query(topic=topic, country=country, after=after, before=before, near=near, radius_km=radius_km)
     result = list(items)
     if topic:
         t = topic.lower()
@@ -61,11 +1073,13 @@ def filter_conferences(
         ctry = country.lower()
         result = [c for c in result if ctry in c.country.lower()]
     if after:
-        after_dt = datetime.fromisoformat(after)
-        result = [c for c in result if c.end_dt() >= after_dt]
+        after_ord = _to_ordinal(after)
+        result = [c for c in result if c.end_ord >= after_ord]
     if before:
-        before_dt = datetime.fromisoformat(before)
-        result = [c for c in result if c.start_dt() <= before_dt]
-    return sorted(result, key=lambda c: c.start_dt())
+        before_ord = _to_ordinal(before)
+        result = [c for c in result if c.start_ord <= before_ord]
+    if near:
+        result = _near(result, geo.resolve(near), radius_km)
+    return sorted(result, key=lambda c: c.start_ord)
 
 
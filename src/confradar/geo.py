@@ -0,0 +1,183 @@
+"""Offline geocoding and radius queries behind ``list --near``.
+
+Coordinates come from the bundled ``data/cities.tsv``: a few hundred cities
+where tech conferences happen, with their country and alternative names.
+Lookups fold case, accents and punctuation, and use the country to pick
+between cities of the same name ("Cambridge"). Nothing here touches the
+network.
+
+GeoGrid buckets points into CELL_DEG-degree latitude/longitude cells, like
+geohash prefixes of one fixed length. A radius query visits only the cells
+overlapping the circle's bounding box and checks the great-circle distance
+of the points in them.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+from importlib import resources
+from math import asin, cos, degrees, floor, pi, radians, sin, sqrt
+from typing import Dict, List, Optional, Sequence, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+DEFAULT_RADIUS_KM = 100.0
+CELL_DEG = 1.0
+_ROWS = int(180 / CELL_DEG)
+_COLS = int(360 / CELL_DEG)
+
+Point = Tuple[float, float]  # (lat, lon) in degrees
+
+COUNTRY_ALIASES = {
+    "uk": "united kingdom",
+    "gb": "united kingdom",
+    "great britain": "united kingdom",
+    "england": "united kingdom",
+    "scotland": "united kingdom",
+    "wales": "united kingdom",
+    "northern ireland": "united kingdom",
+    "us": "united states",
+    "usa": "united states",
+    "united states of america": "united states",
+    "the netherlands": "netherlands",
+    "holland": "netherlands",
+    "czech republic": "czechia",
+    "korea": "south korea",
+    "republic of korea": "south korea",
+    "uae": "united arab emirates",
+    "türkiye": "turkey",
+    "viet nam": "vietnam",
+    "ivory coast": "côte d'ivoire",
+}
+
+
+def country_key(country: str) -> str:
+    """Lowercased country with aliases resolved, so "UK" and "United Kingdom" compare equal."""
+    key = " ".join(country.lower().replace(".", "").split())
+    return COUNTRY_ALIASES.get(key, key)
+
+
+def _fold(text: str) -> str:
+    """Case-, accent- and punctuation-insensitive form of a place name."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    text = text.replace(".", "").replace("'", "").replace("’", "").replace("-", " ")
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=1)
+def _cities() -> Dict[str, List[Tuple[str, float, float]]]:
+    """Folded city name or alias -> [(country key, lat, lon)], in table order."""
+    cities: Dict[str, List[Tuple[str, float, float]]] = {}
+    text = resources.files("confradar.data").joinpath("cities.tsv").read_text(encoding="utf-8")
+    for line in text.splitlines()[1:]:
+        city, country, lat, lon, aliases = line.split("\t")
+        entry = (country_key(country), float(lat), float(lon))
+        for name in [city, *filter(None, aliases.split(","))]:
+            cities.setdefault(_fold(name), []).append(entry)
+    return cities
+
+
+def geocode(city: str, country: str = "") -> Optional[Point]:
+    """Coordinates of ``city`` from the bundled table, or None if it is not listed.
+
+    With a ``country`` only a city in that country matches; without one the
+    first listed city of that name does. A city field that carries its
+    country ("Berlin, Germany") works too.
+    """
+    if not city or not isinstance(city, str):
+        return None
+    if not isinstance(country, str):
+        country = ""
+    found = _cities().get(_fold(city))
+    if found is None:
+        head, sep, tail = city.partition(",")
+        if not sep:
+            return None
+        if country:
+            return geocode(head, country)
+        # The tail may be a region rather than a country ("Portland, OR")
+        return geocode(head, tail) or geocode(head)
+    if not country:
+        return found[0][1:]
+    key = country_key(country)
+    for ckey, lat, lon in found:
+        if ckey == key:
+            return lat, lon
+    return None
+
+
+def parse_point(lat: object, lon: object) -> Optional[Point]:
+    """(lat, lon) as floats if both are valid coordinates, else None."""
+    try:
+        point = (float(lat), float(lon))
+    except (TypeError, ValueError):
+        return None
+    if not (-90.0 <= point[0] <= 90.0 and -180.0 <= point[1] <= 180.0):
+        return None
+    return point
+
+
+def resolve(place: str) -> Point:
+    """Coordinates for a ``--near`` argument: "City", "City, Country" or "lat,lon".
+
+    Raises ValueError for places the bundled table does not know.
+    """
+    lat, sep, lon = place.partition(",")
+    point = parse_point(lat, lon) if sep else None
+    if point is None:
+        point = geocode(place.strip())
+    if point is None:
+        raise ValueError(f"unknown place {place!r}; use a city from the bundled list or 'lat,lon'")
+    return point
+
+
+def distance_km(a: Point, b: Point) -> float:
+    """Great-circle (haversine) distance between two points."""
+    lat1, lon1, lat2, lon2 = map(radians, (*a, *b))
+    h = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(h)))
+
+
+def _cell(lat: float, lon: float) -> int:
+    row = min(int(floor((lat + 90.0) / CELL_DEG)), _ROWS - 1)
+    return row * _COLS + int(floor((lon + 180.0) / CELL_DEG)) % _COLS
+
+
+class GeoGrid:
+    """Points bucketed by CELL_DEG-degree cell, answering radius queries.
+
+    Points are referred to by their position in ``points``.
+    """
+
+    def __init__(self, points: Sequence[Point]) -> None:
+        self.points = points
+        self._cells: Dict[int, List[int]] = {}
+        for i, (lat, lon) in enumerate(points):
+            self._cells.setdefault(_cell(lat, lon), []).append(i)
+
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> List[int]:
+        angle = radius_km / EARTH_RADIUS_KM
+        dlat = degrees(angle)
+        if angle >= pi or lat - dlat <= -90.0 or lat + dlat >= 90.0 or sin(angle) >= cos(radians(lat)):
+            # The circle covers a pole or every longitude: visit whole rows
+            cols = range(_COLS)
+        else:
+            dlon = degrees(asin(sin(angle) / cos(radians(lat))))
+            first = int(floor((lon - dlon + 180.0) / CELL_DEG))
+            cols = range(first, int(floor((lon + dlon + 180.0) / CELL_DEG)) + 1)
+        row_lo = max(int(floor((lat - dlat + 90.0) / CELL_DEG)), 0)
+        row_hi = min(int(floor((lat + dlat + 90.0) / CELL_DEG)), _ROWS - 1)
+        if (row_hi - row_lo + 1) * len(cols) > len(self._cells):
+            # Fewer occupied cells than cells in the box
+            return [i for ids in self._cells.values() for i in ids]
+        ids: List[int] = []
+        for row in range(row_lo, row_hi + 1):
+            for col in cols:
+                ids.extend(self._cells.get(row * _COLS + col % _COLS, ()))
+        return ids
+
+    def within(self, center: Point, radius_km: float) -> List[int]:
+        """Positions of the points at most ``radius_km`` from ``center``, ascending."""
+        points = self.points
+        return sorted(i for i in self._candidates(*center, radius_km) if distance_km(center, points[i]) <= radius_km)
@@ -0,0 +1,197 @@
+"""`confradar serve`: a local HTTP daemon answering catalog queries from memory.
+
+The merged catalog and its ConferenceIndex are loaded once and kept in
+memory. A background task polls the catalog inputs' fingerprint and swaps in
+a freshly loaded catalog when one changes, so `add`, `refresh` or edits from
+another process show up without a restart.
+
+Endpoints (GET, JSON responses):
+  /conferences?topic=&country=&after=&before=&near=&radius_km=&limit=&offset=
+                  filter_conferences over the catalog
+  /show?name=&limit=
+                  ConferenceIndex.search: best fuzzy name matches first
+  /health         row count and when the catalog was loaded
+
+The client helpers at the bottom are what `list --server`/`show --server` use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .core import Conference, catalog_fingerprint, filter_conferences, load_index
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+_FILTERS = ("topic", "country", "after", "before", "near")
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class CatalogServer:
+    """Holds the catalog in memory and serves queries over HTTP/1.1 keep-alive connections."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, poll_s: float = 1.0) -> None:
+        self.host = host
+        self.port = port
+        self.poll_s = poll_s
+        self.index = load_index()
+        self.fingerprint = catalog_fingerprint()
+        self.loaded_at = time.time()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._watcher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Port 0 binds a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._watcher = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def reload_if_changed(self) -> bool:
+        """Reload the catalog if any input changed since the last load."""
+        fingerprint = await asyncio.to_thread(catalog_fingerprint)
+        if fingerprint == self.fingerprint:
+            return False
+        # Loading happens off the event loop; queries keep using the old
+        # catalog until the new one is swapped in whole
+        self.index = await asyncio.to_thread(load_index)
+        self.fingerprint = fingerprint
+        self.loaded_at = time.time()
+        return True
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_s)
+            try:
+                await self.reload_if_changed()
+            except Exception:
+                # A half-written input; the next poll tries again
+                pass
+
+    def respond(self, method: str, target: str) -> Tuple[int, object]:
+        """(status, JSON body) for one request."""
+        if method != "GET":
+            return 405, {"error": "only GET is supported"}
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        index = self.index
+        if url.path == "/health":
+            return 200, {"rows": len(index.conferences), "loaded_at": self.loaded_at}
+        if url.path == "/conferences":
+            try:
+                offset = int(params.get("offset") or 0)
+                limit = int(params["limit"]) if params.get("limit") else None
+                filters = {k: params[k] for k in _FILTERS if params.get(k)}
+                if params.get("radius_km"):
+                    filters["radius_km"] = float(params["radius_km"])
+                confs = filter_conferences(index, **filters)
+            except ValueError as exc:
+                return 400, {"error": str(exc)}
+            if offset < 0 or (limit is not None and limit < 0):
+                return 400, {"error": "limit and offset must not be negative"}
+            page = islice(confs, offset, None if limit is None else offset + limit)
+            return 200, [c.to_dict() for c in page]
+        if url.path == "/show":
+            if not params.get("name"):
+                return 400, {"error": "name is required"}
+            try:
+                limit = int(params.get("limit") or 10)
+            except ValueError as exc:
+                return 400, {"error": str(exc)}
+            return 200, [c.to_dict() for c, _ in index.search(params["name"], limit=limit)]
+        return 404, {"error": f"no such endpoint: {url.path}"}
+
+    def _reply(self, method: str, target: str) -> Tuple[int, bytes]:
+        """respond() with its body encoded; any failure becomes a 500."""
+        try:
+            status, body = self.respond(method, target)
+        except Exception as exc:
+            status, body = 500, {"error": f"{type(exc).__name__}: {exc}"}
+        return status, json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    status, payload = 400, b'{"error": "malformed request line"}'
+                    version = "HTTP/1.0"
+                else:
+                    # Queries and encoding run on a worker thread so a large
+                    # one does not stall the other connections
+                    status, payload = await asyncio.to_thread(self._reply, method, target)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(payload)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+# --------------------------------- Client --------------------------------
+
+class ServerError(RuntimeError):
+    """The daemon could not be reached or rejected the query."""
+
+
+def _get(base_url: str, path: str, params: Dict[str, object]) -> List[dict]:
+    from urllib.error import HTTPError, URLError
+    from urllib.request import urlopen
+
+    if "://" not in base_url:
+        base_url = f"http://{base_url}"
+    query = urlencode({k: v for k, v in params.items() if v is not None})
+    url = f"{base_url.rstrip('/')}{path}" + (f"?{query}" if query else "")
+    try:
+        with urlopen(url, timeout=10) as resp:
+            return json.loads(resp.read())
+    except HTTPError as exc:
+        try:
+            detail = json.loads(exc.read()).get("error", exc.reason)
+        except ValueError:
+            detail = exc.reason
+        raise ServerError(f"{url}: {detail}") from None
+    except (URLError, OSError) as exc:
+        raise ServerError(f"cannot reach {base_url}: {exc}") from None
+
+
+def query_server(base_url: str, **params) -> List[Conference]:
+    """filter_conferences against a running daemon; accepts limit/offset too."""
+    return [Conference(**row) for row in _get(base_url, "/conferences", params)]
+
+
+def show_server(base_url: str, name: str, limit: int = 10) -> List[Conference]:
+    return [Conference(**row) for row in _get(base_url, "/show", {"name": name, "limit": limit})]
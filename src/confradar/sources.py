@@ -1,22 +1,60 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
 import json
-from typing import List
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
 
 import httpx
 
-from .storage import load_sources, save_remote_conferences, save_sources
+from . import geo, timing
+from .storage import (
+    commit_remote_shard,
+    delete_remote_shard,
+    has_remote_shard,
+    load_remote_manifest,
+    load_sources,
+    load_user_topic_rules,
+    remote_download_file,
+    save_remote_manifest,
+    remote_shard_file,
+    write_shard,
+    save_sources,
+)
 from importlib import resources
 
+# Global cap on in-flight sources and a lower cap per host, so dozens of
+# sources on the same CDN do not all open connections at once.
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PER_HOST = 4
+# Read/parse granularity for streaming ingestion
+_CHUNK_SIZE = 64 * 1024
+
 
 def _normalize_rows(rows: List[dict]) -> List[dict]:
     """Normalize external rows to our schema.
 
     Input rows may be camelCase like from tech-conferences dataset:
     - name, url, startDate, endDate, city, country, tags/topics
-    Output schema keys: name, start_date, end_date, city, country, url, topics(list[str])
+    Output schema keys: name, start_date, end_date, city, country, url, topics(list[str]),
+    plus lat/lon when the row carries valid coordinates or its city is in the
+    bundled geo table.
     """
-    normalized: List[dict] = []
+    return list(_iter_normalized(rows))
+
+
+def _iter_normalized(rows: Iterable[dict]) -> Iterator[dict]:
+    """Generator form of _normalize_rows, for streaming ingestion."""
     for r in rows or []:
         name = r.get("name") or r.get("title")
         url = r.get("url") or r.get("link")
@@ -35,65 +73,137 @@ def _normalize_rows(rows: List[dict]) -> List[dict]:
         if not name or not url or not start_date:
             continue
 
-        normalized.append(
-            {
-                "name": name,
-                "start_date": start_date,
-                "end_date": end_date or start_date,
-                "city": city,
-                "country": country,
-                "url": url,
-                "topics": topics,
-            }
-        )
-    return normalized
+        row = {
+            "name": name,
+            "start_date": start_date,
+            "end_date": end_date or start_date,
+            "city": city,
+            "country": country,
+            "url": url,
+            "topics": topics,
+        }
+        point = geo.parse_point(
+            r.get("lat", r.get("latitude")), r.get("lon", r.get("lng", r.get("longitude")))
+        ) or geo.geocode(city, country)
+        if point is not None:
+            row["lat"], row["lon"] = point
+        yield row
+
+
+# ------------------------------ Topic rules ------------------------------
+#
+# Each rule maps keywords to topics. Keywords match case-insensitively as
+# whole words; a leading/trailing "*" lets them extend into the rest of the
+# word ("kube*" matches "KubeCon", "*python*" matches "MicroPython"), while a
+# bare "ai" does not match "Jamaica". Users can append rules in
+# topic_rules.json in the data dir:
+#   {"name": [{"keywords": ["rust*"], "topics": ["rust"]}], "source": [...]}
+
+Rule = Tuple[Tuple[str, ...], Tuple[str, ...]]  # (keywords, topics)
+
+# Matched against conference names
+NAME_TOPIC_RULES: Tuple[Rule, ...] = (
+    (("*python*",), ("python",)),
+    (("*javascript*", "js", "jsconf*"), ("javascript",)),
+    (("ai", "ml", "machine learning"), ("ai",)),
+    (("kube*",), ("kubernetes",)),
+)
+# Matched against the source's file name, for rows that carry no topics
+SOURCE_TOPIC_RULES: Tuple[Rule, ...] = (
+    (("*javascript*", "*js.json"), ("javascript",)),
+    (("*python*",), ("python",)),
+    (("*ai-ml-data-science*",), ("ai", "machine learning", "data science")),
+    (("*devops*",), ("devops",)),
+)
+
+
+def _keyword_pattern(keyword: str) -> str:
+    body = r"\s+".join(re.escape(part) for part in keyword.strip("*").split())
+    head = r"\w*" if keyword.startswith("*") else r"\b"
+    tail = r"\w*" if keyword.endswith("*") else r"\b"
+    return head + body + tail
+
+
+class TopicMatcher:
+    """A rule table compiled into a single regex, so matching is one pass per text."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = tuple(rules)
+        groups = [
+            f"(?P<r{i}>{'|'.join(_keyword_pattern(k) for k in keywords)})"
+            for i, (keywords, _) in enumerate(self.rules)
+            if keywords
+        ]
+        self._regex = re.compile("|".join(groups), re.IGNORECASE) if groups else None
+
+    def match(self, text: str) -> List[str]:
+        """Topics of every rule with a keyword in ``text``, in rule order."""
+        if self._regex is None or not text:
+            return []
+        hits = sorted({int(m.lastgroup[1:]) for m in self._regex.finditer(text)})
+        topics: List[str] = []
+        for i in hits:
+            for topic in self.rules[i][1]:
+                if topic not in topics:
+                    topics.append(topic)
+        return topics
+
+
+class TopicRules(NamedTuple):
+    name: Tuple[Rule, ...] = NAME_TOPIC_RULES
+    source: Tuple[Rule, ...] = SOURCE_TOPIC_RULES
+
+    def key(self) -> str:
+        """Short digest stored with each shard; a change forces re-ingestion."""
+        return hashlib.sha1(repr(tuple(self)).encode("utf-8")).hexdigest()[:12]
+
+
+def _user_rules(entries) -> Tuple[Rule, ...]:
+    rules = []
+    for entry in entries or []:
+        try:
+            keywords = tuple(str(k) for k in entry["keywords"] if str(k).strip("* "))
+            topics = tuple(str(t) for t in entry["topics"])
+        except (KeyError, TypeError):
+            continue
+        if keywords and topics:
+            rules.append((keywords, topics))
+    return tuple(rules)
+
+
+def load_topic_rules() -> TopicRules:
+    """Built-in rule tables extended with the user's topic_rules.json."""
+    user = load_user_topic_rules()
+    return TopicRules(NAME_TOPIC_RULES + _user_rules(user.get("name")), SOURCE_TOPIC_RULES + _user_rules(user.get("source")))
 
 
-def _infer_topics_from_source(src: dict) -> List[str]:
+@lru_cache(maxsize=16)
+def _matcher(rules: Tuple[Rule, ...]) -> TopicMatcher:
+    return TopicMatcher(rules)
+
+
+def _infer_topics_from_source(src: dict, rules: TopicRules = TopicRules()) -> List[str]:
     name = ""
     if src.get("type") == "json" and "url" in src:
         name = src["url"].rsplit("/", 1)[-1]
     elif src.get("type") == "file-json" and "path" in src:
         name = str(src["path"]).rsplit("/", 1)[-1]
-    name = name.lower()
-    topics: List[str] = []
-    if "javascript" in name or name.endswith("js.json"):
-        topics.append("javascript")
-    if "python" in name:
-        topics.append("python")
-    if "ai-ml-data-science" in name:
-        topics.extend(["ai", "machine learning", "data science"])
-    if "devops" in name:
-        topics.append("devops")
-    return topics
-
-
-def _augment_topics(item: dict, inferred: List[str]) -> None:
-    topics = item.get("topics") or []
-    if not topics:
-        topics = list(inferred)
-    # Heuristic from name
-    lname = (item.get("name") or "").lower()
-    if "python" in lname and "python" not in topics:
-        topics.append("python")
-    if ("javascript" in lname or " js" in lname) and "javascript" not in topics:
-        topics.append("javascript")
-    if any(k in lname for k in ["ai", "ml", "machine learning"]) and "ai" not in topics:
-        topics.append("ai")
-    if "kube" in lname or "kubernetes" in lname:
-        if "kubernetes" not in topics:
-            topics.append("kubernetes")
-    item["topics"] = topics
-
-
-def refresh_sources(timeout_s: float = 10.0) -> int:
-    """Fetch all configured sources and persist a merged remote cache.
+    return _matcher(rules.source).match(name)
 
-    Supported types:
-    - json: fetch a JSON array of conference dicts
-    - file-json: read a local JSON file with an array of conference dicts
-    Returns: number of conferences saved
-    """
+
+def _augment_topics(rows: Iterable[dict], inferred: List[str], rules: TopicRules = TopicRules()) -> Iterator[dict]:
+    """Fill empty topics from the source and add topics matched in each name."""
+    matcher = _matcher(rules.name)
+    for item in rows:
+        topics = item.get("topics") or list(inferred)
+        for topic in matcher.match(item.get("name") or ""):
+            if topic not in topics:
+                topics.append(topic)
+        item["topics"] = topics
+        yield item
+
+
+def _configured_sources() -> List[dict]:
     sources = load_sources()
     if not sources:
         # Seed with curated default sources (JSON URLs) so refresh has live data
@@ -109,41 +219,410 @@ def refresh_sources(timeout_s: float = 10.0) -> int:
                 save_sources(sources)
             except Exception:
                 sources = []
-    all_rows: List[dict] = []
+    return sources
+
+
+def source_id(src: dict) -> str:
+    """Stable identifier for a source, derived from its type and location."""
+    location = src.get("url") or str(src.get("path") or "")
+    return hashlib.sha1(f"{src.get('type')}:{location}".encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class RefreshSummary:
+    count: int = 0  # conferences saved
+    hits: int = 0  # sources whose shard was reused as-is
+    misses: int = 0  # sources downloaded/read, normalized and re-sharded
+    failed: int = 0  # sources that errored; their last good shard is kept
+    bytes_saved: int = 0  # body bytes not transferred or read thanks to the cache
+
+
+# Progress callback: (sources finished, sources total, source, status) where
+# status is one of "updated", "cached", "failed" or "skipped".
+ProgressCallback = Callable[[int, int, dict, str], None]
+
+
+@dataclass
+class _SourceResult:
+    entry: dict  # manifest entry describing the source's shard
+    hit: bool
+    bytes_saved: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)  # filled only while profiling
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """Yield the elements of a top-level JSON array as its bytes arrive.
+
+    Only the element being decoded is buffered, so memory stays bounded by
+    the largest element rather than the document. A top-level object is
+    decoded whole and the items of its "conferences" list are yielded.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8-sig")()
+    chunks = iter(chunks)
+    buf, pos, eof = "", 0, False
+
+    def more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buf, pos = buf[pos:] + text.decode(b"", final=True), 0
+        else:
+            buf, pos = buf[pos:] + text.decode(chunk), 0
+        return True
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or not more():
+                return
 
-    for src in sources:
-        stype = src.get("type")
+    def truncated() -> json.JSONDecodeError:
+        return json.JSONDecodeError("Unexpected end of JSON array", buf, pos)
+
+    skip_ws()
+    if pos >= len(buf):
+        raise truncated()
+    if buf[pos] != "[":
+        # Not an array: decode the whole document
+        while more():
+            pass
+        doc = json.loads(buf[pos:])
+        yield from (doc.get("conferences", []) if isinstance(doc, dict) else doc or [])
+        return
+    pos += 1
+    skip_ws()
+    if pos < len(buf) and buf[pos] == "]":
+        return
+    while True:
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if more():
+                    continue
+                raise
+            # A number or literal ending the buffer may continue in the next chunk
+            if end == len(buf) and more():
+                continue
+            break
+        pos = end
+        yield value
+        skip_ws()
+        if pos >= len(buf):
+            raise truncated()
+        if buf[pos] == "]":
+            return
+        if buf[pos] != ",":
+            raise json.JSONDecodeError("Expected ',' or ']'", buf, pos)
+        pos += 1
+        skip_ws()
+
+
+def _iter_file_chunks(path) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        yield from iter(lambda: f.read(_CHUNK_SIZE), b"")
+
+
+def _hash_file(path) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in _iter_file_chunks(path):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _iter_processed(src: dict, rows: Iterable[dict], rules: TopicRules) -> Iterator[dict]:
+    return _augment_topics(_iter_normalized(rows), _infer_topics_from_source(src, rules), rules)
+
+
+def _timed_iter(items: Iterable, spent: Dict[str, float], key: str) -> Iterator:
+    """Pass ``items`` through, adding the time spent producing them to ``spent[key]``."""
+    it = iter(items)
+    while True:
+        t0 = time.perf_counter()
         try:
-            if stype == "json":
-                url = src["url"]
-                with httpx.Client(timeout=timeout_s) as client:
-                    resp = client.get(url)
+            item = next(it)
+        except StopIteration:
+            spent[key] += time.perf_counter() - t0
+            return
+        spent[key] += time.perf_counter() - t0
+        yield item
+
+
+def _ingest_file(
+    src: dict,
+    entry: dict,
+    path,
+    digest: str,
+    size: int,
+    meta: dict,
+    rules: TopicRules,
+    shard: Path,
+    profile: bool = False,
+) -> _SourceResult:
+    """Keep the shard when the content hash is unchanged, else stream the
+    file through parsing, normalization and topic augmentation into a new shard.
+
+    Self-contained (explicit paths, picklable arguments and result) so it can
+    run in a worker process. With ``profile`` the result carries the time
+    spent parsing, normalizing and writing; the stages are interleaved, so
+    each one is timed as the items pass through it.
+    """
+    if entry and entry.get("sha256") == digest:
+        return _SourceResult({**entry, **meta}, hit=True)
+    sid = source_id(src)
+    rows = iter_json_array(_iter_file_chunks(path))
+    if not profile:
+        count = write_shard(shard, _iter_processed(src, rows, rules))
+        timings: Dict[str, float] = {}
+    else:
+        spent = {"parse": 0.0, "process": 0.0}
+        t0 = time.perf_counter()
+        processed = _iter_processed(src, _timed_iter(rows, spent, "parse"), rules)
+        count = write_shard(shard, _timed_iter(processed, spent, "process"))
+        timings = {
+            "parse_s": spent["parse"],
+            "normalize_s": spent["process"] - spent["parse"],
+            "write_s": time.perf_counter() - t0 - spent["process"],
+            "rows": count,
+        }
+    return _SourceResult(
+        {"id": sid, "source": src, **meta, "sha256": digest, "size": size, "count": count, "rules": rules.key()},
+        hit=False,
+        timings=timings,
+    )
+
+
+async def _download(client: httpx.AsyncClient, url: str, headers: Dict[str, str], dest: Path):
+    """Stream a response body to ``dest``; returns (response, sha256, size), or (response, None, 0) on 304."""
+    async with client.stream("GET", url, headers=headers) as resp:
+        if resp.status_code == 304:
+            return resp, None, 0
+        resp.raise_for_status()
+        digest = hashlib.sha256()
+        size = 0
+        with open(dest, "wb") as f:
+            async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        return resp, digest.hexdigest(), size
+
+
+async def _fetch_source(
+    client: httpx.AsyncClient,
+    src: dict,
+    entry: dict,
+    limit: asyncio.Semaphore,
+    host_limits: Dict[str, asyncio.Semaphore],
+    per_host: int,
+    timeout_s: float,
+    rules: TopicRules,
+    executor: Optional[Executor],
+) -> Optional[_SourceResult]:
+    """Fetch one source and refresh its shard; None for unsupported types.
+
+    Bodies are streamed to disk while hashed and then parsed incrementally
+    on ``executor`` (a thread by default), so neither the download nor the
+    ingestion holds a whole source in memory.
+    """
+    loop = asyncio.get_running_loop()
+    profile = timing.is_enabled()
+    shard = remote_shard_file(source_id(src))
+    stype = src.get("type")
+    if stype == "json":
+        url = src["url"]
+        headers: Dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        host = urlsplit(url).netloc.lower()
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(per_host)
+        dest = remote_download_file(source_id(src))
+        try:
+            # Wait for the host before taking a global slot, so sources queued
+            # on one busy host don't hold slots other hosts could use
+            async with host_limits[host], limit:
+                t0 = time.perf_counter()
+                resp, digest, size = await asyncio.wait_for(_download(client, url, headers, dest), timeout_s)
+                fetched = {"fetch_s": time.perf_counter() - t0, "bytes": size} if profile else {}
+            if digest is None:
+                if not entry:
                     resp.raise_for_status()
-                    rows = resp.json()
-                    if isinstance(rows, dict):
-                        rows = rows.get("conferences", [])
-                norm = _normalize_rows(rows)
-                inferred = _infer_topics_from_source(src)
-                for it in norm:
-                    _augment_topics(it, inferred)
-                all_rows.extend(norm)
-            elif stype == "file-json":
-                path = src["path"]
-                with open(path, "r", encoding="utf-8") as f:
-                    rows = json.load(f)
-                norm = _normalize_rows(rows)
-                inferred = _infer_topics_from_source(src)
-                for it in norm:
-                    _augment_topics(it, inferred)
-                all_rows.extend(norm)
-            else:
-                # unsupported; skip
-                continue
-        except Exception:
-            # Ignore failing source; proceed with others
+                return _SourceResult(entry, hit=True, bytes_saved=entry.get("size", 0), timings=fetched)
+            meta = {"etag": resp.headers.get("etag"), "last_modified": resp.headers.get("last-modified")}
+            res = await loop.run_in_executor(
+                executor, _ingest_file, src, entry, dest, digest, size, meta, rules, shard, profile
+            )
+            res.timings.update(fetched)
+            return res
+        finally:
+            if dest.exists():
+                dest.unlink()
+    if stype == "file-json":
+        path = src["path"]
+        st = os.stat(path)
+        meta = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        if entry and all(entry.get(k) == v for k, v in meta.items()):
+            return _SourceResult(entry, hit=True, bytes_saved=st.st_size)
+        async with limit:
+            t0 = time.perf_counter()
+            digest, size = await asyncio.wait_for(asyncio.to_thread(_hash_file, path), timeout_s)
+            fetched = {"fetch_s": time.perf_counter() - t0, "bytes": size} if profile else {}
+            res = await loop.run_in_executor(
+                executor, _ingest_file, src, entry, path, digest, size, meta, rules, shard, profile
+            )
+            res.timings.update(fetched)
+            return res
+    # unsupported; skip
+    return None
+
+
+async def refresh_sources_async(
+    timeout_s: float = 10.0,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    client: Optional[httpx.AsyncClient] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    workers: int = 1,
+) -> RefreshSummary:
+    """Fetch all configured sources concurrently and update the sharded remote cache.
+
+    All HTTP sources share one pooled ``httpx.AsyncClient``. ``timeout_s``
+    bounds each source as a whole, not just individual socket reads.
+
+    Each source owns one shard keyed by ``source_id``; the manifest lists
+    shards in configured source order, so the merged cache is identical to a
+    serial refresh regardless of completion order. A 304 or an unchanged body
+    leaves the shard untouched, and a failing source keeps its last good shard.
+    ``on_progress`` is called as each source finishes, in completion order.
+
+    With ``workers`` > 1, parsing and normalization run in a process pool of
+    that size instead of a thread, spreading CPU-bound sources across cores.
+    Each worker writes only its own source's shard and the manifest is still
+    assembled in source order, so the output matches a serial refresh.
+    """
+    sources = _configured_sources()
+    concurrency = max(1, concurrency)
+    per_host = max(1, per_host)
+    limit = asyncio.Semaphore(concurrency)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+    rules = load_topic_rules()
+    # Every shard still on disk is a fallback for a failing source, but only
+    # shards built with the current topic rules may be kept by a 304 or an
+    # unchanged hash; the others are downloaded and ingested again
+    previous = {e["id"]: e for e in load_remote_manifest() if "id" in e and has_remote_shard(e["id"])}
+    current = {sid: e for sid, e in previous.items() if e.get("rules") == rules.key()}
+
+    done = 0
+
+    async def run(src: dict) -> Optional[_SourceResult]:
+        nonlocal done
+        status = "failed"
+        res = None
+        t0 = time.perf_counter()
+        try:
+            res = await _fetch_source(
+                client, src, current.get(source_id(src), {}), limit, host_limits, per_host, timeout_s, rules, executor
+            )
+            status = "skipped" if res is None else "cached" if res.hit else "updated"
+            return res
+        finally:
+            done += 1
+            timing.record(
+                "sources.source",
+                time.perf_counter() - t0,
+                start=t0,
+                source=src.get("url") or str(src.get("path") or ""),
+                status=status,
+                **(res.timings if res is not None else {}),
+            )
+            if on_progress is not None:
+                on_progress(done, len(sources), src, status)
+
+    executor: Optional[Executor] = None
+    if workers > 1:
+        # spawn: forking a process that runs an event loop (and, in the TUI,
+        # other threads) is not safe
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    owns_client = client is None
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=timeout_s,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+    try:
+        results = await asyncio.gather(*(run(src) for src in sources), return_exceptions=True)
+    finally:
+        if owns_client:
+            await client.aclose()
+        if executor is not None:
+            executor.shutdown()
+
+    with timing.span("sources.commit"):
+        return _commit_results(sources, results, previous)
+
+
+def _commit_results(sources: List[dict], results: list, previous: Dict[str, dict]) -> RefreshSummary:
+    """Import new shards and write the manifest in source order."""
+    summary = RefreshSummary()
+    manifest: List[dict] = []
+    for src, res in zip(sources, results):
+        if isinstance(res, BaseException):
+            # Keep serving the last good shard for a failing source
+            summary.failed += 1
+            entry = previous.get(source_id(src))
+            if entry:
+                manifest.append(entry)
+            continue
+        if res is None:
             continue
+        if res.hit:
+            summary.hits += 1
+        else:
+            summary.misses += 1
+            commit_remote_shard(res.entry["id"])
+        summary.bytes_saved += res.bytes_saved
+        manifest.append(res.entry)
+
+    save_remote_manifest(manifest)
+    kept = {e["id"] for e in manifest}
+    for sid in previous.keys() - kept:
+        delete_remote_shard(sid)
+    summary.count = sum(e.get("count", 0) for e in manifest)
+    return summary
 
-    save_remote_conferences(all_rows)
-    return len(all_rows)
 
+def refresh_sources(
+    timeout_s: float = 10.0,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    on_progress: Optional[ProgressCallback] = None,
+    workers: int = 1,
+) -> RefreshSummary:
+    """Fetch all configured sources and update the remote cache.
 
+    Supported types:
+    - json: fetch a JSON array of conference dicts
+    - file-json: read a local JSON file with an array of conference dicts
+    Returns: a RefreshSummary with the number of conferences cached and cache stats
+    """
+    with timing.span("sources.refresh") as span:
+        summary = asyncio.run(
+            refresh_sources_async(
+                timeout_s, concurrency=concurrency, per_host=per_host, on_progress=on_progress, workers=workers
+            )
+        )
+        span.set(rows=summary.count, hits=summary.hits, misses=summary.misses, failed=summary.failed)
+    return summary
@@ -0,0 +1,354 @@
+"""SQLite implementation of the storage module's load_*/save_* functions.
+
+One database (``confradar.db`` in the data dir) replaces the JSON files.
+Every conference row, whatever its origin, lives in a single table so
+queries can be pushed down to SQL. Each row keeps its original JSON for
+lossless round trips, next to the lowercased and parsed columns that
+queries filter on.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+# Merge priority of the row origins, as in core._merge_sources
+BUNDLED, USER, REMOTE = 0, 1, 2
+
+_FIELDS = ("name", "start_date", "end_date", "city", "country", "url", "topics")
+# Coordinates that normalization may add, see core.Conference
+_OPTIONAL_FIELDS = ("lat", "lon")
+_TOPIC_SEP = "\x1f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS conferences (
+    id INTEGER PRIMARY KEY,
+    origin INTEGER NOT NULL,
+    source_id TEXT NOT NULL DEFAULT '',
+    src_pos INTEGER NOT NULL DEFAULT 0,   -- manifest position, -1 when not listed
+    seq INTEGER NOT NULL,                 -- position within its origin/source
+    data TEXT NOT NULL,                   -- the row as stored in JSON
+    valid INTEGER NOT NULL,               -- 0 for rows the catalog rejects
+    name_key TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    country_key TEXT,
+    topics_key TEXT,
+    start_ord INTEGER,
+    end_ord INTEGER
+);
+CREATE INDEX IF NOT EXISTS conferences_start ON conferences (start_ord);
+CREATE INDEX IF NOT EXISTS conferences_end ON conferences (end_ord);
+CREATE INDEX IF NOT EXISTS conferences_origin ON conferences (origin, source_id, seq);
+DROP INDEX IF EXISTS conferences_dedupe;
+-- The country filter is a substring match, which a B-tree index can't serve
+DROP INDEX IF EXISTS conferences_country;
+-- core.open_catalog's dedupe result: absorbed rows (kept = 0) and the
+-- merged record of each row that absorbed others (kept = 1)
+CREATE TABLE IF NOT EXISTS merges (id INTEGER PRIMARY KEY, kept INTEGER NOT NULL, data TEXT, topics_key TEXT);
+CREATE TABLE IF NOT EXISTS shards (source_id TEXT PRIMARY KEY, count INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS manifest (pos INTEGER PRIMARY KEY, source_id TEXT NOT NULL, entry TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS stars (name TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS sources (pos INTEGER PRIMARY KEY, source TEXT NOT NULL);
+"""
+
+# Trigram FTS over the lowercased name and topics; needs SQLite >= 3.34
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS conferences_fts USING fts5(
+    name_key, topics_key, content='conferences', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS conferences_fts_insert AFTER INSERT ON conferences BEGIN
+    INSERT INTO conferences_fts (rowid, name_key, topics_key) VALUES (new.id, new.name_key, new.topics_key);
+END;
+CREATE TRIGGER IF NOT EXISTS conferences_fts_delete AFTER DELETE ON conferences BEGIN
+    INSERT INTO conferences_fts (conferences_fts, rowid, name_key, topics_key)
+    VALUES ('delete', old.id, old.name_key, old.topics_key);
+END;
+CREATE TRIGGER IF NOT EXISTS conferences_fts_update AFTER UPDATE OF name_key, topics_key ON conferences BEGIN
+    INSERT INTO conferences_fts (conferences_fts, rowid, name_key, topics_key)
+    VALUES ('delete', old.id, old.name_key, old.topics_key);
+    INSERT INTO conferences_fts (rowid, name_key, topics_key) VALUES (new.id, new.name_key, new.topics_key);
+END;
+"""
+
+
+
+def _index_columns(row: object) -> Optional[tuple]:
+    """The query columns for a row, or None if core.Conference would reject it."""
+    if not isinstance(row, dict) or not set(_FIELDS) <= set(row) <= {*_FIELDS, *_OPTIONAL_FIELDS}:
+        return None
+    try:
+        start = datetime.fromisoformat(row["start_date"]).toordinal()
+        end = datetime.fromisoformat(row["end_date"]).toordinal()
+        if end < start:
+            return None
+        return (
+            row["name"].lower(),
+            row["start_date"],
+            row["end_date"],
+            row["country"].lower(),
+            _TOPIC_SEP.join(t.lower() for t in row["topics"]),
+            start,
+            end,
+        )
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _records(origin: int, source_id: str, src_pos: int, rows: Iterable[dict], first_seq: int = 0) -> Iterator[tuple]:
+    for seq, row in enumerate(rows, first_seq):
+        data = json.dumps(row, ensure_ascii=False)
+        columns = _index_columns(row)
+        if columns is None:
+            yield (origin, source_id, src_pos, seq, data, 0) + (None,) * 7
+        else:
+            yield (origin, source_id, src_pos, seq, data, 1) + columns
+
+
+_INSERT = (
+    "INSERT INTO conferences (origin, source_id, src_pos, seq, data, valid, name_key, start_date, end_date,"
+    " country_key, topics_key, start_ord, end_ord) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _match_phrase(needle: str) -> str:
+    return '"' + needle.replace('"', '""') + '"'
+
+
+class SqliteStore:
+    """A connection to the database, opened in WAL mode.
+
+    Connections are not shared across threads; storage keeps one store per
+    thread. Each write method runs in a single transaction and, when it
+    changes the catalog, rewrites ``stamp`` so snapshot fingerprints notice.
+    """
+
+    def __init__(self, path: Path, stamp: Path) -> None:
+        self.path = path
+        self.stamp = stamp
+        self.conn = sqlite3.connect(str(path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        try:
+            self.conn.executescript(_FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _touch(self) -> None:
+        self.stamp.write_text(str(time.time_ns()), encoding="utf-8")
+
+    def _rows(self, sql: str, params: tuple = ()) -> Iterator[dict]:
+        for (data,) in self.conn.execute(sql, params):
+            yield json.loads(data)
+
+    def _replace(self, origin: int, rows: Iterable[dict], source_id: str = "", src_pos: int = 0) -> int:
+        """Replace every row of one origin (and source) with ``rows``; call inside a transaction."""
+        self.conn.execute("DELETE FROM conferences WHERE origin = ? AND source_id = ?", (origin, source_id))
+        before = self.conn.total_changes
+        self.conn.executemany(_INSERT, _records(origin, source_id, src_pos, rows))
+        return self.conn.total_changes - before
+
+    # ---- User conferences ----
+
+    def load_user_conferences(self) -> List[dict]:
+        return list(self._rows("SELECT data FROM conferences WHERE origin = ? ORDER BY seq", (USER,)))
+
+    def save_user_conferences(self, conferences: Iterable[dict]) -> None:
+        with self.conn:
+            self._replace(USER, conferences)
+        self._touch()
+
+    def add_user_conference(self, conference: dict) -> None:
+        with self.conn:
+            (seq,) = self.conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM conferences WHERE origin = ?", (USER,)
+            ).fetchone()
+            self.conn.executemany(_INSERT, _records(USER, "", 0, [conference], seq))
+        self._touch()
+
+    # ---- Stars ----
+
+    def load_stars(self) -> Set[str]:
+        return {name for (name,) in self.conn.execute("SELECT name FROM stars")}
+
+    def save_stars(self, starred_names: Iterable[str]) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM stars")
+            self.conn.executemany("INSERT OR IGNORE INTO stars (name) VALUES (?)", ((n,) for n in starred_names))
+
+    def add_star(self, name: str) -> None:
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO stars (name) VALUES (?)", (name,))
+
+    def remove_star(self, name: str) -> bool:
+        with self.conn:
+            return self.conn.execute("DELETE FROM stars WHERE name = ?", (name,)).rowcount > 0
+
+    # ---- Sources ----
+
+    def load_sources(self) -> List[dict]:
+        return [json.loads(s) for (s,) in self.conn.execute("SELECT source FROM sources ORDER BY pos")]
+
+    def save_sources(self, sources: Iterable[dict]) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM sources")
+            self.conn.executemany(
+                "INSERT INTO sources (pos, source) VALUES (?, ?)",
+                ((pos, json.dumps(s, ensure_ascii=False)) for pos, s in enumerate(sources)),
+            )
+
+    # ---- Remote cache ----
+
+    def load_manifest(self) -> List[dict]:
+        return [json.loads(e) for (e,) in self.conn.execute("SELECT entry FROM manifest ORDER BY pos")]
+
+    def save_manifest(self, entries: Iterable[dict]) -> None:
+        """Store the manifest and move each shard's rows to its new position.
+
+        Shards missing from the manifest get position -1, which keeps them
+        out of the catalog just like unlisted shard files.
+        """
+        entries = list(entries)
+        positions = {e.get("id", ""): pos for pos, e in reversed(list(enumerate(entries)))}
+        with self.conn:
+            old = dict(self.conn.execute("SELECT source_id, MIN(pos) FROM manifest GROUP BY source_id"))
+            self.conn.execute("DELETE FROM manifest")
+            self.conn.executemany(
+                "INSERT INTO manifest (pos, source_id, entry) VALUES (?, ?, ?)",
+                ((pos, e.get("id", ""), json.dumps(e, ensure_ascii=False)) for pos, e in enumerate(entries)),
+            )
+            for sid in old.keys() - positions.keys():
+                self.conn.execute("UPDATE conferences SET src_pos = -1 WHERE origin = ? AND source_id = ?", (REMOTE, sid))
+            for sid, pos in positions.items():
+                if old.get(sid) != pos:
+                    self.conn.execute(
+                        "UPDATE conferences SET src_pos = ? WHERE origin = ? AND source_id = ?", (pos, REMOTE, sid)
+                    )
+        self._touch()
+
+    def _manifest_pos(self, source_id: str) -> int:
+        row = self.conn.execute("SELECT MIN(pos) FROM manifest WHERE source_id = ?", (source_id,)).fetchone()
+        return -1 if row[0] is None else row[0]
+
+    def has_shard(self, source_id: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM shards WHERE source_id = ?", (source_id,)).fetchone() is not None
+
+    def load_shard(self, source_id: str) -> List[dict]:
+        return list(
+            self._rows("SELECT data FROM conferences WHERE origin = ? AND source_id = ? ORDER BY seq", (REMOTE, source_id))
+        )
+
+    def save_shard(self, source_id: str, conferences: Iterable[dict]) -> int:
+        with self.conn:
+            count = self._replace(REMOTE, conferences, source_id, self._manifest_pos(source_id))
+            self.conn.execute("INSERT OR REPLACE INTO shards (source_id, count) VALUES (?, ?)", (source_id, count))
+        self._touch()
+        return count
+
+    def delete_shard(self, source_id: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM conferences WHERE origin = ? AND source_id = ?", (REMOTE, source_id))
+            self.conn.execute("DELETE FROM shards WHERE source_id = ?", (source_id,))
+        self._touch()
+
+    def iter_remote_conferences(self) -> Iterator[dict]:
+        return self._rows(
+            "SELECT data FROM conferences WHERE origin = ? AND src_pos >= 0 ORDER BY src_pos, seq", (REMOTE,)
+        )
+
+    # ---- Queries ----
+
+    def sync_bundled(self, rows: Iterable[dict], digest: str) -> None:
+        """Mirror the packaged catalog into the database when it has changed."""
+        current = self.conn.execute("SELECT value FROM meta WHERE key = 'bundled'").fetchone()
+        if current is not None and current[0] == digest:
+            return
+        with self.conn:
+            self._replace(BUNDLED, rows)
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bundled', ?)", (digest,))
+
+    def catalog_rows(self) -> Tuple[List[int], List[Tuple[str, int, int]]]:
+        """Row ids and (json, start_ord, end_ord) of every catalog row, in merge priority order."""
+        ids: List[int] = []
+        rows: List[Tuple[str, int, int]] = []
+        for id_, data, start, end in self.conn.execute(
+            "SELECT id, data, start_ord, end_ord FROM conferences WHERE valid AND src_pos >= 0"
+            " ORDER BY origin, src_pos, seq"
+        ):
+            ids.append(id_)
+            rows.append((data, start, end))
+        return ids, rows
+
+    def merges_stamp(self) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'merges'").fetchone()
+        return None if row is None else row[0]
+
+    def save_merges(self, stamp: str, kept: Iterable[Tuple[int, dict]], absorbed: Iterable[int]) -> None:
+        """Replace the stored dedupe result, computed for catalog ``stamp``."""
+        with self.conn:
+            self.conn.execute("DELETE FROM merges")
+            self.conn.executemany(
+                "INSERT INTO merges (id, kept, data, topics_key) VALUES (?, 1, ?, ?)",
+                (
+                    (id_, json.dumps(row, ensure_ascii=False), _TOPIC_SEP.join(t.lower() for t in row["topics"]))
+                    for id_, row in kept
+                ),
+            )
+            self.conn.executemany("INSERT INTO merges (id, kept) VALUES (?, 0)", ((id_,) for id_ in absorbed))
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('merges', ?)", (stamp,))
+
+    def query(
+        self,
+        *,
+        topic: Optional[str] = None,
+        country: Optional[str] = None,
+        after_ord: Optional[int] = None,
+        before_ord: Optional[int] = None,
+    ) -> List[Tuple[str, int, int]]:
+        """(json, start_ord, end_ord) for the deduped catalog rows matching the filters.
+
+        Same semantics and order as core.filter_conferences over the merged
+        catalog, given an up-to-date ``merges`` table. Needles are lowercased
+        in Python and matched against the Python-lowercased key columns, so
+        results are exact; the trigram FTS table only narrows the candidates
+        for needles of three or more characters.
+        """
+        where = ["c.valid", "c.src_pos >= 0", "(m.kept IS NULL OR m.kept)"]
+        params: list = []
+        if after_ord is not None:
+            where.append("c.end_ord >= ?")
+            params.append(after_ord)
+        if before_ord is not None:
+            where.append("c.start_ord <= ?")
+            params.append(before_ord)
+        if country:
+            where.append("instr(c.country_key, ?) > 0")
+            params.append(country.lower())
+        if topic:
+            t = topic.lower()
+            if self.fts and len(t) >= 3:
+                # Merged records carry topics the FTS table has not seen
+                where.append(
+                    "(m.topics_key IS NOT NULL"
+                    " OR c.id IN (SELECT rowid FROM conferences_fts WHERE conferences_fts MATCH ?))"
+                )
+                params.append(_match_phrase(t))
+            where.append("(instr(c.name_key, ?) > 0 OR instr(COALESCE(m.topics_key, c.topics_key), ?) > 0)")
+            params.extend([t, t])
+        sql = (
+            "SELECT COALESCE(m.data, c.data), c.start_ord, c.end_ord"
+            " FROM conferences c LEFT JOIN merges m ON m.id = c.id WHERE "
+            + " AND ".join(where)
+            + " ORDER BY c.start_ord, c.origin, c.src_pos, c.seq"
+        )
+        return self.conn.execute(sql, params).fetchall()
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+import gc
 import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, List, Set
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from platformdirs import user_data_dir
 
+from . import timing
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still fsync'd, just not locked
+    fcntl = None
+
+if TYPE_CHECKING:
+    from .sqlite_backend import SqliteStore
+
 APP_NAME = "confradar"
+BACKENDS = ("json", "sqlite")
 
 
 def get_data_dir() -> Path:
@@ -23,25 +43,164 @@ def _file(path_name: str) -> Path:
 def load_json_list(path: Path) -> List[dict]:
     if not path.exists():
         return []
+    with timing.span("storage.load_json_list", file=path.name) as span:
+        try:
+            data = path.read_bytes()
+            span.set(bytes=len(data))
+            return json.loads(data.decode("utf-8"))
+        except Exception:
+            return []
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    _write_atomic_bytes(path, text.encode("utf-8"))
+
+
+def _write_atomic_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def save_json_list(path: Path, items: Iterable[dict]) -> None:
+    _write_atomic(path, json.dumps(list(items), indent=2, ensure_ascii=False))
+
+
+# ------------------------------- Backend ---------------------------------
+# JSON files are the default. The SQLite backend is opted into with
+# `confradar migrate` (recorded in config.json) or CONFRADAR_BACKEND, and
+# every load_*/save_* function below then goes through a SqliteStore.
+
+_local = threading.local()
+
+
+def load_config() -> dict:
+    path = _file("config.json")
+    if not path.exists():
+        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        config = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
+def save_config(config: dict) -> None:
+    _write_atomic(_file("config.json"), json.dumps(config, indent=2))
+
+
+def backend() -> str:
+    """Name of the active storage backend: "json" or "sqlite"."""
+    name = os.environ.get("CONFRADAR_BACKEND") or load_config().get("backend") or "json"
+    return name if name in BACKENDS else "json"
+
+
+def cache_compression() -> str:
+    """Codec for newly written remote shards: "none", "gzip" or "lzma"."""
+    name = os.environ.get("CONFRADAR_CACHE_COMPRESSION") or load_config().get("cache_compression") or "none"
+    return name if name in COMPRESSIONS else "none"
+
+
+def _open_store() -> SqliteStore:
+    from .sqlite_backend import SqliteStore
+
+    path = _file("confradar.db")
+    stores: Dict[Path, SqliteStore] = _local.__dict__.setdefault("stores", {})
+    if path not in stores:
+        stores[path] = SqliteStore(path, _file("confradar.db.stamp"))
+    return stores[path]
+
+
+def sqlite_store() -> Optional[SqliteStore]:
+    """This thread's SqliteStore when the SQLite backend is active, else None."""
+    return _open_store() if backend() == "sqlite" else None
+
+
+# ------------------------------- Journal ---------------------------------
+# On the JSON backend user conferences and stars are a compacted snapshot
+# (user_conferences.json, stars.json) plus an append-only JSONL journal of
+# later changes. A write appends and fsyncs one record under an exclusive
+# advisory lock, reads replay the journal over the snapshot under a shared
+# one, and once a journal grows past COMPACT_THRESHOLD bytes it is folded
+# back into its snapshot on a background thread.
+
+COMPACT_THRESHOLD = 64 * 1024
+
+_compactions: Dict[str, threading.Thread] = {}
+_compactions_lock = threading.Lock()
+
+
+@contextmanager
+def _locked(name: str, exclusive: bool) -> Iterator[None]:
+    """Hold the advisory lock guarding snapshot ``name`` and its journal."""
+    with _file(name + ".lock").open("a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _journal_file(name: str) -> Path:
+    return _file(name.rsplit(".", 1)[0] + ".journal")
+
+
+def _read_journal(name: str) -> List[dict]:
+    """Journal records in order; a torn final line from a crashed append is ignored."""
+    path = _journal_file(name)
+    if not path.exists():
         return []
+    records = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+    return records
 
 
-def save_json_list(path: Path, items: Iterable[dict]) -> None:
-    path.write_text(json.dumps(list(items), indent=2, ensure_ascii=False), encoding="utf-8")
+def _append_journal(name: str, record: dict) -> None:
+    path = _journal_file(name)
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _locked(name, exclusive=True):
+        with path.open("a+b") as f:
+            # Start a fresh line if the last append was torn
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        size = path.stat().st_size
+    if size > COMPACT_THRESHOLD:
+        _compact_in_background(name)
 
 
-def load_user_conferences() -> List[dict]:
-    return load_json_list(_file("user_conferences.json"))
+def _replay_user_conferences(snapshot: List[dict], journal: List[dict]) -> List[dict]:
+    conferences = list(snapshot)
+    for record in journal:
+        if record.get("op") == "add":
+            conferences.append(record["conference"])
+    return conferences
 
 
-def save_user_conferences(conferences: Iterable[dict]) -> None:
-    save_json_list(_file("user_conferences.json"), conferences)
+def _replay_stars(snapshot: Set[str], journal: List[dict]) -> Set[str]:
+    stars = set(snapshot)
+    for record in journal:
+        if record.get("op") == "star":
+            stars.add(record["name"])
+        elif record.get("op") == "unstar":
+            stars.discard(record["name"])
+    return stars
 
 
-def load_stars() -> Set[str]:
+def _read_json_stars() -> Set[str]:
     path = _file("stars.json")
     if not path.exists():
         return set()
@@ -51,26 +210,530 @@ def load_stars() -> Set[str]:
         return set()
 
 
+def _write_json_stars(starred_names: Iterable[str]) -> None:
+    _write_atomic(_file("stars.json"), json.dumps(sorted(starred_names), indent=2, ensure_ascii=False))
+
+
+def _load_json_user_conferences() -> List[dict]:
+    with _locked("user_conferences.json", exclusive=False):
+        return _replay_user_conferences(
+            load_json_list(_file("user_conferences.json")), _read_journal("user_conferences.json")
+        )
+
+
+def _save_json_user_conferences(conferences: Iterable[dict]) -> None:
+    with _locked("user_conferences.json", exclusive=True):
+        save_json_list(_file("user_conferences.json"), conferences)
+        _journal_file("user_conferences.json").unlink(missing_ok=True)
+
+
+def _load_json_stars() -> Set[str]:
+    with _locked("stars.json", exclusive=False):
+        return _replay_stars(_read_json_stars(), _read_journal("stars.json"))
+
+
+def _save_json_stars(starred_names: Iterable[str]) -> None:
+    with _locked("stars.json", exclusive=True):
+        _write_json_stars(starred_names)
+        _journal_file("stars.json").unlink(missing_ok=True)
+
+
+def compact_journal(name: str) -> None:
+    """Fold the journal of ``name`` ("user_conferences.json" or "stars.json") into its snapshot.
+
+    The snapshot is replaced atomically before the journal is removed, so a
+    crash in between only replays records that are already applied; adds are
+    not idempotent, which is why both steps happen under the exclusive lock.
+    """
+    with _locked(name, exclusive=True):
+        journal = _read_journal(name)
+        if not journal:
+            return
+        if name == "stars.json":
+            _write_json_stars(_replay_stars(_read_json_stars(), journal))
+        else:
+            save_json_list(_file(name), _replay_user_conferences(load_json_list(_file(name)), journal))
+        _journal_file(name).unlink()
+
+
+def _compact_in_background(name: str) -> None:
+    # Not a daemon: a CLI command that triggers compaction waits for it on exit
+    with _compactions_lock:
+        running = _compactions.get(name)
+        if running is not None and running.is_alive():
+            return
+        thread = threading.Thread(target=compact_journal, args=(name,), name=f"compact-{name}")
+        _compactions[name] = thread
+        thread.start()
+
+
+def wait_for_compaction() -> None:
+    """Block until every background compaction started by this process is done."""
+    with _compactions_lock:
+        threads = list(_compactions.values())
+    for thread in threads:
+        thread.join()
+
+
+# --------------------------- Conferences & stars -------------------------
+
+def load_user_conferences() -> List[dict]:
+    store = sqlite_store()
+    if store is not None:
+        return store.load_user_conferences()
+    return _load_json_user_conferences()
+
+
+def save_user_conferences(conferences: Iterable[dict]) -> None:
+    store = sqlite_store()
+    if store is not None:
+        store.save_user_conferences(conferences)
+        return
+    _save_json_user_conferences(conferences)
+
+
+def add_user_conference(conference: dict) -> None:
+    """Append one conference: a single-row insert, or one journal record on JSON."""
+    store = sqlite_store()
+    if store is not None:
+        store.add_user_conference(conference)
+        return
+    _append_journal("user_conferences.json", {"op": "add", "conference": conference})
+
+
+def load_stars() -> Set[str]:
+    store = sqlite_store()
+    if store is not None:
+        return store.load_stars()
+    return _load_json_stars()
+
+
 def save_stars(starred_names: Iterable[str]) -> None:
-    _file("stars.json").write_text(json.dumps(list(starred_names), indent=2), encoding="utf-8")
+    store = sqlite_store()
+    if store is not None:
+        store.save_stars(starred_names)
+        return
+    _save_json_stars(starred_names)
+
+
+def add_star(name: str) -> None:
+    store = sqlite_store()
+    if store is not None:
+        store.add_star(name)
+        return
+    _append_journal("stars.json", {"op": "star", "name": name})
+
+
+def remove_star(name: str) -> bool:
+    """Unstar ``name``; returns False if it was not starred."""
+    store = sqlite_store()
+    if store is not None:
+        return store.remove_star(name)
+    if name not in _load_json_stars():
+        return False
+    _append_journal("stars.json", {"op": "unstar", "name": name})
+    return True
+
+
+# ------------------------------ Record files -----------------------------
+# Shards are record files: a header naming the codec, then blocks of up to
+# RECORD_BLOCK rows. A block header holds its row count and payload size,
+# followed by the end offset of every row in the payload, which is the rows
+# as minified JSON in one array, compressed as a whole with gzip or lzma if
+# configured. Readers mmap the file and hop from block header to block
+# header, so skipped rows are neither decompressed nor decoded, and a block
+# that is read in full decodes with a single json.loads.
+
+RECORD_MAGIC = b"CRREC1"
+RECORD_BLOCK = 8192
+COMPRESSIONS = ("none", "gzip", "lzma")
+_FILE_HEADER = struct.Struct("<6sB")
+_BLOCK_HEADER = struct.Struct("<II")
+
+
+def _codec(compression: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """(compress, decompress) for a name in COMPRESSIONS; the modules load only when used."""
+    if compression == "gzip":
+        import gzip
+
+        return (lambda data: gzip.compress(data, compresslevel=6, mtime=0)), gzip.decompress
+    if compression == "lzma":
+        import lzma
+
+        return (lambda data: lzma.compress(data, preset=1)), lzma.decompress
+    if compression == "none":
+        return bytes, bytes
+    raise ValueError(f"unknown compression {compression!r}, expected one of {', '.join(COMPRESSIONS)}")
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Keep the cyclic GC out of a bulk decode.
+
+    Decoded rows hold no cycles, but allocating hundreds of thousands of
+    dicts and lists triggers collections that scan all of them, which is
+    most of a large load.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _offsets(data: bytes) -> array:
+    ends = array("I")
+    ends.frombytes(data)
+    if sys.byteorder == "big":
+        ends.byteswap()
+    return ends
+
+
+def write_records(path: Path, rows: Iterable[dict], compression: str = "none") -> int:
+    """Write ``rows`` to a record file; returns the row count.
+
+    The file is replaced only once every row has been written, so an error
+    raised by the ``rows`` iterator leaves the previous file intact.
+    """
+    compress = _codec(compression)[0]
+    tmp = path.with_name(path.name + ".tmp")
+    count = 0
+
+    def flush(f, block: List[bytes], ends: array) -> None:
+        payload = compress(b"[" + b",".join(block) + b"]")
+        if sys.byteorder == "big":
+            ends.byteswap()
+        f.write(_BLOCK_HEADER.pack(len(block), len(payload)))
+        f.write(ends.tobytes())
+        f.write(payload)
+
+    try:
+        with tmp.open("wb") as f:
+            f.write(_FILE_HEADER.pack(RECORD_MAGIC, COMPRESSIONS.index(compression)))
+            block: List[bytes] = []
+            ends = array("I")
+            end = 0
+            for row in rows:
+                data = json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                # Each row follows the "[" or the "," before it
+                end += 1 + len(data)
+                block.append(data)
+                ends.append(end)
+                count += 1
+                if len(block) == RECORD_BLOCK:
+                    flush(f, block, ends)
+                    block, ends, end = [], array("I"), 0
+            if block:
+                flush(f, block, ends)
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+    return count
+
+
+def iter_records(path: Path, start: int = 0, stop: Optional[int] = None) -> Iterator[dict]:
+    """Yield rows ``start`` up to ``stop`` of a record file.
+
+    Raises ValueError if ``path`` is not a record file or is truncated.
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _FILE_HEADER.size:
+            raise ValueError(f"{path.name}: not a record file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, codec = _FILE_HEADER.unpack_from(mm, 0)
+            if magic != RECORD_MAGIC or codec >= len(COMPRESSIONS):
+                raise ValueError(f"{path.name}: not a record file")
+            decompress = _codec(COMPRESSIONS[codec])[1]
+            pos = _FILE_HEADER.size
+            first = 0
+            while pos < size and (stop is None or first < stop):
+                if pos + _BLOCK_HEADER.size > size:
+                    raise ValueError(f"{path.name}: truncated block header")
+                n, stored = _BLOCK_HEADER.unpack_from(mm, pos)
+                offsets_at = pos + _BLOCK_HEADER.size
+                payload_at = offsets_at + 4 * n
+                pos = payload_at + stored
+                if pos > size:
+                    raise ValueError(f"{path.name}: truncated block")
+                lo = max(start - first, 0)
+                hi = n if stop is None else min(stop - first, n)
+                first += n
+                if lo >= hi:
+                    continue
+                payload = decompress(mm[payload_at:pos])
+                if lo > 0 or hi < n:
+                    ends = _offsets(mm[offsets_at:payload_at])
+                    begin = 1 if lo == 0 else ends[lo - 1] + 1
+                    payload = b"[" + payload[begin:ends[hi - 1]] + b"]"
+                with _gc_paused():
+                    rows = json.loads(payload)
+                yield from rows
+
+
+def count_records(path: Path) -> int:
+    """Number of rows in a record file, read from the block headers alone."""
+    with path.open("rb") as f:
+        f.seek(_FILE_HEADER.size)
+        total = 0
+        while True:
+            header = f.read(_BLOCK_HEADER.size)
+            if len(header) < _BLOCK_HEADER.size:
+                return total
+            n, stored = _BLOCK_HEADER.unpack(header)
+            total += n
+            f.seek(4 * n + stored, os.SEEK_CUR)
 
 
 # ------------------------------- Sources ---------------------------------
 
+def load_user_topic_rules() -> dict:
+    """User additions to the topic rule tables, see sources.NAME_TOPIC_RULES."""
+    path = _file("topic_rules.json")
+    if not path.exists():
+        return {}
+    try:
+        rules = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return rules if isinstance(rules, dict) else {}
+
+
 def load_sources() -> List[dict]:
     """Return list of source dicts. Example: {"type": "json", "url": "https://..."} or {"type": "file-json", "path": "/path"}."""
+    store = sqlite_store()
+    if store is not None:
+        return store.load_sources()
     return load_json_list(_file("sources.json"))
 
 
 def save_sources(sources: Iterable[dict]) -> None:
+    store = sqlite_store()
+    if store is not None:
+        store.save_sources(sources)
+        return
     save_json_list(_file("sources.json"), sources)
 
 
+# The remote cache is sharded: one file of normalized rows per source, keyed
+# by a stable source id, plus a small manifest listing the shards in source
+# order together with each source's HTTP validators and content hash. On the
+# SQLite backend shards are rows in the database; refresh still writes each
+# new shard to its file first and commit_remote_shard imports it.
+
+def _remote_dir() -> Path:
+    remote_dir = get_data_dir() / "remote"
+    remote_dir.mkdir(exist_ok=True)
+    return remote_dir
+
+
+def _shard_file(source_id: str) -> Path:
+    return _remote_dir() / f"{source_id}.rec"
+
+
+def _legacy_shard_file(source_id: str) -> Path:
+    # Shards written before the record format: one JSON array per source
+    return _remote_dir() / f"{source_id}.json"
+
+
+def _load_json_shard(source_id: str) -> List[dict]:
+    path = _shard_file(source_id)
+    if not path.exists():
+        return load_json_list(_legacy_shard_file(source_id))
+    with timing.span("storage.load_records", file=path.name) as span:
+        try:
+            with _gc_paused():
+                rows = list(iter_records(path))
+        except Exception:
+            return []
+        span.set(bytes=path.stat().st_size, rows=len(rows))
+        return rows
+
+
+def load_remote_manifest() -> List[dict]:
+    store = sqlite_store()
+    if store is not None:
+        return store.load_manifest()
+    return load_json_list(_remote_dir() / "manifest.json")
+
+
+def save_remote_manifest(entries: Iterable[dict]) -> None:
+    store = sqlite_store()
+    if store is not None:
+        store.save_manifest(entries)
+        return
+    save_json_list(_remote_dir() / "manifest.json", entries)
+    # The manifest supersedes the pre-shard merged file
+    legacy = _file("remote_conferences.json")
+    if legacy.exists():
+        legacy.unlink()
+
+
+def has_remote_shard(source_id: str) -> bool:
+    store = sqlite_store()
+    if store is not None:
+        return store.has_shard(source_id)
+    return _shard_file(source_id).exists() or _legacy_shard_file(source_id).exists()
+
+
+def load_remote_shard(source_id: str) -> List[dict]:
+    store = sqlite_store()
+    if store is not None:
+        return store.load_shard(source_id)
+    return _load_json_shard(source_id)
+
+
+def remote_shard_file(source_id: str) -> Path:
+    return _shard_file(source_id)
+
+
+def save_remote_shard(source_id: str, conferences: Iterable[dict]) -> int:
+    store = sqlite_store()
+    if store is not None:
+        return store.save_shard(source_id, conferences)
+    count = write_shard(_shard_file(source_id), conferences)
+    _legacy_shard_file(source_id).unlink(missing_ok=True)
+    return count
+
+
+def commit_remote_shard(source_id: str) -> None:
+    """Make a shard written to remote_shard_file() part of the cache.
+
+    On JSON that file already is the shard, and only a pre-record-format
+    shard of the same source is removed; the SQLite backend imports its rows
+    in one transaction and removes the file.
+    """
+    store = sqlite_store()
+    path = _shard_file(source_id)
+    if store is None:
+        _legacy_shard_file(source_id).unlink(missing_ok=True)
+        return
+    store.save_shard(source_id, iter_records(path))
+    path.unlink()
+
+
+def iter_shard_rows(path: Path) -> Iterator[dict]:
+    """Read back a file written by write_shard."""
+    return iter_records(path)
+
+
+def write_shard(path: Path, conferences: Iterable[dict]) -> int:
+    """Write rows to a shard record file, compressed as configured; returns the row count."""
+    return write_records(path, conferences, cache_compression())
+
+
+def remote_download_file(source_id: str) -> Path:
+    """Scratch file a source's response body is streamed into before ingestion."""
+    return _remote_dir() / f"{source_id}.download"
+
+
+def delete_remote_shard(source_id: str) -> None:
+    store = sqlite_store()
+    if store is not None:
+        store.delete_shard(source_id)
+    _shard_file(source_id).unlink(missing_ok=True)
+    _legacy_shard_file(source_id).unlink(missing_ok=True)
+
+
+def iter_remote_conferences() -> Iterator[dict]:
+    """Yield cached remote rows shard by shard, in manifest order."""
+    store = sqlite_store()
+    if store is not None:
+        yield from store.iter_remote_conferences()
+        return
+    manifest_path = _remote_dir() / "manifest.json"
+    if not manifest_path.exists():
+        # Pre-shard installs kept a single merged file
+        yield from load_json_list(_file("remote_conferences.json"))
+        return
+    for entry in load_remote_manifest():
+        yield from load_remote_shard(entry.get("id", ""))
+
+
 def load_remote_conferences() -> List[dict]:
-    return load_json_list(_file("remote_conferences.json"))
+    return list(iter_remote_conferences())
 
 
-def save_remote_conferences(conferences: Iterable[dict]) -> None:
-    save_json_list(_file("remote_conferences.json"), conferences)
+# ------------------------------- Migration -------------------------------
+
+def migrate_backend(target: str) -> Dict[str, int]:
+    """Copy user conferences, stars, sources and the remote cache to ``target``
+    and make it the configured backend. Returns the number of items copied.
+    """
+    if target not in BACKENDS:
+        raise ValueError(f"unknown backend {target!r}, expected one of {', '.join(BACKENDS)}")
+    store = _open_store()
+    if target == "sqlite":
+        manifest = load_json_list(_remote_dir() / "manifest.json")
+        if not manifest and _file("remote_conferences.json").exists():
+            # Pre-shard cache: keep it as an anonymous shard until the next refresh
+            manifest = [{"id": ""}]
+            shards = {"": load_json_list(_file("remote_conferences.json"))}
+        else:
+            shards = {e.get("id", ""): _load_json_shard(e.get("id", "")) for e in manifest}
+        user = _load_json_user_conferences()
+        stars = _load_json_stars()
+        sources = load_json_list(_file("sources.json"))
+        store.save_user_conferences(user)
+        store.save_stars(stars)
+        store.save_sources(sources)
+        store.save_manifest(manifest)
+        for sid, rows in shards.items():
+            store.save_shard(sid, rows)
+    else:
+        manifest = store.load_manifest()
+        user = store.load_user_conferences()
+        stars = store.load_stars()
+        sources = store.load_sources()
+        _save_json_user_conferences(user)
+        _save_json_stars(stars)
+        save_json_list(_file("sources.json"), sources)
+        for entry in manifest:
+            write_shard(_shard_file(entry.get("id", "")), store.load_shard(entry.get("id", "")))
+        save_json_list(_remote_dir() / "manifest.json", manifest)
+    save_config({**load_config(), "backend": target})
+    return {
+        "conferences": len(user),
+        "stars": len(stars),
+        "sources": len(sources),
+        "shards": len(manifest),
+    }
+
+
+# ------------------------------- Snapshot --------------------------------
+
+def catalog_input_files() -> List[Path]:
+    """Files in the data dir whose contents feed the merged catalog."""
+    if backend() == "sqlite":
+        # The database changes under WAL without touching its own mtime;
+        # every catalog write rewrites this stamp instead
+        return [_file("confradar.db.stamp")]
+    paths = [
+        _file("user_conferences.json"),
+        _journal_file("user_conferences.json"),
+        _file("remote_conferences.json"),
+        _remote_dir() / "manifest.json",
+    ]
+    for entry in load_remote_manifest():
+        paths.extend((_shard_file(entry.get("id", "")), _legacy_shard_file(entry.get("id", ""))))
+    return paths
+
+
+def load_catalog_snapshot() -> Optional[dict]:
+    """Return the compiled catalog snapshot, or None if missing or unreadable."""
+    path = _file("catalog.snapshot")
+    if not path.exists():
+        return None
+    try:
+        snap = marshal.loads(path.read_bytes())
+    except Exception:
+        return None
+    return snap if isinstance(snap, dict) else None
 
 
+def save_catalog_snapshot(snapshot: dict) -> None:
+    _write_atomic_bytes(_file("catalog.snapshot"), marshal.dumps(snapshot))
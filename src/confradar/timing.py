@@ -0,0 +1,103 @@
+"""Span timers behind ``confradar --profile``.
+
+Pipeline stages wrap themselves in ``span(name, **attrs)``. While timing is
+disabled (the default) ``span`` returns a shared no-op context manager, so
+instrumented code pays one global lookup and a call per stage. When enabled,
+each finished span is recorded as a dict with its name, start offset and
+duration in seconds, nesting depth and attributes such as byte or row counts.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+_enabled = False
+_origin = 0.0
+_records: List[Dict[str, Any]] = []
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "start", "depth")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]) -> None:
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes known only once the stage has run (counts, sizes)."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "_Span":
+        self.depth = getattr(_local, "depth", 0)
+        _local.depth = self.depth + 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter()
+        _local.depth = self.depth
+        record(self.name, end - self.start, start=self.start, depth=self.depth, **self.attrs)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, **attrs: Any):
+    """Time the enclosed block as stage ``name`` when timing is enabled."""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, attrs)
+
+
+def record(name: str, seconds: float, *, start: Optional[float] = None, depth: Optional[int] = None, **attrs: Any) -> None:
+    """Record a stage timed elsewhere, e.g. in a worker process."""
+    if not _enabled:
+        return
+    if start is None:
+        start = time.perf_counter() - seconds
+    if depth is None:
+        depth = getattr(_local, "depth", 0)
+    entry = {"name": name, "start": start - _origin, "seconds": seconds, "depth": depth, **attrs}
+    with _lock:
+        _records.append(entry)
+
+
+def enable() -> None:
+    """Start recording, discarding anything recorded before."""
+    global _enabled, _origin
+    with _lock:
+        _records.clear()
+    _origin = time.perf_counter()
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def spans() -> List[Dict[str, Any]]:
+    """Recorded spans ordered by start time, parents before their children."""
+    with _lock:
+        return sorted(_records, key=lambda r: (r["start"], r["depth"]))
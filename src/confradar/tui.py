@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from rich.align import Align
 from rich.console import Console
@@ -12,8 +15,9 @@ from rich.table import Table
 from rich import box
 from readchar import readkey, key as rkey
 
-from .core import Conference, filter_conferences, load_conferences
-from .storage import load_stars, save_stars
+from . import geo
+from .core import Conference, ConferenceIndex, filter_conferences, load_index
+from .storage import add_star, load_stars, remove_star
 from .sources import refresh_sources
 
 
@@ -24,21 +28,178 @@ class TuiState:
     offset: int = 0  # top index of the viewport
     topic_filter: Optional[str] = None
     country_filter: Optional[str] = None
+    near_filter: Optional[Tuple[str, float]] = None  # (place, radius in km)
     starred: set[str] = None
+    index: Optional[ConferenceIndex] = None
+    version: int = 0  # bumped whenever the catalog is replaced
+    status: Optional[str] = None  # background refresh progress, shown in the subtitle
+    search: Optional[str] = None  # applied name search; results are ranked by match
+    search_input: Optional[str] = None  # query being typed after "/", None outside search mode
+    _view_key: Optional[Tuple] = field(default=None, repr=False)
+    _view: Optional[List[Conference]] = field(default=None, repr=False)
+    _rows: Dict[int, Tuple[str, str, str, str]] = field(default_factory=dict, repr=False)
+    _rows_version: int = field(default=0, repr=False)
+    _hits_key: Optional[Tuple] = field(default=None, repr=False)
+    _hits: List[Conference] = field(default_factory=list, repr=False)
+    _search_key: Optional[Tuple] = field(default=None, repr=False)
+    _search_view: List[Conference] = field(default_factory=list, repr=False)
+
+    def set_catalog(self, index: ConferenceIndex) -> None:
+        """Swap in a new catalog, keeping the cursor on the same conference if it still exists."""
+        view = self.apply_filters()
+        current = view[self.cursor] if 0 <= self.cursor < len(view) else None
+        self.index = index
+        self.conferences = index.conferences
+        self.version += 1
+        view = self.apply_filters()
+        if current is not None:
+            key = (current.name, current.start_date, current.end_date)
+            for i, c in enumerate(view):
+                if (c.name, c.start_date, c.end_date) == key:
+                    self.cursor = i
+                    return
+        self.cursor = min(self.cursor, max(len(view) - 1, 0))
+
+    def row_cells(self, c: Conference) -> Tuple[str, str, str, str]:
+        """Dates, name, location and topics cells, formatted once per catalog version."""
+        if self._rows_version != self.version:
+            self._rows.clear()
+            self._rows_version = self.version
+        cells = self._rows.get(id(c))
+        if cells is None:
+            cells = (
+                f"{c.start_dt():%Y-%m-%d} → {c.end_dt():%Y-%m-%d}",
+                c.name,
+                f"{c.city}, {c.country}",
+                ", ".join(c.topics),
+            )
+            self._rows[id(c)] = cells
+        return cells
+
+    def set_search(self, query: Optional[str], hits: Optional[List[Conference]] = None) -> None:
+        """Apply a name search; ``hits`` are its ranked results if already computed off-thread."""
+        self.search = query.strip() if query and query.strip() else None
+        if self.search is not None and hits is not None:
+            self._hits_key, self._hits = (self.search, self.version), hits
+        self.cursor = 0
+
+    def search_hits(self) -> List[Conference]:
+        """Ranked matches for ``search``, memoized per query and catalog version."""
+        key = (self.search, self.version)
+        if self._hits_key != key:
+            if self.index is None:
+                self.index = ConferenceIndex(self.conferences)
+            self._hits_key, self._hits = key, search_catalog(self.index, self.search)
+        return self._hits
 
     def apply_filters(self) -> List[Conference]:
-        return filter_conferences(
-            self.conferences,
-            topic=self.topic_filter,
-            country=self.country_filter,
-        )
+        """The rows to show: search results (best first) within the filtered view, or the filtered view."""
+        filtered = self._filtered()
+        if not self.search:
+            return filtered
+        key = (self.search, self._view_key)
+        if self._search_key != key:
+            hits = self.search_hits()
+            if self.topic_filter or self.country_filter or self.near_filter:
+                allowed = {id(c) for c in filtered}
+                hits = [c for c in hits if id(c) in allowed]
+            self._search_key, self._search_view = key, hits
+        return self._search_view
+
+    def _filtered(self) -> List[Conference]:
+        """Filtered view, memoized on (topic, country, near, catalog version).
+
+        When the new filters only narrow the previous ones (each substring
+        extends the old one, the place and radius are unchanged), the view is
+        derived from the previous result instead of the whole catalog.
+        """
+        key = (self.topic_filter, self.country_filter, self.near_filter, self.version)
+        if self._view is not None and self._view_key == key:
+            return self._view
+        prev_key, prev = self._view_key, self._view
+        if (
+            prev is not None
+            and prev_key[2:] == key[2:]
+            and (prev_key[0] or prev_key[1] or prev_key[2])  # an unfiltered view is the whole catalog
+            and _narrows(prev_key[0], self.topic_filter)
+            and _narrows(prev_key[1], self.country_filter)
+        ):
+            view = filter_conferences(
+                prev,
+                topic=self.topic_filter if self.topic_filter != prev_key[0] else None,
+                country=self.country_filter if self.country_filter != prev_key[1] else None,
+            )
+        else:
+            if self.index is None:
+                self.index = ConferenceIndex(self.conferences)
+            near, radius_km = self.near_filter or (None, geo.DEFAULT_RADIUS_KM)
+            view = self.index.query(topic=self.topic_filter, country=self.country_filter, near=near, radius_km=radius_km)
+        self._view_key, self._view = key, view
+        return view
+
+
+SEARCH_LIMIT = 200
+SEARCH_DEBOUNCE_S = 0.08
+
+
+def search_catalog(index: ConferenceIndex, query: Optional[str]) -> List[Conference]:
+    if not query:
+        return []
+    return [c for c, _ in index.search(query, limit=SEARCH_LIMIT)]
+
+
+def _narrows(old: Optional[str], new: Optional[str]) -> bool:
+    """True if every row matching ``new`` also matches ``old``."""
+    if not old:
+        return True
+    return bool(new) and old.lower() in new.lower()
+
+
+def parse_near(answer: str) -> Optional[Tuple[str, float]]:
+    """(place, radius) from the "n" prompt: a place, optionally followed by a radius in km.
+
+    Raises ValueError for places the bundled city table does not know.
+    """
+    place, radius_km = answer.strip(), geo.DEFAULT_RADIUS_KM
+    head, _, tail = place.rpartition(" ")
+    if head:
+        try:
+            radius_km = float(tail.removesuffix("km"))
+        except ValueError:
+            pass
+        else:
+            place = head.strip()
+    if not place:
+        return None
+    geo.resolve(place)
+    return place, max(radius_km, 0.0)
 
 
 HELP = """
-↑/↓: Move  PgUp/PgDn/Space: Page  Home/End: Jump  Enter: Open  f: Star  t: Topic  c: Country  x: Clear  r: Refresh  q: Quit
+↑/↓: Move  PgUp/PgDn/Space: Page  Home/End: Jump  Enter: Open  f: Star  /: Search  t: Topic  c: Country  n: Near  x: Clear  r: Refresh  q: Quit
 """
 
 
+# Called with the wall time, in seconds, of every frame drawn by run_tui.
+# Setting CONFRADAR_FRAME_TIMES=1 prints a summary when the TUI exits.
+frame_hook: Optional[Callable[[float], None]] = None
+
+_DATES_WIDTH = 23  # "YYYY-MM-DD → YYYY-MM-DD"
+# Panel border and padding, table edges, column separators and cell padding
+_CHROME_WIDTH = 4 + 2 + 4 + 5 * 2
+
+
+def _column_widths(total_width: int) -> Tuple[int, int, int]:
+    """Fixed Name/Location/Topics widths for a terminal width.
+
+    Giving Rich fixed widths spares it from measuring every cell on each frame.
+    """
+    free = max(24, total_width - _CHROME_WIDTH - 2 - _DATES_WIDTH)
+    name = max(8, free * 40 // 100)
+    loc = max(8, free * 25 // 100)
+    return name, loc, max(8, free - name - loc)
+
+
 def render(state: TuiState, console: Console | None = None) -> Panel:
     console = console or Console()
     filtered = state.apply_filters()
@@ -59,29 +220,145 @@ def render(state: TuiState, console: Console | None = None) -> Panel:
     start = state.offset
     end = min(start + page_size, total)
 
+    name_w, loc_w, topics_w = _column_widths(console.size.width if console.size else 80)
     table = Table(box=box.SIMPLE_HEAVY, expand=True)
-    table.add_column(" ", no_wrap=True)
-    table.add_column("Dates", style="cyan", no_wrap=True)
-    table.add_column("Name", style="bold")
-    table.add_column("Location", style="magenta")
-    table.add_column("Topics", style="green")
+    table.add_column(" ", no_wrap=True, width=2)
+    table.add_column("Dates", style="cyan", no_wrap=True, width=_DATES_WIDTH)
+    table.add_column("Name", style="bold", no_wrap=True, overflow="ellipsis", width=name_w)
+    table.add_column("Location", style="magenta", no_wrap=True, overflow="ellipsis", width=loc_w)
+    table.add_column("Topics", style="green", no_wrap=True, overflow="ellipsis", width=topics_w)
 
+    # Only the viewport is laid out; cells come from the row cache and just
+    # the cursor/star column is computed per frame.
     for global_idx in range(start, end):
         c = filtered[global_idx]
-        dates = f"{c.start_dt():%Y-%m-%d} → {c.end_dt():%Y-%m-%d}"
-        loc = f"{c.city}, {c.country}"
-        topics = ", ".join(c.topics)
         is_cursor = global_idx == state.cursor
         is_star = c.name in state.starred
         cursor_cell = ("➤" if is_cursor else " ") + ("★" if is_star else " ")
         style = "reverse" if is_cursor else ""
-        table.add_row(cursor_cell, dates, c.name, loc, topics, style=style)
+        table.add_row(cursor_cell, *state.row_cells(c), style=style)
 
     range_str = f"{start + 1 if total else 0}–{end} of {total}"
-    subtitle = f"{range_str}    Filters: topic=[{state.topic_filter or '-'}] country=[{state.country_filter or '-'}]  |  {HELP.strip()}"
+    if state.status:
+        range_str = f"{range_str}  [{state.status}]"
+    near = f"{state.near_filter[0]} ≤{state.near_filter[1]:g}km" if state.near_filter else "-"
+    filters = f"Filters: topic=[{state.topic_filter or '-'}] country=[{state.country_filter or '-'}] near=[{near}]"
+    if state.search_input is not None:
+        filters = f"Search: /{state.search_input}▏ (Enter: keep, Esc: clear)  {filters}"
+    elif state.search:
+        filters = f"Search: [{state.search}]  {filters}"
+    subtitle = f"{range_str}    {filters}  |  {HELP.strip()}"
     return Panel(table, title="Confradar TUI", subtitle=subtitle, border_style="bright_blue")
 
 
+def _draw(live: Live, state: TuiState, console: Console) -> None:
+    t0 = time.perf_counter()
+    live.update(render(state, console), refresh=True)
+    if frame_hook is not None:
+        frame_hook(time.perf_counter() - t0)
+
+
+def _print_frame_stats(samples: List[float]) -> None:
+    if not samples:
+        return
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"frames={len(samples)} mean={sum(samples) / len(samples) * 1000:.2f}ms "
+        f"p95={p95 * 1000:.2f}ms max={ordered[-1] * 1000:.2f}ms"
+    )
+
+
+def _source_label(src: dict) -> str:
+    return str(src.get("url") or src.get("path") or "?").rsplit("/", 1)[-1]
+
+
+class _BackgroundRefresh:
+    """Runs refresh_sources on a worker thread and swaps the catalog in when done.
+
+    ``lock`` guards ``state``; ``redraw`` is called (with the lock held) after
+    every progress update and once the new catalog is in place.
+    """
+
+    def __init__(self, state: TuiState, lock: threading.RLock, redraw: Callable[[], None]) -> None:
+        self.state = state
+        self.lock = lock
+        self.redraw = redraw
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self) -> bool:
+        if self.running:
+            return False
+        with self.lock:
+            self.state.status = "refreshing…"
+            self.redraw()
+        self.thread = threading.Thread(target=self._work, name="confradar-refresh", daemon=True)
+        self.thread.start()
+        return True
+
+    def _progress(self, done: int, total: int, src: dict, status: str) -> None:
+        with self.lock:
+            self.state.status = f"refreshing {done}/{total} · {_source_label(src)} {status}"
+            self.redraw()
+
+    def _work(self) -> None:
+        try:
+            summary = refresh_sources(on_progress=self._progress)
+            index = load_index()
+        except Exception as exc:
+            with self.lock:
+                self.state.status = f"refresh failed: {exc}"
+                self.redraw()
+            return
+        with self.lock:
+            self.state.set_catalog(index)
+            failed = f", {summary.failed} source(s) failed" if summary.failed else ""
+            self.state.status = f"refreshed {summary.count} conferences{failed}"
+            self.redraw()
+
+
+class _Debouncer:
+    """Calls ``fn`` on a timer thread once no call has come in for ``delay`` seconds."""
+
+    def __init__(self, delay: float, fn: Callable[[], None]) -> None:
+        self.delay = delay
+        self.fn = fn
+        self._timer: Optional[threading.Timer] = None
+
+    def __call__(self) -> None:
+        self.cancel()
+        self._timer = threading.Timer(self.delay, self.fn)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+def _search_updater(state: TuiState, lock: threading.RLock, redraw: Callable[[], None]) -> Callable[[], None]:
+    """Run the typed search outside the lock, so keystrokes never wait on it, then show it."""
+
+    def update() -> None:
+        with lock:
+            query, index, version = state.search_input, state.index, state.version
+        if query is None:
+            return
+        hits = search_catalog(index, query.strip()) if index is not None else None
+        with lock:
+            # Drop results for a query that was edited or a catalog that was replaced meanwhile
+            if state.search_input == query and state.version == version:
+                state.set_search(query, hits)
+                redraw()
+
+    return update
+
+
 def _open_url(url: str) -> None:
     import webbrowser
 
@@ -92,64 +369,116 @@ def _open_url(url: str) -> None:
 
 
 def run_tui(console: Console | None = None) -> None:
-    console = console or Console()
-    state = TuiState(conferences=load_conferences(), starred=load_stars())
+    global frame_hook
+    samples: List[float] = []
+    if frame_hook is None and os.environ.get("CONFRADAR_FRAME_TIMES"):
+        frame_hook = samples.append
+    try:
+        _run(console or Console())
+    finally:
+        if frame_hook == samples.append:
+            frame_hook = None
+            _print_frame_stats(samples)
+
+
+def _ask(console: Console, what: str) -> str:
+    console.print(f"Enter {what} (blank to cancel): ", end="")
+    return console.input("")
+
+
+def _run(console: Console) -> None:
+    index = load_index()
+    state = TuiState(conferences=index.conferences, index=index, starred=load_stars())
+    lock = threading.RLock()
 
     with Live(render(state, console), console=console, refresh_per_second=30, screen=True) as live:
+        redraw = lambda: _draw(live, state, console)  # noqa: E731
+        refresher = _BackgroundRefresh(state, lock, redraw)
+        debounce = _Debouncer(SEARCH_DEBOUNCE_S, _search_updater(state, lock, redraw))
         while True:
             ch = readkey()
-            items = state.apply_filters()
-            if ch in {"q", "Q"}:
-                save_stars(state.starred or set())
-                return
-            if ch in {rkey.UP, "k", "K"}:
-                state.cursor = max(0, state.cursor - 1)
-            elif ch in {rkey.DOWN, "j", "J"}:
-                state.cursor = min(max(len(items) - 1, 0), state.cursor + 1)
-            elif ch in {rkey.PAGE_UP, "b", "B"}:
-                height = console.size.height if console.size else 24
-                page = max(5, height - 10)
-                state.cursor = max(0, state.cursor - page)
-            elif ch in {rkey.PAGE_DOWN, " ", "f", "F"}:
-                height = console.size.height if console.size else 24
-                page = max(5, height - 10)
-                state.cursor = min(max(len(items) - 1, 0), state.cursor + page)
-            elif ch in {rkey.HOME, "g"}:
-                state.cursor = 0
-            elif ch in {rkey.END, "G"}:
-                state.cursor = max(len(items) - 1, 0)
-            elif ch in {rkey.ENTER, "\r", "\n", "o", "O"} and items:
-                _open_url(items[state.cursor].url)
-            elif ch in {"t", "T"}:
-                console.print("Enter topic (blank to cancel): ", end="")
-                t = console.input("")
-                state.topic_filter = t or None
-                state.cursor = 0
+            if state.search_input is not None and ch not in {rkey.UP, rkey.DOWN, rkey.PAGE_UP, rkey.PAGE_DOWN}:
+                # Search mode: keystrokes only edit the query; the search itself
+                # runs once typing pauses
+                with lock:
+                    if ch == rkey.ESC:
+                        debounce.cancel()
+                        state.search_input = None
+                        state.set_search(None)
+                    elif ch in {rkey.ENTER, "\r", "\n"}:
+                        debounce.cancel()
+                        query, state.search_input = state.search_input, None
+                        state.set_search(query)
+                    elif ch in {rkey.BACKSPACE, "\x08", "\x7f"}:
+                        state.search_input = state.search_input[:-1]
+                        debounce()
+                    elif len(ch) == 1 and ch.isprintable():
+                        state.search_input += ch
+                        debounce()
+                    redraw()
+                continue
+            # Prompts block on input, so read them before taking the lock
+            answer = None
+            if ch in {"t", "T"}:
+                answer = _ask(console, "topic")
             elif ch in {"c", "C"}:
-                console.print("Enter country (blank to cancel): ", end="")
-                c = console.input("")
-                state.country_filter = c or None
-                state.cursor = 0
-            elif ch in {"x", "X"}:
-                state.topic_filter = None
-                state.country_filter = None
-                state.cursor = 0
-            elif ch in {"*"} and items:
-                name = items[state.cursor].name
-                if name in (state.starred or set()):
-                    state.starred.remove(name)
-                else:
-                    if state.starred is None:
-                        state.starred = set()
-                    state.starred.add(name)
-            elif ch in {"r", "R"}:
-                # Refresh sources and reload list
-                try:
-                    refresh_sources()
-                except Exception:
-                    pass
-                state.conferences = load_conferences()
-                state.cursor = 0
-            live.update(render(state, console))
-
-
+                answer = _ask(console, "country")
+            elif ch in {"n", "N"}:
+                answer = _ask(console, 'place and radius in km, e.g. "Berlin 200"')
+            with lock:
+                items = state.apply_filters()
+                if ch in {"q", "Q"}:
+                    return
+                if ch in {rkey.UP, "k", "K"}:
+                    state.cursor = max(0, state.cursor - 1)
+                elif ch in {rkey.DOWN, "j", "J"}:
+                    state.cursor = min(max(len(items) - 1, 0), state.cursor + 1)
+                elif ch in {rkey.PAGE_UP, "b", "B"}:
+                    height = console.size.height if console.size else 24
+                    page = max(5, height - 10)
+                    state.cursor = max(0, state.cursor - page)
+                elif ch in {rkey.PAGE_DOWN, " ", "f", "F"}:
+                    height = console.size.height if console.size else 24
+                    page = max(5, height - 10)
+                    state.cursor = min(max(len(items) - 1, 0), state.cursor + page)
+                elif ch in {rkey.HOME, "g"}:
+                    state.cursor = 0
+                elif ch in {rkey.END, "G"}:
+                    state.cursor = max(len(items) - 1, 0)
+                elif ch in {rkey.ENTER, "\r", "\n", "o", "O"} and items:
+                    _open_url(items[state.cursor].url)
+                elif ch in {"t", "T"}:
+                    state.topic_filter = answer or None
+                    state.cursor = 0
+                elif ch in {"c", "C"}:
+                    state.country_filter = answer or None
+                    state.cursor = 0
+                elif ch in {"n", "N"}:
+                    try:
+                        state.near_filter = parse_near(answer or "")
+                    except ValueError as exc:
+                        state.status = str(exc)
+                    else:
+                        state.cursor = 0
+                elif ch == "/":
+                    state.search_input = state.search or ""
+                elif ch in {"x", "X"}:
+                    state.topic_filter = None
+                    state.country_filter = None
+                    state.near_filter = None
+                    state.set_search(None)
+                elif ch in {"*"} and items:
+                    name = items[state.cursor].name
+                    # Journal each toggle so stars set elsewhere meanwhile survive
+                    if name in (state.starred or set()):
+                        state.starred.remove(name)
+                        remove_star(name)
+                    else:
+                        if state.starred is None:
+                            state.starred = set()
+                        state.starred.add(name)
+                        add_star(name)
+                elif ch in {"r", "R"}:
+                    # Refresh sources in the background; navigation stays live
+                    refresher.start()
+                _draw(live, state, console)
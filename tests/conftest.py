@@ -0,0 +1,14 @@
+from pathlib import Path
+
+import pytest
+
+from confradar import storage
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep every test away from the real per-user data dir."""
+    data_dir = Path(tmp_path) / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(storage, "get_data_dir", lambda: data_dir)
+    return data_dir
@@ -1,10 +1,15 @@
+import csv
+import io
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 from typer.testing import CliRunner
 
 from confradar.cli import app
-from confradar import storage
+from confradar import storage, timing
 
 
 def test_cli_add_and_list(tmp_path, monkeypatch):
@@ -38,4 +43,83 @@ def test_cli_add_and_list(tmp_path, monkeypatch):
     # output should contain our TestConf
     assert "TestConf" in result2.stdout
 
+    # add only appends; the stale snapshot is rebuilt by the next read
+    snapshot = tmp_path / "catalog.snapshot"
+    built = snapshot.stat().st_mtime_ns
+    common = ["--city", "X", "--country", "Y", "--url", "https://example.com", "--topics", "ai"]
+    assert runner.invoke(app, ["add", "LaterConf", "--start-date", "2025-08-01", "--end-date", "2025-08-01", *common]).exit_code == 0
+    assert snapshot.stat().st_mtime_ns == built
+    assert "LaterConf" in runner.invoke(app, ["list", "--topic", "ai"]).stdout
 
+
+def test_cli_list_date_window_and_add_rejects_bad_dates():
+    runner = CliRunner()
+    common = ["--city", "X", "--country", "Y", "--url", "https://example.com"]
+    ok = runner.invoke(app, ["add", "WindowConf", "--start-date", "2031-03-01", "--end-date", "2031-03-02", *common])
+    assert ok.exit_code == 0
+    bad = runner.invoke(app, ["add", "BadConf", "--start-date", "2031-03-05", "--end-date", "2031-03-01", *common])
+    assert bad.exit_code == 2
+
+    result = runner.invoke(app, ["list", "--after", "2031-01-01", "--before", "2031-12-31"])
+    assert result.exit_code == 0
+    assert "WindowConf" in result.stdout
+    assert "BadConf" not in result.stdout
+
+
+def test_light_commands_skip_http_and_tui_imports(tmp_path):
+    # Run each command in a fresh interpreter and report which heavy modules it loaded
+    script = (
+        "import sys\n"
+        "from confradar.cli import app\n"
+        "try:\n"
+        "    app(sys.argv[1:])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('httpx', 'readchar', 'confradar.sources', 'confradar.tui')\n"
+        "print('LOADED:', *[m for m in heavy if m in sys.modules])\n"
+    )
+    env = {**os.environ, "XDG_DATA_HOME": str(tmp_path)}
+    for args in (["list"], ["star", "X"], ["--help"]):
+        out = subprocess.run([sys.executable, "-c", script, *args], env=env, capture_output=True, text=True)
+        assert out.stdout.rstrip().splitlines()[-1] == "LOADED:", (args, out.stdout, out.stderr)
+
+
+def test_profile_json_records_pipeline_spans(tmp_path):
+    out = tmp_path / "profile.json"
+    result = CliRunner().invoke(app, ["--profile-json", str(out), "list", "--topic", "python"])
+    assert result.exit_code == 0
+    spans = json.loads(out.read_text(encoding="utf-8"))
+    names = [s["name"] for s in spans]
+    assert names[0] == "core.load_catalog"
+    assert {"core.filter_conferences", "cli.render_list"} <= set(names)
+    assert all(s["seconds"] >= 0 and s["depth"] >= 0 for s in spans)
+
+    # Reporting switches recording back off
+    assert not timing.is_enabled()
+    assert timing.span("x") is timing.span("y")
+
+
+def test_list_streams_machine_readable_formats_with_paging():
+    runner = CliRunner()
+    common = ["--city", "X", "--country", "Y", "--url", "https://example.com", "--topics", "a,b"]
+    for i in range(3):
+        day = f"2031-03-0{i + 1}"
+        assert runner.invoke(app, ["add", f"Fmt, Conf {i}", "--start-date", day, "--end-date", day, *common]).exit_code == 0
+    window = ["--after", "2031-01-01"]
+
+    lines = runner.invoke(app, ["list", *window, "--format", "jsonl", "--offset", "1"]).stdout.splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["Fmt, Conf 1", "Fmt, Conf 2"]
+    assert json.loads(lines[0])["topics"] == ["a", "b"]
+
+    out = runner.invoke(app, ["list", *window, "--format", "json", "--limit", "2"]).stdout
+    assert [r["name"] for r in json.loads(out)] == ["Fmt, Conf 0", "Fmt, Conf 1"]
+    assert json.loads(runner.invoke(app, ["list", *window, "-f", "json", "--offset", "5"]).stdout) == []
+
+    out = runner.invoke(app, ["list", *window, "-f", "csv", "--limit", "2"]).stdout
+    rows = list(csv.reader(io.StringIO(out)))
+    assert rows[0][:3] == ["name", "start_date", "end_date"]
+    assert [r[0] for r in rows[1:]] == ["Fmt, Conf 0", "Fmt, Conf 1"] and rows[1][-1] == "a;b"
+
+    out = runner.invoke(app, ["list", *window, "-f", "tsv", "--offset", "5"]).stdout
+    assert out == "name\tstart_date\tend_date\tcity\tcountry\turl\ttopics\n"
+    assert runner.invoke(app, ["list", "-f", "xml"]).exit_code == 2
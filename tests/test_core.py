@@ -1,5 +1,11 @@
+import marshal
+import os
+import random
 import types
-from confradar import core
+
+import pytest
+
+from confradar import core, geo, storage
 
 
 def test_filter_conferences_topic_filter():
@@ -33,3 +39,306 @@ def test_load_conferences_uses_bundled(monkeypatch):
     assert confs and isinstance(confs[0], core.Conference)
 
 
+def test_load_conferences_serves_fresh_snapshot(isolated_data_dir, monkeypatch):
+    storage.save_user_conferences(
+        [{"name": "Early", "start_date": "2000-01-01", "end_date": "2000-01-02", "city": "X", "country": "Y", "url": "u", "topics": []}]
+    )
+    cold = core.load_conferences()
+    assert cold[0].name == "Early"
+    assert (isolated_data_dir / "catalog.snapshot").exists()
+
+    def boom():
+        raise AssertionError("snapshot should have been used")
+
+    monkeypatch.setattr(core, "_merge_sources", boom)
+    user_file = isolated_data_dir / "user_conferences.json"
+    st = user_file.stat()
+    os.utime(user_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))  # touched, same content
+    assert core.load_conferences() == cold
+
+    monkeypatch.undo()
+    monkeypatch.setattr(storage, "get_data_dir", lambda: isolated_data_dir)
+    storage.save_user_conferences([])
+    assert all(c.name != "Early" for c in core.load_conferences())
+
+
+def test_conference_parses_dates_once_and_rejects_malformed(isolated_data_dir):
+    row = {"name": "A", "start_date": "2025-03-01", "end_date": "2025-03-02", "city": "X", "country": "Y", "url": "u", "topics": ["t"]}
+    c = core.Conference(**row)
+    assert c.end_ord - c.start_ord == 1
+    assert c.to_dict() == row and core.Conference(**c.to_dict()) == c
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(ValueError):
+        core.Conference(**{**row, "start_date": "2025-13-40"})
+    with pytest.raises(ValueError):
+        core.Conference(**{**row, "end_date": "2025-02-01"})
+
+    storage.save_user_conferences([row, {**row, "name": "Broken", "start_date": "soon"}])
+    names = [c.name for c in core.load_conferences()]
+    assert "A" in names and "Broken" not in names
+
+
+def test_conference_index_matches_filter_conferences():
+    rng = random.Random(7)
+    words = ["PyCon", "KubeCon", "JSConf", "DevOpsDays", "AI Summit", "Data", "Cloud", "Rust"]
+    topics = ["python", "javascript", "ai", "machine learning", "devops", "data science", "rust"]
+    countries = ["USA", "Germany", "India", "United Kingdom", "Online", ""]
+    confs = []
+    for i in range(400):
+        start = rng.randint(738000, 738400)
+        confs.append(
+            core.Conference(
+                name=f"{rng.choice(words)} {rng.choice(words)} {i}",
+                start_date=core.datetime.fromordinal(start).date().isoformat(),
+                end_date=core.datetime.fromordinal(start + rng.randint(0, 4)).date().isoformat(),
+                city="X",
+                country=rng.choice(countries),
+                url="https://example.com",
+                topics=rng.sample(topics, rng.randint(0, 3)),
+            )
+        )
+    index = core.ConferenceIndex(confs)
+    restored = core.ConferenceIndex(index.conferences, state=index.to_state())
+    queries = [
+        {},
+        {"topic": "py"},
+        {"topic": "Con"},
+        {"topic": "ops"},
+        {"topic": "learn", "country": "an"},
+        {"topic": "a"},
+        {"topic": "zzz"},
+        {"country": "us"},
+        {"country": "united kingdom", "after": "2021-08-01"},
+        {"topic": "data", "after": "2021-06-01", "before": "2021-09-30"},
+    ]
+    for q in queries:
+        expected = core.filter_conferences(confs, **q)
+        assert index.query(**q) == expected, q
+        assert restored.query(**q) == expected, q
+        assert core.filter_conferences(index, **q) == expected, q
+
+
+def test_conference_index_date_windows_match_linear_scan():
+    rng = random.Random(11)
+    confs = []
+    for i in range(300):
+        start = rng.randint(738000, 738200)
+        # A few long-running events exercise the running max of end dates
+        length = rng.choice([0, 1, 2, 3, 60])
+        confs.append(
+            core.Conference(
+                name=f"C{i}",
+                start_date=core.datetime.fromordinal(start).date().isoformat(),
+                end_date=core.datetime.fromordinal(start + length).date().isoformat(),
+                city="X",
+                country=rng.choice(["USA", "Germany"]),
+                url="u",
+                topics=[rng.choice(["python", "rust"])],
+            )
+        )
+    index = core.ConferenceIndex(confs)
+    day = lambda o: core.datetime.fromordinal(o).date().isoformat()  # noqa: E731
+    for _ in range(200):
+        a = rng.randint(737990, 738280)
+        b = a + rng.randint(-5, 40)
+        q = rng.choice([{"after": day(a)}, {"before": day(b)}, {"after": day(a), "before": day(b)}])
+        if rng.random() < 0.5:
+            q["topic"] = rng.choice(["py", "rust", "C1"])
+        assert index.query(**q) == core.filter_conferences(confs, **q), q
+
+
+def test_date_filters_compare_whole_days_on_every_engine(isolated_data_dir, monkeypatch):
+    def row(name, start, end):
+        return {"name": name, "start_date": start, "end_date": end, "city": "", "country": "Z", "url": "", "topics": ["zz"]}
+
+    rows = [
+        row("Ends Morning", "2031-06-30", "2031-07-01T09:00:00"),
+        row("Ends Midnight", "2031-06-30", "2031-07-01"),
+        row("Starts Evening", "2031-07-02T18:00:00", "2031-07-03"),
+        row("Later", "2031-07-04", "2031-07-05"),
+    ]
+    # Times of day are ignored on both sides: a datetime bound means its whole day
+    cases = {
+        ("2031-07-01T12:00:00", None): ["Ends Morning", "Ends Midnight", "Starts Evening", "Later"],
+        ("2031-07-02", None): ["Starts Evening", "Later"],
+        (None, "2031-07-02T06:00:00"): ["Ends Morning", "Ends Midnight", "Starts Evening"],
+        (None, "2031-07-01"): ["Ends Morning", "Ends Midnight"],
+        ("2031-07-01T23:59:59", "2031-07-02T00:00:00"): ["Ends Morning", "Ends Midnight", "Starts Evening"],
+    }
+    for backend in ("json", "sqlite"):
+        monkeypatch.setenv("CONFRADAR_BACKEND", backend)
+        storage.save_user_conferences(rows)
+        confs = [c for c in core.load_conferences() if c.country == "Z"]
+        engines = (confs, core.ConferenceIndex(confs), core.open_catalog())
+        for (after, before), expected in cases.items():
+            for engine in engines:
+                got = [c.name for c in core.filter_conferences(engine, topic="zz", after=after, before=before)]
+                assert got == expected, (backend, type(engine).__name__, after, before)
+
+
+def test_conference_index_search_ranks_fuzzy_name_matches():
+    def conf(name, topics=(), start="2025-01-01"):
+        return core.Conference(name, start, start, "X", "Y", "https://example.com", list(topics))
+
+    confs = [
+        conf("KubeCon + CloudNativeCon Europe"),
+        conf("KubeCon India", start="2025-12-01"),
+        conf("PyCon US"),
+        conf("EuroPython", ["python"]),
+        conf("JSConf", ["javascript"]),
+    ]
+    index = core.ConferenceIndex(confs)
+
+    # Typos still match; the shorter, closer name wins the tie
+    assert [(c.name, s) for c, s in index.search("kubcon")] == [
+        ("KubeCon India", 0.5),
+        ("KubeCon + CloudNativeCon Europe", 0.5),
+    ]
+    # Prefix matches come before other substring matches
+    assert [c.name for c, _ in index.search("py")] == ["PyCon US", "EuroPython"]
+    assert [c.name for c, _ in index.search("  EURO  ")] == ["EuroPython", "KubeCon + CloudNativeCon Europe"]
+    # Topics fill in when names do not
+    assert [(c.name, s) for c, s in index.search("javascrpt")] == [("JSConf", 5 / 7)]
+    assert index.search("zzzz") == [] and index.search("") == []
+
+
+def test_cross_source_duplicates_merge_on_both_backends(isolated_data_dir, monkeypatch):
+    def row(name, start, end, country, url, topics):
+        return {"name": name, "start_date": start, "end_date": end, "city": "", "country": country, "url": url, "topics": topics}
+
+    for backend in ("json", "sqlite"):
+        monkeypatch.setenv("CONFRADAR_BACKEND", backend)
+        storage.save_user_conferences(
+            [
+                # Same event URL, overlapping dates: half the words are enough
+                row("Foo Data Summit", "2031-03-02", "2031-03-04", "Germany", "https://foo.example/", ["data"]),
+                row("Foo Summit Berlin", "2031-03-03", "2031-03-03", "Germany", "https://www.foo.example", ["ai"]),
+                row("Foo Summit Berlin", "2031-04-03", "2031-04-03", "Germany", "https://foo.example/", ["ai"]),
+            ]
+        )
+        storage.save_remote_manifest([{"id": "tech"}])
+        storage.save_remote_shard(
+            "tech",
+            [
+                # The bundled "KubeCon + CloudNativeCon Europe", as another source lists it
+                row("KubeCon Europe 2025", "2025-05-20", "2025-05-21", "U.K.", "https://events.linuxfoundation.org/kubecon-cloudnativecon-europe", ["Kubernetes", "cloud"]),
+                row("KubeCon Europe 2025", "2025-05-20", "2025-05-22", "Germany", "", ["cloud"]),
+            ],
+        )
+
+        kubecon = [c for c in core.load_conferences() if c.name.startswith("KubeCon") and c.start_date.startswith("2025-05")]
+        assert [(c.name, c.country) for c in kubecon] == [("KubeCon + CloudNativeCon Europe", "UK"), ("KubeCon Europe 2025", "Germany")]
+        assert kubecon[0].topics == ["kubernetes", "cloud native", "devops", "cloud"]
+
+        report = {kept.name: sorted(c.name for c in absorbed) for kept, absorbed in core.merge_report()}
+        assert report == {"KubeCon + CloudNativeCon Europe": ["KubeCon Europe 2025"], "Foo Data Summit": ["Foo Summit Berlin"]}
+
+        # SQL pushdown agrees, including on topics only the absorbed record had
+        catalog = core.open_catalog()
+        index = core.load_index()
+        for q in ({}, {"topic": "cloud"}, {"topic": "ai"}, {"country": "germany"}):
+            assert core.filter_conferences(catalog, **q) == index.query(**q), q
+        assert [c.name for c in core.filter_conferences(catalog, topic="ai", after="2031-01-01")] == ["Foo Data Summit", "Foo Summit Berlin"]
+
+
+def test_dedupe_merges_near_equal_names_only():
+    def conf(name, start, end, url=""):
+        return core.Conference(name, start, end, "London", "UK", url, [])
+
+    pairs = {
+        # Same event: names equal up to filler words and the event's own year
+        ("Open Source Summit Europe 2031", "Open Source Summit Europe"): True,
+        ("PyData London Conference", "PyData London 2031"): True,
+        ("PyCon 2031", "PyCon"): True,
+        ("Data Engineering Summit Europe", "Data Engineering Summit Europe London"): True,
+        # Near misses: one name is a subset of the other, but not near-equal
+        ("AI Summit 2031", "Cloud AI Summit"): False,
+        ("Rust Nation 2030", "Rust Nation"): False,  # 2030 is not the event's year
+        ("AI Summit", "Summit"): False,
+        ("Web Summit", "Web Summit Rio Lisbon Edition"): False,
+        ("Open Source Summit", "Open Source Summit Europe"): False,
+    }
+    for (first, second), same in pairs.items():
+        confs = [conf(first, "2031-03-02", "2031-03-03", "https://a.example/"), conf(second, "2031-03-03", "2031-03-04", "https://b.example/")]
+        unique, merges = core.dedupe_conferences(confs)
+        assert len(unique) == (1 if same else 2), (first, second)
+        assert len(merges) == (1 if same else 0), (first, second)
+
+    # Only the same event URL lowers the bar; an aggregator host alone does not
+    pairs = {
+        ("Python Meetup Berlin", "https://www.meetup.com/python-berlin/", "Rust Meetup Berlin", "https://www.meetup.com/rust-berlin/"): False,
+        ("AWS Summit Berlin", "https://www.eventbrite.com/e/aws-summit-1", "Azure Summit Berlin", "https://eventbrite.com/e/azure-summit-2"): False,
+        ("Foo Data Summit", "https://foo.example/", "Foo Summit Berlin", "http://www.foo.example#dates"): True,
+    }
+    for (first, first_url, second, second_url), same in pairs.items():
+        confs = [conf(first, "2031-03-02", "2031-03-03", first_url), conf(second, "2031-03-03", "2031-03-04", second_url)]
+        unique, _ = core.dedupe_conferences(confs)
+        assert len(unique) == (1 if same else 2), (first, second)
+
+
+def test_conference_table_interns_columns_and_round_trips():
+    confs = [
+        core.Conference("PyCon DE", "2026-04-14", "2026-04-16", "Darmstadt", "Germany", "https://a", ["python", "data"]),
+        core.Conference("EuroRust", "2026-10-09", "2026-10-10", "Darmstadt", "Germany", "https://b", ["rust"]),
+        core.Conference("Online Meetup", "2026-05-01", "2026-05-01", "", "Online", "", []),
+    ]
+    table = core.ConferenceTable(confs)
+    assert len(table) == 3 and table == confs
+    # Shared strings are stored once
+    assert table._cities.values == ["Darmstadt", ""]
+    assert list(table._topic_offsets) == [0, 2, 3, 3]
+    row = table[0]
+    assert row is table[0] and row == confs[0] and row.topics == ["python", "data"]
+    assert isinstance(row, core.Conference) and confs[0] == row
+    assert row.start_dt() == confs[0].start_dt() and row.to_dict() == confs[0].to_dict()
+    assert table[-1].topics == [] and table[1:] == confs[1:]
+
+    restored = core.ConferenceTable.from_state(marshal.loads(marshal.dumps(table.to_state())))
+    assert restored == table
+    index = core.ConferenceIndex(restored)
+    assert [c.name for c in index.query(topic="rust", country="germany")] == ["EuroRust"]
+    assert index.query(topic="data")[0] is index.conferences[0]
+
+
+def test_near_queries_use_the_geo_index_on_both_backends(isolated_data_dir, monkeypatch):
+    assert geo.geocode("Cambridge") == geo.geocode("Cambridge", "UK") != geo.geocode("Cambridge", "USA")
+    assert geo.geocode("Zürich") == geo.geocode("zurich") and geo.geocode("Portland, OR") == geo.geocode("Portland", "USA")
+    assert geo.geocode("Atlantis") is None and geo.geocode("Berlin", "France") is None
+    assert 870 < geo.distance_km(geo.resolve("Berlin"), geo.resolve("Paris, France")) < 890
+
+    def row(name, city, country, **extra):
+        return {"name": name, "start_date": "2031-05-01", "end_date": "2031-05-02", "city": city, "country": country, "url": "", "topics": [], **extra}
+
+    rows = [
+        row("Berlin Summit", "Berlin", "Germany"),
+        row("Potsdam Days", "Potsdam", "Germany"),
+        row("Hamburg Conf", "Hamburg", "Germany"),
+        row("Paris Forum", "Paris", "France"),
+        row("Paris Texas", "Paris", "USA"),  # not in the city table: never near anything
+        row("Ship Summit", "At sea", "", lat=52.6, lon=13.0),
+        row("Online Meetup", "", "Online"),
+    ]
+    queries = [
+        {"near": "Berlin"},
+        {"near": "Berlin", "radius_km": 300},
+        {"near": "52.52,13.40", "radius_km": 5},
+        {"near": "Paris, France", "radius_km": 1000, "country": "germany"},
+        {"near": "Tokyo", "radius_km": 20000},
+        {"near": "Berlin", "radius_km": 0},
+    ]
+    for backend in ("json", "sqlite"):
+        monkeypatch.setenv("CONFRADAR_BACKEND", backend)
+        storage.save_user_conferences(rows)
+        confs = [c for c in core.load_conferences() if c.start_date == "2031-05-01"]
+        index = core.ConferenceIndex(confs)
+        restored = core.ConferenceIndex(index.conferences, state=index.to_state())
+        catalog = core.open_catalog()
+        for q in queries:
+            expected = core.filter_conferences(confs, **q)
+            assert index.query(**q) == restored.query(**q) == expected, q
+            assert [c for c in core.filter_conferences(catalog, **q) if c.start_date == "2031-05-01"] == expected, q
+        assert [c.name for c in index.query(near="Berlin")] == ["Berlin Summit", "Potsdam Days", "Ship Summit"]
+        assert "Paris Texas" not in {c.name for c in index.query(near="Tokyo", radius_km=20000)}
+        assert len(index.query(near="Tokyo", radius_km=20000)) == 5
+        with pytest.raises(ValueError, match="unknown place"):
+            index.query(near="Atlantis")
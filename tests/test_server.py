@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from confradar import core, server
+from confradar.cli import app
+
+
+@pytest.fixture
+def daemon():
+    """A CatalogServer on a free port, running on its own event loop thread."""
+    loop = asyncio.new_event_loop()
+    srv = server.CatalogServer(port=0, poll_s=0.05)
+    loop.run_until_complete(srv.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield srv, f"http://127.0.0.1:{srv.port}"
+    asyncio.run_coroutine_threadsafe(srv.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_server_queries_match_local_filters(daemon):
+    _, url = daemon
+    index = core.load_index()
+    for q in [{}, {"topic": "python"}, {"country": "usa", "after": "2025-06-01"}, {"before": "2025-09-30"}, {"near": "Seattle", "radius_km": 250}]:
+        assert server.query_server(url, **q) == core.filter_conferences(index, **q), q
+    assert server.query_server(url, limit=2, offset=1) == index.conferences[1:3]
+    assert server.show_server(url, "pycn") == [c for c, _ in index.search("pycn", limit=10)]
+    with pytest.raises(server.ServerError, match="Invalid isoformat"):
+        server.query_server(url, after="not-a-date")
+    with pytest.raises(server.ServerError, match="unknown place"):
+        server.query_server(url, near="Atlantis")
+
+
+def test_server_reloads_changed_catalog_and_serves_cli(daemon):
+    srv, url = daemon
+    runner = CliRunner()
+    common = ["--city", "X", "--country", "Y", "--url", "https://example.com"]
+    assert runner.invoke(app, ["add", "DaemonConf", "--start-date", "2031-03-01", "--end-date", "2031-03-02", *common]).exit_code == 0
+    deadline = time.time() + 5
+    while not any(c.name == "DaemonConf" for c in srv.index.conferences) and time.time() < deadline:
+        time.sleep(0.02)
+
+    result = runner.invoke(app, ["list", "--server", url, "--after", "2031-01-01", "-f", "jsonl"])
+    assert result.exit_code == 0 and "DaemonConf" in result.stdout
+    result = runner.invoke(app, ["show", "daemon"], env={"CONFRADAR_SERVER": url})
+    assert result.exit_code == 0 and "DaemonConf" in result.stdout
+
+    assert runner.invoke(app, ["list", "--server", "127.0.0.1:1"]).exit_code == 2
+
+
+def test_server_answers_during_slow_queries_and_reports_failures(daemon, monkeypatch):
+    _, url = daemon
+    started, release = threading.Event(), threading.Event()
+
+    def slow_or_broken(index, **filters):
+        if filters.get("topic") == "slow":
+            started.set()
+            release.wait(5)
+            return []
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server, "filter_conferences", slow_or_broken)
+    slow = threading.Thread(target=server.query_server, args=(url,), kwargs={"topic": "slow"})
+    slow.start()
+    assert started.wait(5)
+    try:
+        # Another connection is served while the slow query holds a worker thread
+        assert server._get(url, "/health", {})["rows"] > 0
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join()
+    with pytest.raises(server.ServerError, match="RuntimeError: boom"):
+        server.query_server(url, topic="python")
+    assert server._get(url, "/health", {})["rows"] > 0
@@ -1,4 +1,13 @@
-from confradar.sources import _normalize_rows
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from confradar import sources, storage, timing
+from confradar.geo import geocode
+from confradar.sources import _normalize_rows, iter_json_array
 
 
 def test_normalize_rows_maps_keys_and_topics():
@@ -26,5 +35,254 @@ def test_normalize_rows_maps_keys_and_topics():
     assert out[1]["name"] == "Alt"
     assert out[1]["url"] == "https://example.org"
     assert out[1]["topics"] == ["python", "web"]
+    # Coordinates come from the source when given, else from the bundled city table
+    assert "lat" not in out[0]
+    located = _normalize_rows([{**rows[0], "city": "Berlin", "country": "Germany"}, {**rows[0], "latitude": "1.5", "lng": 2}])
+    assert (located[0]["lat"], located[0]["lon"]) == geocode("Berlin", "Germany")
+    assert (located[1]["lat"], located[1]["lon"]) == (1.5, 2.0)
+
+
+def test_refresh_concurrent_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "get_data_dir", lambda: Path(tmp_path))
+    local = tmp_path / "python.json"
+    local.write_text(
+        json.dumps([{"name": "PyLocal", "url": "https://l.example", "startDate": "2025-03-01"}]),
+        encoding="utf-8",
+    )
+    storage.save_sources(
+        [
+            {"type": "json", "url": "https://a.example/devops.json"},
+            {"type": "file-json", "path": str(local)},
+            {"type": "json", "url": "https://b.example/missing.json"},
+            {"type": "json", "url": "https://a.example/javascript.json"},
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "missing" in request.url.path:
+            return httpx.Response(404)
+        name = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=[{"name": f"Conf {name}", "url": str(request.url), "startDate": "2025-01-01"}])
+
+    def run(concurrency):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        summary = asyncio.run(sources.refresh_sources_async(concurrency=concurrency, client=client))
+        return summary.count, storage.load_remote_conferences()
+
+    serial = run(1)
+    concurrent = run(8)
+    assert serial == concurrent
+    assert [r["name"] for r in serial[1]] == ["Conf devops.json", "PyLocal", "Conf javascript.json"]
+    assert serial[1][0]["topics"] == ["devops"]
+
+
+def test_refresh_does_not_let_a_busy_host_hold_global_slots(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "get_data_dir", lambda: Path(tmp_path))
+    urls = [f"https://a.example/{i}.json" for i in range(3)] + ["https://b.example/b.json"]
+    storage.save_sources([{"type": "json", "url": url} for url in urls])
+    started = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.host)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"name": f"Conf {request.url}", "url": str(request.url), "startDate": "2025-01-01"}])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    summary = asyncio.run(sources.refresh_sources_async(concurrency=2, per_host=1, client=client))
+    assert summary.count == 4
+    # b.example gets the second global slot instead of waiting behind a.example
+    assert started[:2] == ["a.example", "b.example"]
+
+def test_refresh_reuses_cache_on_304_and_unchanged_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "get_data_dir", lambda: Path(tmp_path))
+    local = tmp_path / "local.json"
+    local.write_text(json.dumps([{"name": "Local", "url": "https://l.example", "date": "2025-03-01"}]), encoding="utf-8")
+    storage.save_sources([{"type": "json", "url": "https://a.example/python.json"}, {"type": "file-json", "path": str(local)}])
+    body = json.dumps([{"name": "PyRemote", "url": "https://a.example", "startDate": "2025-01-01"}]).encode()
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
+    def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return asyncio.run(sources.refresh_sources_async(client=client))
+
+    first = run()
+    assert (first.hits, first.misses) == (0, 2)
+    monkeypatch.setattr(sources, "_iter_normalized", lambda rows: (_ for _ in ()).throw(AssertionError))
+    second = run()
+    assert (second.hits, second.misses) == (2, 0)
+    assert second.bytes_saved == len(body) + local.stat().st_size
+    assert seen_headers == [None, '"v1"']
+    assert [r["name"] for r in storage.load_remote_conferences()] == ["PyRemote", "Local"]
+
+
+def test_refresh_keeps_last_good_shard_and_rewrites_only_changed(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "get_data_dir", lambda: Path(tmp_path))
+    a = tmp_path / "a.json"
+    b = tmp_path / "b.json"
+    a.write_text(json.dumps([{"name": "A", "url": "https://a.example", "date": "2025-01-01"}]), encoding="utf-8")
+    b.write_text(json.dumps([{"name": "B", "url": "https://b.example", "date": "2025-02-01"}]), encoding="utf-8")
+    remote = {"type": "json", "url": "https://r.example/devops.json"}
+    storage.save_sources([remote, {"type": "file-json", "path": str(a)}, {"type": "file-json", "path": str(b)}])
+    status = {"code": 200}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if status["code"] != 200:
+            return httpx.Response(status["code"])
+        return httpx.Response(200, json=[{"name": "R", "url": "https://r.example", "date": "2025-03-01"}])
+
+    def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return asyncio.run(sources.refresh_sources_async(client=client))
+
+    assert run().count == 3
+    shard_a = storage.remote_shard_file(sources.source_id({"type": "file-json", "path": str(a)}))
+    mtime_a = shard_a.stat().st_mtime_ns
+
+    # Remote source now fails; b changes; a is untouched
+    status["code"] = 503
+    b.write_text(json.dumps([{"name": "B2", "url": "https://b.example", "date": "2025-02-01"}]), encoding="utf-8")
+    summary = run()
+    assert (summary.failed, summary.count) == (1, 3)
+    assert [r["name"] for r in storage.load_remote_conferences()] == ["R", "A", "B2"]
+    assert shard_a.stat().st_mtime_ns == mtime_a
+
+    # Dropping a source removes its shard
+    storage.save_sources([{"type": "file-json", "path": str(a)}])
+    run()
+    assert [r["name"] for r in storage.load_remote_conferences()] == ["A"]
+    assert sorted(p.suffix for p in (tmp_path / "remote").iterdir()) == [".json", ".rec"]  # manifest + shard for a
+
+
+def test_iter_json_array_streams_across_chunk_boundaries():
+    doc = [{"name": "Zürich ✓", "n": 12345, "tags": ["a", "b"]}, 7, "x,]", None, [1, [2]], {"nested": {"k": "v"}}]
+    data = ("\ufeff" + json.dumps(doc, ensure_ascii=False, indent=1)).encode("utf-8")
+    for size in (1, 2, 3, 7, len(data)):
+        chunks = (data[i : i + size] for i in range(0, len(data), size))
+        assert list(iter_json_array(chunks)) == doc
+
+    wrapped = json.dumps({"conferences": doc}).encode()
+    assert list(iter_json_array([wrapped[:5], wrapped[5:]])) == doc
+    assert list(iter_json_array([b" [ ] "])) == []
+
+    stream = iter_json_array([b'[{"a": 1}, {"b": '])
+    assert next(stream) == {"a": 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(stream)
+
+
+def test_refresh_failed_parse_keeps_previous_shard(tmp_path):
+    src = tmp_path / "big.json"
+    rows = [{"name": f"C{i}", "url": "https://c.example", "date": "2025-01-01"} for i in range(1000)]
+    src.write_text(json.dumps(rows), encoding="utf-8")
+    storage.save_sources([{"type": "file-json", "path": str(src)}])
+    assert asyncio.run(sources.refresh_sources_async()).count == 1000
+
+    src.write_text(json.dumps(rows)[:-500], encoding="utf-8")  # truncated upload
+    summary = asyncio.run(sources.refresh_sources_async())
+    assert (summary.failed, summary.count) == (1, 1000)
+    assert len(storage.load_remote_conferences()) == 1000
+
+
+def test_topic_rules_match_whole_words_and_accept_user_rules(isolated_data_dir):
+    rows = [
+        {"name": "Jamaica Tech Summit", "topics": []},
+        {"name": "HTML Days", "topics": ["web"]},
+        {"name": "AI & ML Forum", "topics": []},
+        {"name": "KubeCon + Node.js Day", "topics": ["cloud"]},
+        {"name": "RustConf", "topics": []},
+    ]
+    out = list(sources._augment_topics([dict(r) for r in rows], ["devops"]))
+    assert [r["topics"] for r in out] == [
+        ["devops"],
+        ["web"],
+        ["devops", "ai"],
+        ["cloud", "javascript", "kubernetes"],
+        ["devops"],
+    ]
+
+    (isolated_data_dir / "topic_rules.json").write_text(
+        json.dumps({"name": [{"keywords": ["rust*"], "topics": ["rust"]}], "source": [{"keywords": ["*ruby*"], "topics": ["ruby"]}]}),
+        encoding="utf-8",
+    )
+    rules = sources.load_topic_rules()
+    assert list(sources._augment_topics([{"name": "RustConf", "topics": []}], [], rules))[0]["topics"] == ["rust"]
+    assert sources._infer_topics_from_source({"type": "json", "url": "https://x.example/ruby.json"}, rules) == ["ruby"]
+    assert rules.key() != sources.TopicRules().key()
+
+
+def test_refresh_with_worker_processes_matches_serial(tmp_path, monkeypatch):
+    srcs = []
+    for k, topic in enumerate(["python", "javascript", "devops"]):
+        path = tmp_path / f"{topic}.json"
+        rows = [{"name": f"{topic} conf {i}", "url": "https://c.example", "date": "2025-01-01"} for i in range(200)]
+        path.write_text(json.dumps(rows), encoding="utf-8")
+        srcs.append({"type": "file-json", "path": str(path)})
+
+    def run(workers, data_dir):
+        data_dir.mkdir()
+        monkeypatch.setattr(storage, "get_data_dir", lambda: Path(data_dir))
+        storage.save_sources(srcs)
+        summary = asyncio.run(sources.refresh_sources_async(workers=workers))
+        return summary.count, storage.load_remote_conferences()
+
+    serial = run(1, tmp_path / "serial")
+    pooled = run(2, tmp_path / "pooled")
+    assert serial == pooled
+    assert serial[0] == 600
+
+
+def test_refresh_records_per_source_timings_when_profiling(tmp_path):
+    src = tmp_path / "python.json"
+    rows = [{"name": f"C{i}", "url": "https://c.example", "date": "2025-01-01"} for i in range(100)]
+    src.write_text(json.dumps(rows), encoding="utf-8")
+    storage.save_sources([{"type": "file-json", "path": str(src)}])
+    timing.enable()
+    try:
+        sources.refresh_sources()
+        spans = timing.spans()
+    finally:
+        timing.disable()
+    refresh, source = [s for s in spans if s["name"].startswith("sources.")][:2]
+    assert (refresh["name"], refresh["rows"], refresh["misses"]) == ("sources.refresh", 100, 1)
+    assert (source["name"], source["status"], source["rows"]) == ("sources.source", "updated", 100)
+    assert source["bytes"] == src.stat().st_size and source["depth"] == refresh["depth"] + 1
+    assert all(source[k] >= 0 for k in ("fetch_s", "parse_s", "normalize_s", "write_s"))
+
+
+def test_refresh_after_rules_change_keeps_last_good_shard_of_failing_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "get_data_dir", lambda: Path(tmp_path))
+    remote = {"type": "json", "url": "https://r.example/conf.json"}
+    storage.save_sources([remote])
+    status = {"code": 200, "requests": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status["requests"].append(dict(request.headers))
+        if status["code"] != 200:
+            return httpx.Response(status["code"])
+        return httpx.Response(200, json=[{"name": "RustConf", "url": "https://r.example", "date": "2025-03-01"}], headers={"ETag": '"v1"'})
+
+    def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return asyncio.run(sources.refresh_sources_async(client=client))
+
+    assert run().count == 1
+    (tmp_path / "topic_rules.json").write_text(json.dumps({"name": [{"keywords": ["rust*"], "topics": ["rust"]}]}), encoding="utf-8")
 
+    # New rules while the source is down: the old shard is still served
+    status["code"] = 503
+    summary = run()
+    assert (summary.failed, summary.count) == (1, 1)
+    assert [r["name"] for r in storage.load_remote_conferences()] == ["RustConf"]
+    assert storage.remote_shard_file(sources.source_id(remote)).exists()
 
+    # Once it is back, it is fetched without validators and re-tagged
+    status["code"] = 200
+    assert run().misses == 1
+    assert "if-none-match" not in status["requests"][-1]
+    assert storage.load_remote_conferences()[0]["topics"] == ["rust"]
@@ -0,0 +1,154 @@
+import random
+
+from typer.testing import CliRunner
+
+from confradar import core, storage
+from confradar.cli import app
+
+
+def _row(name, start, end, country="USA", topics=()):
+    return {
+        "name": name,
+        "start_date": start,
+        "end_date": end,
+        "city": "X",
+        "country": country,
+        "url": "https://example.com",
+        "topics": list(topics),
+    }
+
+
+def test_migrate_to_sqlite_and_back_keeps_data(isolated_data_dir):
+    runner = CliRunner()
+    common = ["--city", "X", "--country", "Y", "--url", "https://example.com"]
+    assert runner.invoke(app, ["add", "JsonConf", "--start-date", "2031-03-01", "--end-date", "2031-03-02", *common]).exit_code == 0
+    assert runner.invoke(app, ["star", "JsonConf"]).exit_code == 0
+    storage.save_sources([{"type": "file-json", "path": "/tmp/x.json"}])
+    storage.save_remote_manifest([{"id": "abc"}])
+    storage.save_remote_shard("abc", [_row("RemoteConf", "2031-04-01", "2031-04-02"), {"name": "Broken"}])
+
+    result = runner.invoke(app, ["migrate", "--to", "sqlite"])
+    assert result.exit_code == 0, result.stdout
+    assert storage.backend() == "sqlite"
+    assert (isolated_data_dir / "confradar.db").exists()
+    assert [r["name"] for r in storage.load_user_conferences()] == ["JsonConf"]
+    assert storage.load_remote_shard("abc")[1] == {"name": "Broken"}
+
+    assert runner.invoke(app, ["add", "SqlConf", "--start-date", "2031-05-01", "--end-date", "2031-05-02", *common]).exit_code == 0
+    assert runner.invoke(app, ["unstar", "JsonConf"]).exit_code == 0
+    listed = runner.invoke(app, ["list", "--after", "2031-01-01"]).stdout
+    assert "JsonConf" in listed and "RemoteConf" in listed and "SqlConf" in listed
+    assert [c.name for c in core.load_conferences() if c.start_date >= "2031"] == ["JsonConf", "RemoteConf", "SqlConf"]
+
+    assert runner.invoke(app, ["migrate", "--to", "json"]).exit_code == 0
+    assert storage.backend() == "json"
+    assert [r["name"] for r in storage.load_user_conferences()] == ["JsonConf", "SqlConf"]
+    assert storage.load_stars() == set()
+    assert storage.load_sources() == [{"type": "file-json", "path": "/tmp/x.json"}]
+    assert [r["name"] for r in storage.load_remote_conferences()] == ["RemoteConf", "Broken"]
+
+
+def test_sql_pushdown_matches_index(isolated_data_dir, monkeypatch):
+    monkeypatch.setenv("CONFRADAR_BACKEND", "sqlite")
+    rng = random.Random(5)
+    words = ["PyCon", "KubeCon", "JSConf", "DevOpsDays", "Data", "Ünïcode"]
+    topics = ["python", "javascript", "AI", "machine learning", "devops"]
+
+    day = lambda o: core.datetime.fromordinal(o).date().isoformat()  # noqa: E731
+
+    def rows(n):
+        out = []
+        for _ in range(n):
+            start = rng.randint(740000, 740100)
+            # Shared names and dates across origins exercise the dedupe order
+            name = f"{rng.choice(words)} {rng.randint(0, 20)}"
+            out.append(_row(name, day(start), day(start + rng.randint(0, 3)), rng.choice(["USA", "Germany", "India"]), rng.sample(topics, 2)))
+        out.append({**out[0], "start_date": "not a date"})
+        return out
+
+    storage.save_user_conferences(rows(100))
+    storage.save_remote_manifest([{"id": "b"}, {"id": "a"}])
+    storage.save_remote_shard("a", rows(200))
+    storage.save_remote_shard("b", rows(200))
+    storage.save_remote_shard("orphan", rows(50))
+
+    catalog = core.open_catalog()
+    index = core.load_index()
+    queries = [
+        {},
+        {"topic": "py"},
+        {"topic": "con"},
+        {"topic": "LEARN", "country": "an"},
+        {"topic": "ünï"},
+        {"country": "usa", "after": "2027-03-01"},
+        {"topic": "devops", "after": "2027-02-01", "before": "2027-03-15"},
+    ]
+    for q in queries:
+        assert core.filter_conferences(catalog, **q) == index.query(**q), q
+
+
+def test_journal_replays_over_snapshot_and_compacts(isolated_data_dir, monkeypatch):
+    storage.save_user_conferences([_row("Old", "2031-01-01", "2031-01-02")])
+    storage.save_stars({"Old"})
+    storage.add_user_conference(_row("New", "2031-02-01", "2031-02-02"))
+    storage.add_star("New")
+    assert storage.remove_star("Old")
+    assert not storage.remove_star("Missing")
+
+    # Appends leave the snapshots alone
+    assert [r["name"] for r in storage.load_json_list(isolated_data_dir / "user_conferences.json")] == ["Old"]
+    assert [r["name"] for r in storage.load_user_conferences()] == ["Old", "New"]
+    assert storage.load_stars() == {"New"}
+
+    # A torn final record from an interrupted append is skipped
+    with (isolated_data_dir / "stars.journal").open("a", encoding="utf-8") as f:
+        f.write('{"op": "star", "na')
+    assert storage.load_stars() == {"New"}
+
+    monkeypatch.setattr(storage, "COMPACT_THRESHOLD", 0)
+    storage.add_user_conference(_row("Third", "2031-03-01", "2031-03-02"))
+    storage.add_star("Third")
+    storage.wait_for_compaction()
+    assert not (isolated_data_dir / "user_conferences.journal").exists()
+    assert not (isolated_data_dir / "stars.journal").exists()
+    assert [r["name"] for r in storage.load_json_list(isolated_data_dir / "user_conferences.json")] == ["Old", "New", "Third"]
+    assert storage.load_stars() == {"New", "Third"}
+
+
+def test_catalog_snapshot_sees_journaled_conferences(isolated_data_dir):
+    assert not any(c.name == "Journaled" for c in core.load_conferences())
+    storage.add_user_conference(_row("Journaled", "2031-06-01", "2031-06-02"))
+    assert any(c.name == "Journaled" for c in core.load_conferences())
+
+
+def test_record_files_skip_blocks_and_read_legacy_shards(isolated_data_dir, monkeypatch):
+    monkeypatch.setattr(storage, "RECORD_BLOCK", 4)
+    rows = [_row(f"Conf Ü{i}", "2031-01-01", "2031-01-02", topics=["x"] * (i % 3)) for i in range(10)]
+    for codec in storage.COMPRESSIONS:
+        path = isolated_data_dir / f"{codec}.rec"
+        assert storage.write_records(path, rows, codec) == 10
+        assert storage.count_records(path) == 10
+        assert list(storage.iter_records(path)) == rows
+        assert list(storage.iter_records(path, start=3, stop=9)) == rows[3:9]
+        assert list(storage.iter_records(path, start=8)) == rows[8:]
+        assert list(storage.iter_records(path, start=4, stop=4)) == []
+
+    # Shards follow the configured codec
+    monkeypatch.setenv("CONFRADAR_CACHE_COMPRESSION", "lzma")
+    storage.save_remote_manifest([{"id": "new"}, {"id": "old"}])
+    storage.save_remote_shard("new", rows[:5])
+    assert storage.remote_shard_file("new").read_bytes()[6] == storage.COMPRESSIONS.index("lzma")
+
+    # A shard from before record files is still read, and replaced on save
+    legacy = isolated_data_dir / "remote" / "old.json"
+    storage.save_json_list(legacy, rows[5:])
+    assert storage.has_remote_shard("old")
+    assert storage.load_remote_conferences() == rows
+    storage.save_remote_shard("old", rows[5:7])
+    assert not legacy.exists()
+    assert storage.load_remote_conferences() == rows[:7]
+
+    # A truncated shard reads as empty, like an unreadable JSON file
+    shard = storage.remote_shard_file("new")
+    shard.write_bytes(shard.read_bytes()[:-3])
+    assert storage.load_remote_shard("new") == []
@@ -0,0 +1,133 @@
+import threading
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from confradar import core, sources, tui
+from confradar.tui import TuiState, parse_near, render
+
+
+def _conf(name, topics, country="Germany", start="2025-01-01"):
+    return core.Conference(name, start, start, "X", country, "https://example.com", topics)
+
+
+def test_apply_filters_is_memoized_and_narrows_from_previous_view():
+    confs = [_conf("PyCon DE", ["python"]), _conf("PyData", ["python", "data"], "USA"), _conf("JSConf", ["javascript"])]
+    state = TuiState(conferences=confs, starred=set())
+
+    state.topic_filter = "py"
+    first = state.apply_filters()
+    assert [c.name for c in first] == ["PyCon DE", "PyData"]
+    assert state.apply_filters() is first
+
+    # Narrowing filters must not go back to the full catalog
+    def no_full_query(**kwargs):
+        raise AssertionError("narrowed view should come from the previous result")
+
+    state.index.query = no_full_query
+    state.topic_filter = "pyd"
+    assert [c.name for c in state.apply_filters()] == ["PyData"]
+    state.country_filter = "us"
+    assert [c.name for c in state.apply_filters()] == ["PyData"]
+
+
+def test_apply_filters_recomputes_after_widening_or_new_catalog():
+    confs = [_conf("PyCon DE", ["python"]), _conf("JSConf", ["javascript"])]
+    state = TuiState(conferences=confs, starred=set())
+    state.topic_filter = "python"
+    assert len(state.apply_filters()) == 1
+    state.topic_filter = "on"  # widens: "python" no longer contains it
+    assert [c.name for c in state.apply_filters()] == ["PyCon DE", "JSConf"]
+
+    state.set_catalog(core.ConferenceIndex(confs + [_conf("Pythonista", [])]))
+    assert [c.name for c in state.apply_filters()] == ["PyCon DE", "JSConf", "Pythonista"]
+
+
+def test_render_formats_rows_once_and_only_the_viewport():
+    confs = [_conf(f"Conf {i:03d}", ["python"], start=f"2025-01-{i % 28 + 1:02d}") for i in range(200)]
+    state = TuiState(conferences=confs, starred={"Conf 001"})
+    console = Console(file=StringIO(), width=240, height=30)
+
+    console.print(render(state, console))
+    cached = dict(state._rows)
+    assert 0 < len(cached) <= 30
+    state.cursor = 1
+    console.print(render(state, console))
+    assert state._rows == cached  # no re-formatting while moving inside the viewport
+    out = console.file.getvalue()
+    assert "➤" in out and "★" in out
+
+    state.set_catalog(core.ConferenceIndex(confs))
+    render(state, console)
+    assert all(cells is not cached.get(key) for key, cells in state._rows.items())
+
+
+def test_background_refresh_swaps_catalog_and_keeps_cursor(monkeypatch):
+    old = [_conf("A", ["x"], start="2025-01-01"), _conf("B", ["x"], start="2025-01-02")]
+    new = [_conf("New", ["x"], start="2024-12-01"), *old]
+    state = TuiState(conferences=old, starred=set())
+    state.cursor = 1  # on "B"
+
+    def fake_refresh(on_progress=None):
+        on_progress(1, 1, {"type": "json", "url": "https://x.example/python.json"}, "updated")
+        return sources.RefreshSummary(count=3, misses=1)
+
+    monkeypatch.setattr(tui, "refresh_sources", fake_refresh)
+    monkeypatch.setattr(tui, "load_index", lambda: core.ConferenceIndex(new))
+    statuses = []
+    refresher = tui._BackgroundRefresh(state, threading.RLock(), lambda: statuses.append(state.status))
+    assert refresher.start()
+    refresher.thread.join(5)
+
+    assert "refreshing 1/1 · python.json updated" in statuses
+    assert state.status == "refreshed 3 conferences"
+    assert state.apply_filters()[state.cursor].name == "B"
+
+    monkeypatch.setattr(tui, "refresh_sources", lambda on_progress=None: 1 / 0)
+    refresher.start()
+    refresher.thread.join(5)
+    assert state.status.startswith("refresh failed")
+
+
+def test_search_ranks_within_filters_and_drops_stale_results():
+    confs = [_conf("PyCon DE", ["python"]), _conf("PyData", ["python"], "USA"), _conf("KubeCon EU", ["cloud"])]
+    state = TuiState(conferences=confs, starred=set())
+    state.set_search("kubcon")
+    assert [c.name for c in state.apply_filters()] == ["KubeCon EU"]
+    state.set_search("py")
+    state.country_filter = "usa"
+    assert [c.name for c in state.apply_filters()] == ["PyData"]
+
+    # The debounced updater applies the typed query, unless it changed meanwhile
+    lock, draws = threading.RLock(), []
+    update = tui._search_updater(state, lock, lambda: draws.append(state.search))
+    state.country_filter = None
+    state.search_input = "pycon"
+    update()
+    assert draws == ["pycon"] and [c.name for c in state.apply_filters()][0] == "PyCon DE"
+    state.search_input = None
+    update()
+    assert draws == ["pycon"]
+
+
+def test_near_filter_parses_radius_and_combines_with_other_filters():
+    assert parse_near("Berlin 250") == ("Berlin", 250.0)
+    assert parse_near("San Francisco") == ("San Francisco", 100.0)
+    assert parse_near("Portland, USA 80km") == ("Portland, USA", 80.0)
+    assert parse_near("  ") is None
+    with pytest.raises(ValueError):
+        parse_near("Atlantis 10")
+
+    confs = [
+        core.Conference("PyCon DE", "2025-01-01", "2025-01-01", "Berlin", "Germany", "", ["python"]),
+        core.Conference("JSConf", "2025-01-01", "2025-01-01", "Potsdam", "Germany", "", ["javascript"]),
+        core.Conference("PyData", "2025-01-01", "2025-01-01", "Munich", "Germany", "", ["python"]),
+    ]
+    state = TuiState(conferences=confs, starred=set())
+    state.near_filter = ("Berlin", 100.0)
+    assert [c.name for c in state.apply_filters()] == ["PyCon DE", "JSConf"]
+    state.topic_filter = "py"
+    assert [c.name for c in state.apply_filters()] == ["PyCon DE"]
+    state.near_filter = ("Berlin", 600.0)  # a new radius goes back to the index
+    assert [c.name for c in state.apply_filters()] == ["PyCon DE", "PyData"]